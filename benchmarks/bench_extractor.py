@@ -0,0 +1,117 @@
+"""
+Extraction throughput benchmark.
+
+Measures `extract_links_from_text` in MB/s on a large realistic
+AsciiDoc document and on pathological inputs for the URL pattern,
+and compares it with the previous multi-pass implementation.
+
+Usage:
+    python benchmarks/bench_extractor.py [--size-mb 8] [--repeat 3]
+"""
+import argparse
+import random
+import re
+import time
+
+from adoc_link_checker.config import URL_PATTERN, VIDEO_PATTERN
+from adoc_link_checker.core.extractor import extract_links_from_text
+from adoc_link_checker.utils.url import (
+    is_valid_url,
+    normalize_url,
+    youtube_id_to_url,
+)
+
+
+LEGACY_PATTERNS = [f"(link:)?{URL_PATTERN}", VIDEO_PATTERN]
+
+
+def legacy_extract(content: str) -> set[str]:
+    """
+    Previous implementation: one uncompiled finditer per pattern.
+    """
+    links = set()
+    for pattern in LEGACY_PATTERNS:
+        for match in re.finditer(pattern, content):
+            if pattern == VIDEO_PATTERN:
+                url = youtube_id_to_url(match.group(1))
+            else:
+                url = normalize_url(match.group(0).replace("link:", ""))
+            if is_valid_url(url):
+                links.add(url)
+    return links
+
+
+def realistic_document(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words = (
+        "the link checker validates every external reference in "
+        "asciidoc pages modules partials antora component version"
+    ).split()
+    hosts = [f"docs{i}.example.com" for i in range(50)]
+
+    parts = ["= Benchmark document\n\n"]
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.05:
+            part = (
+                f"link:https://{rng.choice(hosts)}/page/{rng.randint(0, 500)}"
+                f"[label] "
+            )
+        elif roll < 0.08:
+            part = f"https://{rng.choice(hosts)}/a/{rng.randint(0, 50)}. "
+        elif roll < 0.081:
+            part = "video::dQw4w9WgXcQ[]\n"
+        else:
+            part = rng.choice(words) + (" " if rng.random() < 0.9 else "\n")
+        parts.append(part)
+        length += len(part)
+
+    return "".join(parts)
+
+
+def pathological_documents(size: int) -> dict[str, str]:
+    """
+    Inputs making the `{1,256}` domain quantifier backtrack.
+    """
+    unit = "http://" + "a" * 300 + " "
+    dotted = "https://" + "a." * 150 + " "
+    return {
+        "long-host-no-tld": unit * (size // len(unit)),
+        "dotted-host-no-tld": dotted * (size // len(dotted)),
+        "scheme-only": "http:// " * (size // 8),
+    }
+
+
+def measure(func, content: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - start)
+    return len(content.encode("utf-8")) / best / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    size = int(args.size_mb * 1e6)
+    inputs = {"realistic": realistic_document(size)}
+    inputs.update(pathological_documents(size // 4))
+
+    print(f"{'input':<20} {'legacy MB/s':>12} {'current MB/s':>13} {'speedup':>8}")
+    for name, content in inputs.items():
+        assert legacy_extract(content) == extract_links_from_text(content)
+        legacy = measure(legacy_extract, content, args.repeat)
+        current = measure(extract_links_from_text, content, args.repeat)
+        print(
+            f"{name:<20} {legacy:>12.1f} {current:>13.1f} "
+            f"{current / legacy:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+End-to-end throughput benchmark of `run_check`, fully offline.
+
+Generates a synthetic .adoc corpus (see corpus.py) and checks it
+against a local stand-in HTTP server (see server.py) simulating
+latency, HEAD rejection, 429s, redirects, broken links and timeouts.
+The `*.bench.test` hosts are pinned to 127.0.0.1 in the DNS cache,
+so no request leaves the machine.
+
+Reports URLs/sec, wall time, peak RSS and server-side request counts.
+With --baseline, exits with status 1 when URLs/sec dropped by more
+than --tolerance, to gate regressions in CI.
+
+Usage:
+    python benchmarks/bench_run_check.py [--files 500] [--max-workers 50]
+    python benchmarks/bench_run_check.py --json result.json
+    python benchmarks/bench_run_check.py --baseline result.json --tolerance 0.2
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import resource
+import tempfile
+from unittest.mock import patch
+
+from corpus import BENCH_DOMAIN, DEFAULT_MIX, CorpusSpec, generate_corpus
+from server import StandInServer
+
+from adoc_link_checker.core.options import CheckOptions
+from adoc_link_checker.core.runner import run_check
+from adoc_link_checker.http.dns import DnsCache
+
+
+class BenchDnsCache(DnsCache):
+    """
+    DNS cache resolving the benchmark hosts to the loopback address.
+    """
+
+    def _lookup(self, host: str):
+        if host.endswith("." + BENCH_DOMAIN):
+            with self._lock:
+                self.lookups += 1
+                self._entries[host] = ["127.0.0.1"]
+            return ["127.0.0.1"]
+        return super()._lookup(host)
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """
+    Parse "ok=0.9,broken=0.1" into behaviour shares.
+    """
+    mix = {kind: 0.0 for kind in DEFAULT_MIX}
+    for item in value.split(","):
+        kind, _, share = item.partition("=")
+        if kind not in mix:
+            raise argparse.ArgumentTypeError(f"unknown behaviour: {kind}")
+        mix[kind] = float(share)
+    return mix
+
+
+def run(args: argparse.Namespace) -> dict:
+    server = StandInServer(
+        latency=args.latency_ms / 1000,
+        slow=args.slow_ms / 1000,
+        hang=args.timeout + 1,
+    ).start()
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="adocx-bench-") as tmp:
+            corpus = generate_corpus(
+                os.path.join(tmp, "docs"),
+                CorpusSpec(
+                    files=args.files,
+                    links_per_file=args.links_per_file,
+                    duplicate_ratio=args.duplicate_ratio,
+                    hosts=args.hosts,
+                    host_skew=args.host_skew,
+                    nohead_hosts=args.nohead_hosts,
+                    mix=args.mix,
+                    port=server.port,
+                    seed=args.seed,
+                ),
+            )
+
+            start = time.perf_counter()
+            with patch("adoc_link_checker.core.runner.DnsCache", BenchDnsCache):
+                run_check(
+                    root_path=corpus.root,
+                    max_workers=args.max_workers,
+                    delay=0,
+                    timeout=args.timeout,
+                    output_file=os.path.join(tmp, "report.json"),
+                    blacklist=[],
+                    exclude_from=None,
+                    check=CheckOptions(
+                        max_host_connections=args.max_host_connections,
+                        adaptive=args.adaptive,
+                    ),
+                )
+            wall = time.perf_counter() - start
+    finally:
+        server.stop()
+
+    return {
+        "files": len(corpus.files),
+        "links": corpus.links,
+        "urls": len(corpus.urls),
+        "wall_time": round(wall, 3),
+        "urls_per_sec": round(len(corpus.urls) / wall, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "server": server.stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--links-per-file", type=int, default=20)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.5)
+    parser.add_argument("--hosts", type=int, default=20)
+    parser.add_argument("--host-skew", type=float, default=1.0)
+    parser.add_argument("--nohead-hosts", type=float, default=0.1)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=dict(DEFAULT_MIX),
+        help="Share of each server behaviour, e.g. ok=0.9,broken=0.05,timeout=0.05",
+    )
+    parser.add_argument("--latency-ms", type=float, default=5)
+    parser.add_argument("--slow-ms", type=float, default=500)
+    parser.add_argument("--timeout", type=int, default=2)
+    parser.add_argument("--max-workers", type=int, default=20)
+    parser.add_argument("--max-host-connections", type=int, default=4)
+    parser.add_argument("--adaptive", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write the result to this JSON file")
+    parser.add_argument("--baseline", help="JSON result to compare URLs/sec with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    result = run(args)
+    logging.disable(logging.NOTSET)
+
+    server = result["server"]
+    print(
+        f"{result['files']} file(s), {result['links']} link(s), "
+        f"{result['urls']} unique URL(s)"
+    )
+    print(f"{'wall time':<12} {result['wall_time']:>10.2f} s")
+    print(f"{'throughput':<12} {result['urls_per_sec']:>10.1f} URLs/s")
+    print(f"{'peak RSS':<12} {result['peak_rss_mb']:>10.1f} MB")
+    print(
+        f"{'requests':<12} {server['requests']:>10} "
+        f"over {server['connections']} connection(s) {server['methods']}"
+    )
+    print(f"{'statuses':<12} {server['statuses']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["urls_per_sec"]
+        floor = baseline * (1 - args.tolerance)
+        if result["urls_per_sec"] < floor:
+            print(
+                f"❌ Regression: {result['urls_per_sec']:.1f} URLs/s "
+                f"< {floor:.1f} (baseline {baseline:.1f} - {args.tolerance:.0%})"
+            )
+            sys.exit(1)
+        print(f"✅ Within {args.tolerance:.0%} of baseline ({baseline:.1f} URLs/s)")
+
+
+if __name__ == "__main__":
+    main()
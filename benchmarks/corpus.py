@@ -0,0 +1,132 @@
+"""
+Synthetic AsciiDoc corpus generator for the benchmarks.
+
+Writes a tree of .adoc files citing URLs on `hostN.bench.test` hosts,
+served by the stand-in server (see server.py). Usage as a script:
+
+    python benchmarks/corpus.py OUTPUT_DIR [--files 500] [--links-per-file 20]
+"""
+import os
+import random
+import argparse
+from dataclasses import dataclass, field
+
+# URL behaviours of the stand-in server and their default share
+DEFAULT_MIX = {
+    "ok": 0.90,
+    "redirect": 0.04,
+    "broken": 0.03,
+    "throttle": 0.02,
+    "slow": 0.01,
+    "timeout": 0.0,
+}
+
+BENCH_DOMAIN = "bench.test"
+
+
+@dataclass
+class CorpusSpec:
+    """
+    Shape of a synthetic corpus.
+
+    - duplicate_ratio: share of links citing an already cited URL
+    - host_skew: 0 spreads URLs evenly over hosts, higher values
+      concentrate them on the first hosts (Zipf exponent)
+    - nohead_hosts: share of hosts rejecting HEAD requests
+    - mix: share of each server behaviour among unique URLs
+    """
+
+    files: int = 500
+    links_per_file: int = 20
+    duplicate_ratio: float = 0.5
+    hosts: int = 20
+    host_skew: float = 1.0
+    nohead_hosts: float = 0.1
+    mix: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    port: int = 8000
+    seed: int = 0
+
+
+@dataclass
+class Corpus:
+    root: str
+    files: list[str]
+    urls: set[str]
+    links: int
+
+
+def bench_host(index: int, nohead: bool = False) -> str:
+    return f"{'nohead' if nohead else 'host'}{index}.{BENCH_DOMAIN}"
+
+
+def generate_corpus(root: str, spec: CorpusSpec) -> Corpus:
+    """
+    Write a synthetic corpus under `root` and describe it.
+    """
+    rng = random.Random(spec.seed)
+    nohead = round(spec.hosts * spec.nohead_hosts)
+    hosts = [bench_host(i, nohead=i < nohead) for i in range(spec.hosts)]
+    host_weights = [1 / (i + 1) ** spec.host_skew for i in range(spec.hosts)]
+    kinds = list(spec.mix)
+    kind_weights = [spec.mix[kind] for kind in kinds]
+
+    cited: list[str] = []
+    files: list[str] = []
+    links = 0
+
+    def new_url() -> str:
+        host = rng.choices(hosts, host_weights)[0]
+        kind = rng.choices(kinds, kind_weights)[0]
+        return f"http://{host}:{spec.port}/{kind}/page-{len(cited)}"
+
+    for i in range(spec.files):
+        directory = os.path.join(root, f"module-{i % 10}", "pages")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"page-{i}.adoc")
+
+        lines = [f"= Page {i}", ""]
+        for j in range(spec.links_per_file):
+            if cited and rng.random() < spec.duplicate_ratio:
+                url = rng.choice(cited)
+            else:
+                url = new_url()
+                cited.append(url)
+            lines.append(f"Paragraph {j} of the page, see link:{url}[reference {j}].")
+            lines.append("")
+            links += 1
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+        files.append(path)
+
+    return Corpus(root=root, files=files, urls=set(cited), links=links)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("output")
+    parser.add_argument("--files", type=int, default=CorpusSpec.files)
+    parser.add_argument("--links-per-file", type=int, default=CorpusSpec.links_per_file)
+    parser.add_argument("--duplicate-ratio", type=float, default=CorpusSpec.duplicate_ratio)
+    parser.add_argument("--hosts", type=int, default=CorpusSpec.hosts)
+    parser.add_argument("--port", type=int, default=CorpusSpec.port)
+    args = parser.parse_args()
+
+    corpus = generate_corpus(
+        args.output,
+        CorpusSpec(
+            files=args.files,
+            links_per_file=args.links_per_file,
+            duplicate_ratio=args.duplicate_ratio,
+            hosts=args.hosts,
+            port=args.port,
+        ),
+    )
+    print(
+        f"{len(corpus.files)} file(s), {corpus.links} link(s), "
+        f"{len(corpus.urls)} unique URL(s) in {corpus.root}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Local stand-in HTTP server for the benchmarks.
+
+The first path segment selects the behaviour of a URL:
+
+- /ok/...        200
+- /throttle/...  429 with Retry-After on the first request, then 200
+- /redirect/...  301 to the same path under /ok/
+- /broken/...    404
+- /slow/...      200 after `slow` seconds
+- /timeout/...   no answer before `hang` seconds
+
+Hosts named `nohead*` answer 405 to every HEAD request, like servers
+rejecting HEAD. Every request also waits `latency` seconds. Requests,
+connections and responses are counted for the report.
+"""
+import sys
+import time
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Benchmarks open many keep-alive connections at once
+    request_queue_size = 256
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        slow: float = 0.5,
+        hang: float = 5.0,
+        retry_after: int = 0,
+    ):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.latency = latency
+        self.slow = slow
+        self.hang = hang
+        self.retry_after = retry_after
+
+        self.responses: Counter = Counter()
+        self.connections = 0
+        self._throttled: set[str] = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def stats(self) -> dict:
+        """
+        Return request counters: total, by method, by status, connections.
+        """
+        with self._lock:
+            by_method = Counter()
+            by_status = Counter()
+            for (method, status), count in self.responses.items():
+                by_method[method] += count
+                by_status[str(status)] += count
+
+            return {
+                "requests": sum(self.responses.values()),
+                "connections": self.connections,
+                "methods": dict(by_method),
+                "statuses": dict(sorted(by_status.items())),
+            }
+
+    def first_request(self, path: str) -> bool:
+        with self._lock:
+            if path in self._throttled:
+                return False
+            self._throttled.add(path)
+            return True
+
+    def count(self, method: str, status: int) -> None:
+        with self._lock:
+            self.responses[method, status] += 1
+
+    def count_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def handle_error(self, request, client_address):
+        # Clients give up on /timeout/ URLs: not worth a traceback
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StandInServer
+
+    def setup(self):
+        super().setup()
+        self.server.count_connection()
+
+    def do_HEAD(self):
+        self._respond("HEAD")
+
+    def do_GET(self):
+        self._respond("GET")
+
+    def _respond(self, method: str) -> None:
+        server = self.server
+        kind = self.path.strip("/").split("/", 1)[0]
+        headers = {}
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        host = self.headers.get("Host", "")
+        if host.startswith("nohead") and method == "HEAD":
+            status = 405
+        elif kind == "throttle" and server.first_request(self.path):
+            status = 429
+            headers["Retry-After"] = str(server.retry_after)
+        elif kind == "redirect":
+            status = 301
+            headers["Location"] = "/ok/" + self.path.split("/", 2)[-1]
+        elif kind == "broken":
+            status = 404
+        elif kind == "slow":
+            time.sleep(server.slow)
+            status = 200
+        elif kind == "timeout":
+            time.sleep(server.hang)
+            status = 200
+        else:
+            status = 200
+
+        server.count(method, status)
+
+        body = b"" if method == "HEAD" else b"x"
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
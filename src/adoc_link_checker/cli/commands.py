@@ -1,9 +1,38 @@
 import logging
 import os
 
+import click
+
 from adoc_link_checker.cli.config import build_check_config
 from adoc_link_checker.cli.logging import configure_logging
+from adoc_link_checker.config import (
+    MAX_HOST_CONNECTIONS,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    HOST_BATCH_SIZE,
+    CACHE_TTL_OK,
+    CACHE_TTL_BROKEN,
+    EXTRACT_WORKERS,
+    RETRY_CONFIG,
+    BREAKER_THRESHOLD,
+    DNS_WORKERS,
+    REPORT_FORMAT,
+)
+from adoc_link_checker.core.cache import ResultCache
+from adoc_link_checker.core.options import (
+    CheckOptions,
+    DiscoveryOptions,
+    ReportOptions,
+    RunOptions,
+)
+from adoc_link_checker.http.ratelimit import HostLimit
 from adoc_link_checker.core.runner import run_check
+from adoc_link_checker.reporting.json import write_report
+from adoc_link_checker.reporting.ndjson import (
+    merge_results,
+    to_json_report,
+    write_ndjson_report,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +49,55 @@ def check_links_command(
     fail_on_broken: bool,
     verbose: int,
     quiet: bool,
+    max_host_connections: int = MAX_HOST_CONNECTIONS,
+    host_limits: tuple[tuple[str, HostLimit], ...] = (),
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE,
+    host_batch_size: int = HOST_BATCH_SIZE,
+    adaptive: bool = False,
+    stats_json: str | None = None,
+    prometheus_textfile: str | None = None,
+    profile: str | None = None,
+    profile_memory: bool = False,
+    report_format: str = REPORT_FORMAT,
+    checkpoint: str | None = None,
+    resume: str | None = None,
+    max_duration: float | None = None,
+    unchecked_output: str | None = None,
+    cache_file: str | None = None,
+    cache_ttl_ok: float = CACHE_TTL_OK,
+    cache_ttl_broken: float = CACHE_TTL_BROKEN,
+    incremental: bool = False,
+    changed_since: str | None = None,
+    extract_workers: int = EXTRACT_WORKERS,
+    exclude_dirs: tuple[str, ...] = (),
+    no_ignore: bool = False,
+    antora: bool = False,
+    components: tuple[str, ...] = (),
+    retries: int = RETRY_CONFIG["total"],
+    breaker_threshold: int = BREAKER_THRESHOLD,
+    dns_workers: int = DNS_WORKERS,
 ) -> None:
     """
     Execute the check-links command.
     """
     configure_logging(verbose, quiet)
 
+    if incremental and not cache_file:
+        raise click.UsageError("--incremental requires --cache-file")
+
+    if components and not antora:
+        raise click.UsageError("--component requires --antora")
+
+    if profile_memory and not profile:
+        raise click.UsageError("--profile-memory requires --profile")
+
+    if checkpoint and resume and checkpoint != resume:
+        raise click.UsageError("--checkpoint and --resume use the same state file")
+
+    if unchecked_output and max_duration is None:
+        raise click.UsageError("--unchecked-output requires --max-duration")
+
     abs_path = os.path.abspath(path)
     logger.info(f"🔍 Checking links in {abs_path}")
 
@@ -34,15 +106,114 @@ def check_links_command(
         max_workers=max_workers,
         delay=delay,
         blacklist=blacklist,
+        max_host_connections=max_host_connections,
+        host_limits=host_limits,
     )
 
-    run_check(
-        root_path=abs_path,
-        max_workers=config.max_workers,
-        delay=config.delay,
-        timeout=config.timeout,
-        output_file=output,
-        blacklist=config.blacklist,
-        exclude_from=exclude_from,
-        fail_on_broken=fail_on_broken,
-    )
+    try:
+        run_check(
+            root_path=abs_path,
+            max_workers=config.max_workers,
+            delay=config.delay,
+            timeout=config.timeout,
+            output_file=output,
+            blacklist=config.blacklist,
+            exclude_from=exclude_from,
+            fail_on_broken=fail_on_broken,
+            check=CheckOptions(
+                max_host_connections=config.max_host_connections,
+                host_limits=config.host_limits,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                host_batch_size=host_batch_size,
+                adaptive=adaptive,
+                retries=retries,
+                breaker_threshold=breaker_threshold,
+                dns_workers=dns_workers,
+                cache_file=cache_file,
+                cache_ttl_ok=cache_ttl_ok,
+                cache_ttl_broken=cache_ttl_broken,
+            ),
+            discovery=DiscoveryOptions(
+                exclude_dirs=list(exclude_dirs),
+                use_ignore_files=not no_ignore,
+                antora=antora,
+                components=list(components),
+                changed_since=changed_since,
+                extract_workers=extract_workers,
+                incremental=incremental,
+            ),
+            report=ReportOptions(
+                report_format=report_format,
+                unchecked_output=unchecked_output,
+                stats_json=stats_json,
+                prometheus_textfile=prometheus_textfile,
+            ),
+            run=RunOptions(
+                checkpoint=resume or checkpoint,
+                resume=resume is not None,
+                max_duration=max_duration,
+                profile=profile,
+                profile_memory=profile_memory,
+            ),
+        )
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+
+def cache_stats_command(
+    *,
+    cache_file: str,
+    cache_ttl_ok: float,
+    cache_ttl_broken: float,
+) -> None:
+    """
+    Execute the cache stats command.
+    """
+    result_cache = ResultCache(cache_file, cache_ttl_ok, cache_ttl_broken)
+    try:
+        stats = result_cache.stats()
+    finally:
+        result_cache.close()
+
+    click.echo(f"Cache file: {os.path.abspath(cache_file)}")
+    for key in ("total", "ok", "broken", "expired"):
+        click.echo(f"{key}: {stats[key]}")
+
+
+def cache_prune_command(
+    *,
+    cache_file: str,
+    cache_ttl_ok: float,
+    cache_ttl_broken: float,
+) -> None:
+    """
+    Execute the cache prune command.
+    """
+    result_cache = ResultCache(cache_file, cache_ttl_ok, cache_ttl_broken)
+    try:
+        removed = result_cache.prune()
+    finally:
+        result_cache.close()
+
+    click.echo(f"Removed {removed} expired entr{'y' if removed == 1 else 'ies'}.")
+
+
+def report_merge_command(
+    *,
+    inputs: tuple[str, ...],
+    output: str,
+    report_format: str = "json",
+) -> None:
+    """
+    Execute the report merge command.
+    """
+    records = merge_results(inputs).values()
+
+    if report_format == "ndjson":
+        write_ndjson_report(output, records)
+    else:
+        write_report(output, to_json_report(records))
+
+    broken = sum(not record["ok"] for record in records)
+    click.echo(f"Merged {len(records)} URL(s), {broken} broken.")
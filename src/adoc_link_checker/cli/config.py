@@ -1,5 +1,6 @@
 from adoc_link_checker.cli.types import CheckConfig
-from adoc_link_checker.config import BLACKLIST
+from adoc_link_checker.config import BLACKLIST, MAX_HOST_CONNECTIONS
+from adoc_link_checker.http.ratelimit import HostLimit
 
 
 def build_check_config(
@@ -8,6 +9,8 @@ def build_check_config(
     max_workers: int,
     delay: float,
     blacklist: tuple[str, ...],
+    max_host_connections: int = MAX_HOST_CONNECTIONS,
+    host_limits: tuple[tuple[str, HostLimit], ...] = (),
 ) -> CheckConfig:
     """
     Build the effective configuration for link checking.
@@ -16,14 +19,31 @@ def build_check_config(
     - config BLACKLIST provides defaults
     - CLI blacklist has priority
     - duplicates removed, order preserved
+    - per-host limits override the global defaults, the last
+      occurrence of a domain wins
+    - a per-host limit without MAX_CONNECTIONS inherits the global one
     """
     effective_blacklist = list(
         dict.fromkeys(BLACKLIST + list(blacklist))
     )
 
+    effective_host_limits = {
+        domain: HostLimit(
+            rate=limit.rate,
+            max_connections=(
+                max_host_connections
+                if limit.max_connections < 0
+                else limit.max_connections
+            ),
+        )
+        for domain, limit in host_limits
+    }
+
     return CheckConfig(
         timeout=timeout,
         max_workers=max_workers,
         delay=delay,
         blacklist=effective_blacklist,
+        max_host_connections=max_host_connections,
+        host_limits=effective_host_limits,
     )
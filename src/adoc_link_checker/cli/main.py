@@ -1,8 +1,29 @@
 import click
 from importlib.metadata import version, PackageNotFoundError
 
-from adoc_link_checker.cli.commands import check_links_command
-from adoc_link_checker.config import TIMEOUT, MAX_WORKERS, DELAY
+from adoc_link_checker.cli.commands import (
+    check_links_command,
+    cache_prune_command,
+    cache_stats_command,
+    report_merge_command,
+)
+from adoc_link_checker.cli.types import HostLimitType
+from adoc_link_checker.config import (
+    TIMEOUT,
+    MAX_WORKERS,
+    DELAY,
+    MAX_HOST_CONNECTIONS,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    HOST_BATCH_SIZE,
+    EXTRACT_WORKERS,
+    CACHE_TTL_OK,
+    CACHE_TTL_BROKEN,
+    RETRY_CONFIG,
+    BREAKER_THRESHOLD,
+    DNS_WORKERS,
+    REPORT_FORMAT,
+)
 
 
 def get_version():
@@ -35,18 +56,224 @@ def cli():
     type=int,
     default=MAX_WORKERS,
     show_default=True,
+    help=(
+        "Worker threads checking the unique URLs, each taking a batch of "
+        "URLs of one host over a keep-alive connection."
+    ),
 )
 @click.option(
     "--delay",
     type=float,
     default=DELAY,
     show_default=True,
+    help="Minimum delay between two requests to the same host (seconds).",
+)
+@click.option(
+    "--max-host-connections",
+    type=click.IntRange(min=0),
+    default=MAX_HOST_CONNECTIONS,
+    show_default=True,
+    help="Maximum concurrent requests per host (0 = unlimited).",
+)
+@click.option(
+    "--host-limit",
+    "host_limits",
+    type=HostLimitType(),
+    multiple=True,
+    help=(
+        "Per-host override, e.g. github.com=1:2 for 1 request/s and "
+        "2 connections (can be specified multiple times)."
+    ),
+)
+@click.option(
+    "--adaptive",
+    is_flag=True,
+    help=(
+        "Adapt the concurrency of each host to its latency and errors "
+        "(429/503, timeouts), up to --max-host-connections."
+    ),
+)
+@click.option(
+    "--retries",
+    type=click.IntRange(min=0),
+    default=RETRY_CONFIG["total"],
+    show_default=True,
+    help="Retries of a failed check (5xx, 429, network errors), honouring Retry-After.",
+)
+@click.option(
+    "--breaker-threshold",
+    type=click.IntRange(min=0),
+    default=BREAKER_THRESHOLD,
+    show_default=True,
+    help=(
+        "Consecutive connection failures after which the remaining URLs "
+        "of a host fail fast (0 = disabled)."
+    ),
+)
+@click.option(
+    "--dns-workers",
+    type=click.IntRange(min=0),
+    default=DNS_WORKERS,
+    show_default=True,
+    help=(
+        "Concurrent DNS lookups resolving every host before checking "
+        "(0 = no pre-resolution nor DNS cache)."
+    ),
+)
+@click.option(
+    "--antora",
+    is_flag=True,
+    help=(
+        "Antora mode: PATH is a playbook or a directory with antora.yml "
+        "descriptors; only module pages, partials and examples are checked."
+    ),
+)
+@click.option(
+    "--component",
+    "components",
+    metavar="NAME[@VERSION]",
+    multiple=True,
+    help="Antora component to check (can be specified multiple times).",
+)
+@click.option(
+    "--exclude-dir",
+    "exclude_dirs",
+    type=str,
+    multiple=True,
+    help=(
+        "Directory glob to skip during discovery, e.g. build or "
+        "modules/*/archive (can be specified multiple times)."
+    ),
+)
+@click.option(
+    "--no-ignore",
+    is_flag=True,
+    help="Do not honour .gitignore files during discovery.",
+)
+@click.option(
+    "--extract-workers",
+    type=click.IntRange(min=0),
+    default=EXTRACT_WORKERS,
+    show_default=True,
+    help="Processes extracting links (0 = in the main process).",
+)
+@click.option(
+    "--pool-connections",
+    type=click.IntRange(min=1),
+    default=POOL_CONNECTIONS,
+    show_default=True,
+    help="Number of host connection pools kept per HTTP session.",
+)
+@click.option(
+    "--pool-maxsize",
+    type=click.IntRange(min=1),
+    default=POOL_MAXSIZE,
+    show_default=True,
+    help="Number of keep-alive connections kept per host.",
+)
+@click.option(
+    "--host-batch-size",
+    type=click.IntRange(min=1),
+    default=HOST_BATCH_SIZE,
+    show_default=True,
+    help="URLs of the same host checked in a row by a worker, reusing its connection.",
+)
+@click.option(
+    "--cache-file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="SQLite file persisting URL results between runs.",
+)
+@click.option(
+    "--cache-ttl-ok",
+    type=click.FloatRange(min=0),
+    default=CACHE_TTL_OK,
+    show_default=True,
+    help="Seconds an accessible URL result stays valid in the cache.",
+)
+@click.option(
+    "--cache-ttl-broken",
+    type=click.FloatRange(min=0),
+    default=CACHE_TTL_BROKEN,
+    show_default=True,
+    help="Seconds a broken URL result stays valid in the cache.",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Reuse the extraction of unchanged files (requires --cache-file).",
+)
+@click.option(
+    "--changed-since",
+    metavar="GIT_REF",
+    default=None,
+    help="Only check files changed since a git ref (e.g. origin/main).",
 )
 @click.option(
     "--output",
     type=click.Path(dir_okay=False, writable=True),
     required=True,
 )
+@click.option(
+    "--format",
+    "report_format",
+    type=click.Choice(["json", "ndjson"]),
+    default=REPORT_FORMAT,
+    show_default=True,
+    help=(
+        "Report format: JSON written at the end of the run, or NDJSON "
+        "streamed as URLs are checked."
+    ),
+)
+@click.option(
+    "--max-duration",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    metavar="SECONDS",
+    help=(
+        "Wall-clock budget of the run, discovery and extraction included: "
+        "URLs are checked by priority and no check starts after the budget "
+        "minus --timeout. Must be greater than --timeout."
+    ),
+)
+@click.option(
+    "--unchecked-output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the URLs left unchecked by --max-duration to this JSON file.",
+)
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Save processed files and checked URLs to this state file at regular intervals.",
+)
+@click.option(
+    "--resume",
+    type=click.Path(dir_okay=False, writable=True),
+    help=(
+        "Resume the interrupted run saved in this state file, skipping "
+        "the files and URLs already done (checkpoints keep going there)."
+    ),
+)
+@click.option(
+    "--stats-json",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write run metrics (phase timings, requests, latency, cache) to this JSON file.",
+)
+@click.option(
+    "--prometheus-textfile",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write run metrics in the Prometheus text format (node exporter textfile collector).",
+)
+@click.option(
+    "--profile",
+    type=click.Path(file_okay=False, writable=True),
+    help="Profile the extraction and checking stages into this directory.",
+)
+@click.option(
+    "--profile-memory",
+    is_flag=True,
+    help="With --profile, also take tracemalloc snapshots at stage boundaries.",
+)
 @click.option(
     "--blacklist",
     type=str,
@@ -79,5 +306,88 @@ def check_links(**kwargs):
     check_links_command(**kwargs)
 
 
+@cli.group("cache")
+def cache():
+    """
+    Manage the persistent URL result cache.
+    """
+    pass
+
+
+def cache_file_options(command):
+    """
+    Common arguments of the cache subcommands.
+    """
+    command = click.option(
+        "--cache-ttl-broken",
+        type=click.FloatRange(min=0),
+        default=CACHE_TTL_BROKEN,
+        show_default=True,
+    )(command)
+    command = click.option(
+        "--cache-ttl-ok",
+        type=click.FloatRange(min=0),
+        default=CACHE_TTL_OK,
+        show_default=True,
+    )(command)
+    return click.argument(
+        "cache_file",
+        type=click.Path(exists=True, dir_okay=False),
+    )(command)
+
+
+@cache.command("stats")
+@cache_file_options
+def cache_stats(**kwargs):
+    """
+    Show statistics about a cache file.
+    """
+    cache_stats_command(**kwargs)
+
+
+@cache.command("prune")
+@cache_file_options
+def cache_prune(**kwargs):
+    """
+    Remove expired entries from a cache file.
+    """
+    cache_prune_command(**kwargs)
+
+
+@cli.group("report")
+def report():
+    """
+    Work with link check reports.
+    """
+
+
+@report.command("merge")
+@click.argument(
+    "inputs",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    required=True,
+)
+@click.option(
+    "--format",
+    "report_format",
+    type=click.Choice(["json", "ndjson"]),
+    default="json",
+    show_default=True,
+)
+def report_merge(**kwargs):
+    """
+    Merge NDJSON reports into a JSON or NDJSON report.
+
+    The last result of a URL wins: pass the reports oldest first.
+    """
+    report_merge_command(**kwargs)
+
+
 if __name__ == "__main__":
     cli()
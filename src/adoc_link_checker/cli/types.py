@@ -1,5 +1,9 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import click
+
+from adoc_link_checker.http.ratelimit import HostLimit
 
 
 @dataclass(frozen=True)
@@ -8,3 +12,41 @@ class CheckConfig:
     max_workers: int
     delay: float
     blacklist: List[str]
+    max_host_connections: int = 0
+    host_limits: Dict[str, HostLimit] = field(default_factory=dict)
+
+
+class HostLimitType(click.ParamType):
+    """
+    Parse a per-host limit: DOMAIN=RATE[:MAX_CONNECTIONS].
+
+    RATE is expressed in requests per second (0 = unlimited).
+    """
+
+    name = "DOMAIN=RATE[:MAX_CONNECTIONS]"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, tuple):
+            return value
+
+        domain, sep, spec = value.partition("=")
+        rate, _, connections = spec.partition(":")
+
+        try:
+            if not domain or not sep:
+                raise ValueError
+            limit = HostLimit(
+                rate=float(rate),
+                max_connections=int(connections) if connections else -1,
+            )
+            if limit.rate < 0 or limit.max_connections < -1:
+                raise ValueError
+        except ValueError:
+            self.fail(
+                f"{value!r} is not a valid host limit "
+                f"(expected {self.name}).",
+                param,
+                ctx,
+            )
+
+        return domain.strip().lower(), limit
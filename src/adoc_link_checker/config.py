@@ -3,7 +3,22 @@ import logging
 # Configuration centrale du script
 TIMEOUT = 15                          # Timeout pour les requêtes HTTP (secondes)
 MAX_WORKERS = 5                       # Nombre maximal de threads pour le traitement parallèle
-DELAY = 0.5                           # Délai entre chaque requête (secondes)
+DELAY = 0.5                           # Délai minimal entre deux requêtes vers un même hôte (secondes)
+MAX_HOST_CONNECTIONS = 4              # Nombre maximal de requêtes simultanées par hôte
+POOL_CONNECTIONS = 20                 # Nombre d'hôtes gardés en pool par session HTTP
+POOL_MAXSIZE = 10                     # Nombre de connexions keep-alive gardées par hôte
+ADAPTIVE_INITIAL_CONNECTIONS = 2      # Requêtes simultanées par hôte au départ (option --adaptive)
+ADAPTIVE_MAX_CONNECTIONS = 16         # Plafond par hôte en mode adaptatif quand --max-host-connections vaut 0
+ADAPTIVE_LATENCY_TARGET = 2.0         # Latence au-delà de laquelle la concurrence d'un hôte n'augmente plus (secondes)
+ADAPTIVE_DECREASE = 0.5               # Facteur de réduction de la concurrence d'un hôte surchargé
+ADAPTIVE_OVERLOAD_STATUSES = [429, 503]  # Statuts signalant un hôte surchargé (avec les timeouts)
+HOST_BATCH_SIZE = 10                  # URLs d'un même hôte vérifiées à la suite par un worker (réutilisation keep-alive)
+REPORT_FORMAT = "json"                # Format du rapport ("json" en fin de run ou "ndjson" en flux)
+EXTRACT_WORKERS = 0                   # Processus d'extraction des liens (0 = processus principal)
+EXTRACT_CHUNK_SIZE = 32               # Nombre de fichiers envoyés par lot à un processus d'extraction
+EXTRACT_CHUNKS_PER_WORKER = 2         # Lots en cours par processus d'extraction (borne la mémoire)
+GET_READ_LIMIT = 64 * 1024             # Octets lus au plus par le GET de repli avant de libérer la connexion
+HEAD_UNSUPPORTED_STATUSES = [405, 501]  # Statuts HEAD indiquant un hôte qui refuse HEAD (si le GET réussit) ; un 403 ne vaut que pour l'URL
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -11,11 +26,34 @@ USER_AGENT = (
 )
 BLACKLIST = ["lien-brise.com", "autre-lien.com"]
 
+# Découverte des fichiers
+EXCLUDE_DIRS = [".git", "node_modules"]  # Répertoires jamais parcourus
+IGNORE_FILES = [".gitignore"]         # Fichiers d'exclusion respectés (syntaxe .gitignore)
+ANTORA_FAMILIES = ["pages", "partials", "examples"]  # Familles Antora parcourues (option --antora)
+
+# Cache persistant des résultats (option --cache-file)
+CACHE_TTL_OK = 24 * 3600              # Durée de validité d'un résultat OK (secondes)
+CACHE_TTL_BROKEN = 3600               # Durée de validité d'un résultat en erreur (secondes)
+
+# Reprise des runs interrompus (options --checkpoint / --resume)
+CHECKPOINT_INTERVAL = 10.0            # Délai entre deux sauvegardes de l'état du run (secondes)
+
+# Métriques du run (options --stats-json / --prometheus-textfile)
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]  # Bornes de l'histogramme des latences (secondes)
+
+# Rapport en flux NDJSON (option --format ndjson)
+NDJSON_FLUSH_EVERY = 100              # Enregistrements écrits avant de vider le tampon du rapport
+NDJSON_FLUSH_INTERVAL = 2.0           # Délai maximal avant de vider le tampon du rapport (secondes)
+
+# Profilage des étapes (option --profile)
+PROFILE_INTERVAL = 0.005              # Intervalle d'échantillonnage des piles de tous les threads (secondes)
+PROFILE_TOP = 20                      # Nombre de fonctions chaudes listées par étape dans le résumé
+
 # Patterns pour l'extraction des liens
-LINK_PATTERNS = [
-    r'(link:)?https?:\/\/(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-z]{2,6}\b(?:[-a-zA-Z0-9@:%_\+.~#?&\/\/=]*)',
-    r'video::([A-Za-z0-9_\-]{11})',
-]
+# URL nue ou cible d'une macro link: (le préfixe "link:" n'est pas capturé)
+URL_PATTERN = r'https?:\/\/(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-z]{2,6}\b(?:[-a-zA-Z0-9@:%_\+.~#?&\/\/=]*)'
+# Macro video:: (identifiant YouTube, seul groupe capturant)
+VIDEO_PATTERN = r'video::([A-Za-z0-9_\-]{11})'
 
 # Configuration du logging
 LOGGING_CONFIG = {
@@ -24,7 +62,11 @@ LOGGING_CONFIG = {
     "handlers": [logging.StreamHandler()],
 }
 
-# Configuration des retries pour les requêtes HTTP
+# Configuration des retries pour les requêtes HTTP (planifiés par le moteur, sans bloquer les workers)
+RETRY_MAX_DELAY = 60                  # Attente maximale avant un nouvel essai, Retry-After compris (secondes)
+DNS_WORKERS = 32                      # Résolutions DNS simultanées avant la vérification (0 = sans cache DNS)
+BREAKER_THRESHOLD = 5                 # Échecs de connexion consécutifs avant d'ouvrir le circuit d'un hôte (0 = désactivé)
+BREAKER_RESET_TIMEOUT = 60            # Délai avant une requête de sonde vers un hôte au circuit ouvert (secondes)
 RETRY_CONFIG = {
     "total": 3,
     "backoff_factor": 1,
@@ -0,0 +1,246 @@
+import os
+import glob
+import logging
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from adoc_link_checker.config import ANTORA_FAMILIES, EXCLUDE_DIRS
+from adoc_link_checker.core.discovery import iter_adoc_files
+from adoc_link_checker.utils.git import current_branch
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_DESCRIPTOR = "antora.yml"
+
+
+@dataclass(frozen=True)
+class AntoraComponent:
+    """
+    A component version declared by an antora.yml descriptor.
+
+    `version` is "" for unversioned components (`version: ~`).
+    """
+
+    name: str
+    version: str
+    root: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}@{self.version}" if self.version else self.name
+
+
+@dataclass(frozen=True)
+class AntoraFile:
+    """
+    A source file of a component, tagged with its Antora coordinates.
+    """
+
+    path: str
+    component: AntoraComponent
+    module: str
+    family: str
+
+
+def _load_yaml(path: str) -> dict:
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError(
+            "Antora mode requires PyYAML: "
+            "pip install 'adoc-link-checker[antora]'"
+        )
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError) as e:
+        raise ValueError(f"Unable to read {path}: {e}")
+
+    return data if isinstance(data, dict) else {}
+
+
+def load_component(descriptor: str) -> AntoraComponent:
+    """
+    Read a component descriptor (antora.yml).
+
+    `version: true` resolves to the current git branch, like Antora.
+    """
+    data = _load_yaml(descriptor)
+    root = os.path.dirname(os.path.abspath(descriptor))
+
+    name = data.get("name")
+    if not name:
+        raise ValueError(f"{descriptor}: missing component name")
+
+    version = data.get("version")
+    if version is True:
+        try:
+            version = current_branch(root)
+        except ValueError:
+            version = "HEAD"
+
+    return AntoraComponent(
+        name=str(name),
+        version="" if version is None else str(version),
+        root=root,
+    )
+
+
+def _playbook_roots(playbook: str) -> Iterator[str]:
+    data = _load_yaml(playbook)
+    base = os.path.dirname(os.path.abspath(playbook))
+
+    for source in (data.get("content") or {}).get("sources") or []:
+        url = str(source.get("url", ""))
+        if "://" in url or url.startswith("git@"):
+            logger.warning(f"⚠️ Skipping remote content source: {url}")
+            continue
+
+        start_paths = source.get("start_paths", source.get("start_path", ""))
+        if isinstance(start_paths, str):
+            start_paths = [p.strip() for p in start_paths.split(",")]
+
+        source_root = os.path.normpath(os.path.join(base, url))
+        for start_path in start_paths:
+            yield from sorted(
+                glob.glob(os.path.join(source_root, start_path or ""))
+            )
+
+
+def _descriptor_roots(path: str) -> Iterator[str]:
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDE_DIRS)
+        if COMPONENT_DESCRIPTOR in files:
+            dirs[:] = []
+            yield root
+
+
+def find_components(path: str) -> list[AntoraComponent]:
+    """
+    Find the component versions of an Antora project.
+
+    `path` can be:
+    - a playbook file: its local content sources are used
+    - a directory containing antora-playbook.yml
+    - a directory containing antora.yml descriptors
+    """
+    playbook = None
+    if os.path.isfile(path):
+        playbook = path
+    elif os.path.isfile(os.path.join(path, "antora-playbook.yml")):
+        playbook = os.path.join(path, "antora-playbook.yml")
+
+    roots = _playbook_roots(playbook) if playbook else _descriptor_roots(path)
+
+    components = []
+    for root in roots:
+        descriptor = os.path.join(root, COMPONENT_DESCRIPTOR)
+        if os.path.isfile(descriptor):
+            components.append(load_component(descriptor))
+        else:
+            logger.warning(f"⚠️ No {COMPONENT_DESCRIPTOR} in {root}")
+
+    return components
+
+
+def select_components(
+    components: list[AntoraComponent],
+    selectors: Iterable[str],
+) -> list[AntoraComponent]:
+    """
+    Keep the components matching NAME or NAME@VERSION selectors.
+
+    No selector keeps every component.
+    """
+    selectors = list(selectors)
+    if not selectors:
+        return components
+
+    return [
+        component
+        for component in components
+        if component.name in selectors or component.key in selectors
+    ]
+
+
+def iter_component_files(
+    components: Iterable[AntoraComponent],
+    exclude_dirs: Iterable[str] = (),
+    use_ignore_files: bool = True,
+) -> Iterator[AntoraFile]:
+    """
+    Yield the .adoc files of the ANTORA_FAMILIES of every module.
+
+    Anything outside `modules/<module>/<family>` (archived versions,
+    build output, ...) is never visited.
+    """
+    exclude_dirs = list(exclude_dirs)
+
+    for component in components:
+        modules_dir = os.path.join(component.root, "modules")
+        try:
+            modules = sorted(
+                entry.name
+                for entry in os.scandir(modules_dir)
+                if entry.is_dir()
+            )
+        except OSError:
+            logger.warning(f"⚠️ No modules directory in {component.root}")
+            continue
+
+        for module in modules:
+            for family in ANTORA_FAMILIES:
+                family_dir = os.path.join(modules_dir, module, family)
+                if not os.path.isdir(family_dir):
+                    continue
+
+                for file_path in iter_adoc_files(
+                    family_dir, exclude_dirs, use_ignore_files
+                ):
+                    yield AntoraFile(
+                        path=file_path,
+                        component=component,
+                        module=module,
+                        family=family,
+                    )
+
+
+def iter_antora_files(
+    path: str,
+    selectors: Iterable[str] = (),
+    exclude_dirs: Iterable[str] = (),
+    use_ignore_files: bool = True,
+) -> Iterator[AntoraFile]:
+    """
+    Discover the source files of an Antora project.
+    """
+    components = find_components(path)
+    selected = select_components(components, selectors)
+
+    if not selected:
+        raise ValueError(f"No Antora component found in {path}")
+
+    logger.info(
+        "🧩 Antora components: "
+        + ", ".join(component.key for component in selected)
+    )
+
+    yield from iter_component_files(selected, exclude_dirs, use_ignore_files)
+
+
+def summarize_by_component(
+    broken_links: dict[str, list],
+    file_components: dict[str, str],
+) -> dict[str, int]:
+    """
+    Count broken links per component version (NAME@VERSION), given the
+    component key of each file.
+    """
+    summary: dict[str, int] = {}
+    for file_path, links in broken_links.items():
+        key = file_components.get(file_path)
+        if key is None:
+            continue
+        summary[key] = summary.get(key, 0) + len(links)
+    return summary
@@ -0,0 +1,296 @@
+import time
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from adoc_link_checker.config import CACHE_TTL_OK, CACHE_TTL_BROKEN
+from adoc_link_checker.http.checker import CheckResult
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 4
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """
+    A URL check result stored in the persistent cache.
+    """
+
+    url: str
+    ok: bool
+    status: Optional[int]
+    checked_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    final_url: Optional[str] = None
+    ok_since: Optional[float] = None
+
+    @property
+    def result(self) -> CheckResult:
+        return CheckResult(
+            ok=self.ok,
+            status=self.status,
+            etag=self.etag,
+            last_modified=self.last_modified,
+            final_url=self.final_url,
+        )
+
+
+class ResultCache:
+    """
+    Persistent URL result cache backed by SQLite.
+
+    Results survive between runs and expire after `ttl_ok` seconds
+    for accessible URLs and `ttl_broken` seconds for broken ones.
+    Accessible URLs also keep the time since which they have been
+    accessible in a row (`ok_since`).
+    A single connection is shared by all worker threads behind a lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_ok: float = CACHE_TTL_OK,
+        ttl_broken: float = CACHE_TTL_BROKEN,
+    ):
+        self.path = path
+        self.ttl_ok = ttl_ok
+        self.ttl_broken = ttl_broken
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+
+        if version < 1:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    url TEXT PRIMARY KEY,
+                    ok INTEGER NOT NULL,
+                    status INTEGER,
+                    checked_at REAL NOT NULL
+                )
+                """
+            )
+
+        if version < 2:
+            for column in ("etag", "last_modified", "final_url"):
+                self._conn.execute(
+                    f"ALTER TABLE results ADD COLUMN {column} TEXT"
+                )
+
+        if version < 3:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS host_limits (
+                    host TEXT PRIMARY KEY,
+                    connections REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+
+        if version < 4:
+            self._conn.execute("ALTER TABLE results ADD COLUMN ok_since REAL")
+            self._conn.execute(
+                "UPDATE results SET ok_since = checked_at WHERE ok = 1"
+            )
+
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def is_fresh(self, entry: CacheEntry, now: Optional[float] = None) -> bool:
+        """
+        Return True if the entry has not expired yet.
+        """
+        now = time.time() if now is None else now
+        ttl = self.ttl_ok if entry.ok else self.ttl_broken
+        return now - entry.checked_at < ttl
+
+    def _fetch(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT url, ok, status, checked_at,
+                       etag, last_modified, final_url, ok_since
+                FROM results WHERE url = ?
+                """,
+                (url,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return CacheEntry(
+            url=row[0],
+            ok=bool(row[1]),
+            status=row[2],
+            checked_at=row[3],
+            etag=row[4],
+            last_modified=row[5],
+            final_url=row[6],
+            ok_since=row[7],
+        )
+
+    def get(self, url: str, now: Optional[float] = None) -> Optional[CacheEntry]:
+        """
+        Return the cached entry for URL if present and fresh, else None.
+        """
+        entry = self._fetch(url)
+        if entry is None or not self.is_fresh(entry, now):
+            return None
+        return entry
+
+    def last_result(self, url: str) -> Optional[CacheEntry]:
+        """
+        Return the cached entry for URL, fresh or expired, else None.
+        """
+        return self._fetch(url)
+
+    def get_revalidatable(
+        self,
+        url: str,
+        now: Optional[float] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        Return an expired accessible entry carrying validators, else None.
+        """
+        entry = self._fetch(url)
+        if (
+            entry is None
+            or not entry.ok
+            or not (entry.etag or entry.last_modified)
+            or self.is_fresh(entry, now)
+        ):
+            return None
+        return entry
+
+    def put(
+        self,
+        url: str,
+        result: CheckResult,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Store (or replace) the result of a URL check.
+
+        An accessible URL keeps its `ok_since` while it stays accessible.
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO results (
+                    url, ok, status, checked_at,
+                    etag, last_modified, final_url, ok_since
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, CASE WHEN ? THEN COALESCE(
+                    (SELECT ok_since FROM results WHERE url = ? AND ok = 1),
+                    ?
+                ) END)
+                """,
+                (
+                    url,
+                    int(result.ok),
+                    result.status,
+                    now,
+                    result.etag,
+                    result.last_modified,
+                    result.final_url,
+                    int(result.ok),
+                    url,
+                    now,
+                ),
+            )
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Delete expired entries and return how many were removed.
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                DELETE FROM results
+                WHERE (ok = 1 AND checked_at <= ?)
+                   OR (ok = 0 AND checked_at <= ?)
+                """,
+                (now - self.ttl_ok, now - self.ttl_broken),
+            )
+            self._conn.execute("VACUUM")
+
+        return cursor.rowcount
+
+    def stats(self, now: Optional[float] = None) -> dict[str, int]:
+        """
+        Return entry counts: total, ok, broken and expired.
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            total, ok, expired = self._conn.execute(
+                """
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(ok), 0),
+                    COALESCE(SUM(
+                        (ok = 1 AND checked_at <= ?)
+                        OR (ok = 0 AND checked_at <= ?)
+                    ), 0)
+                FROM results
+                """,
+                (now - self.ttl_ok, now - self.ttl_broken),
+            ).fetchone()
+
+        return {
+            "total": total,
+            "ok": ok,
+            "broken": total - ok,
+            "expired": expired,
+        }
+
+    def load_host_limits(self) -> dict[str, float]:
+        """
+        Return the per-host concurrency learned by previous runs.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT host, connections FROM host_limits"
+            ).fetchall()
+        return dict(rows)
+
+    def save_host_limits(
+        self,
+        limits: dict[str, float],
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Store (or replace) the per-host concurrency learned by a run.
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO host_limits (host, connections, updated_at)
+                VALUES (?, ?, ?)
+                """,
+                [(host, connections, now) for host, connections in limits.items()],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
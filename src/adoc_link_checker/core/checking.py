@@ -0,0 +1,144 @@
+import time
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+from adoc_link_checker.config import HOST_BATCH_SIZE
+from adoc_link_checker.core.context import LinkCheckContext
+from adoc_link_checker.core.scheduler import RetryScheduler
+from adoc_link_checker.http.pool import SessionPool
+from adoc_link_checker.http.service import Attempt, LinkChecker
+
+logger = logging.getLogger(__name__)
+
+
+def log_result(url: str, ok: bool) -> None:
+    if ok:
+        logger.debug(f"✅ URL OK: {url}")
+    else:
+        logger.warning(f"❌ Broken URL: {url}")
+
+
+def host_parallelism(
+    context: LinkCheckContext,
+) -> Optional[Callable[[str], int]]:
+    """
+    Return the cap on concurrent batches per host, from the rate limiter.
+    """
+    limiter = context.rate_limiter
+    if limiter is None:
+        return None
+    return limiter.connection_limit
+
+
+def budget_spent(stop_at: Optional[float]) -> bool:
+    """
+    Return True once no new check may start (`stop_at`, monotonic).
+    """
+    return stop_at is not None and time.monotonic() >= stop_at
+
+
+def wait_timeout(
+    scheduler: RetryScheduler,
+    stop_at: Optional[float],
+) -> Optional[float]:
+    """
+    Seconds the engine may wait for results before scheduling again.
+    """
+    timeout = scheduler.wait_time()
+    if stop_at is None:
+        return timeout
+
+    left = max(stop_at - time.monotonic(), 0.0)
+    return left if timeout is None else min(timeout, left)
+
+
+def run_batch(
+    checker: LinkChecker,
+    batch: list[tuple[str, int]],
+    stop_at: Optional[float] = None,
+) -> list[Attempt]:
+    """
+    Run the steps of a host batch in a row with one session.
+
+    Stops early when the host asks to be left alone or when the time
+    budget is spent: the remaining steps go back to the scheduler.
+    """
+    attempts = []
+    for url, number in batch:
+        if budget_spent(stop_at):
+            break
+        attempt = checker.step(url, number)
+        attempts.append(attempt)
+        if attempt.host_pause:
+            break
+    return attempts
+
+
+def check_urls(
+    urls: list[str],
+    context: LinkCheckContext,
+    max_workers: int,
+    sessions: SessionPool,
+    batch_size: int = HOST_BATCH_SIZE,
+    on_result: Optional[Callable[[str, bool], None]] = None,
+    stop_at: Optional[float] = None,
+) -> dict[str, bool]:
+    """
+    Check each unique URL once on a thread pool.
+
+    URLs are grouped by host and submitted in batches of `batch_size`:
+    each worker runs a batch with its own session from `sessions`, so
+    requests to a host reuse the same keep-alive connection.
+    At most `max_workers` batches are submitted at a time, so retries
+    coming due are picked up before the remaining new URLs and a
+    worker never sleeps through a backoff.
+    `on_result` is called with each URL and its result as soon as the
+    URL is settled.
+    No check starts after `stop_at` (time.monotonic): in-flight
+    batches stop after their current request and the URLs left are
+    not in the result.
+    Returns the result of every URL checked.
+    """
+
+    def run(batch: list[tuple[str, int]]) -> list[Attempt]:
+        return run_batch(LinkChecker(sessions.get(), context), batch, stop_at)
+
+    scheduler = RetryScheduler(urls, batch_size, host_parallelism(context))
+    results: dict[str, bool] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+
+        while scheduler or running:
+            stopped = budget_spent(stop_at)
+            while not stopped and len(running) < max_workers:
+                batch = scheduler.next_batch()
+                if not batch:
+                    break
+                running[executor.submit(run, batch)] = batch
+
+            if not running:
+                if stopped:
+                    break
+                time.sleep(wait_timeout(scheduler, stop_at) or 0)
+                continue
+
+            done, _ = wait(
+                running,
+                timeout=None if stopped else wait_timeout(scheduler, stop_at),
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                batch = running.pop(future)
+                for url, attempt in scheduler.record_batch(
+                    batch,
+                    future.result(),
+                ):
+                    results[url] = attempt.ok
+                    log_result(url, attempt.ok)
+                    if on_result is not None:
+                        on_result(url, attempt.ok)
+
+    return results
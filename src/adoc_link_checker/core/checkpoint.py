@@ -0,0 +1,226 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from adoc_link_checker.config import CHECKPOINT_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CheckpointEntry:
+    """
+    A URL result recorded by an interrupted run.
+    """
+
+    url: str
+    ok: bool
+    reason: Optional[str]
+    attempts: int
+
+
+class RunCheckpoint:
+    """
+    Progress of a run, saved to a SQLite state file so it can resume.
+
+    - files: URLs extracted from each processed file
+    - urls: result, reason and attempts of each settled URL
+
+    Records are buffered and written in one transaction every
+    `interval` seconds, so a killed run loses at most that much work.
+
+    With `resume`, the state of an unfinished run over the same
+    `root_path` is loaded; otherwise (or when the previous run
+    finished) the state file starts over. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        root_path: str,
+        resume: bool = False,
+        interval: float = CHECKPOINT_INTERVAL,
+    ):
+        self.path = path
+        self.interval = interval
+        self.resumed = False
+
+        self._files: dict[str, frozenset[str]] = {}
+        self._results: dict[str, CheckpointEntry] = {}
+        self._pending_files: list[tuple] = []
+        self._pending_urls: list[tuple] = []
+        self._saved_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(
+            path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                urls TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                ok INTEGER NOT NULL,
+                reason TEXT,
+                attempts INTEGER NOT NULL
+            );
+            """
+        )
+
+        root_path = os.path.abspath(root_path)
+        meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+
+        if resume and meta.get("finished") == "0":
+            if meta.get("root_path") != root_path:
+                self._conn.close()
+                raise ValueError(
+                    f"Checkpoint {path} was recorded for "
+                    f"{meta.get('root_path')}, not {root_path}"
+                )
+            self._load()
+            self.resumed = True
+        else:
+            if resume and meta:
+                logger.info("⏯️ Previous run finished, starting over")
+            self._reset(root_path)
+
+    def _load(self) -> None:
+        for path, urls in self._conn.execute("SELECT path, urls FROM files"):
+            self._files[path] = frozenset(json.loads(urls))
+
+        for url, ok, reason, attempts in self._conn.execute(
+            "SELECT url, ok, reason, attempts FROM urls"
+        ):
+            self._results[url] = CheckpointEntry(url, bool(ok), reason, attempts)
+
+    def _reset(self, root_path: str) -> None:
+        self._conn.executescript(
+            """
+            BEGIN;
+            DELETE FROM meta;
+            DELETE FROM files;
+            DELETE FROM urls;
+            COMMIT;
+            """
+        )
+        self._conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [("root_path", root_path), ("finished", "0")],
+        )
+
+    @property
+    def files(self) -> int:
+        """
+        Number of processed files loaded from the state file.
+        """
+        return len(self._files)
+
+    @property
+    def urls(self) -> int:
+        """
+        Number of URL results loaded from the state file.
+        """
+        return len(self._results)
+
+    def lookup(self, file_path: str) -> Optional[frozenset[str]]:
+        """
+        Return the URLs of a file processed by the interrupted run.
+        """
+        return self._files.get(os.path.abspath(file_path))
+
+    def result(self, url: str) -> Optional[CheckpointEntry]:
+        """
+        Return the result of a URL settled by the interrupted run.
+        """
+        return self._results.get(url)
+
+    def store_file(self, file_path: str, urls: Iterable[str]) -> None:
+        """
+        Record the URLs extracted from a file.
+        """
+        record = (os.path.abspath(file_path), json.dumps(sorted(urls)))
+        with self._lock:
+            self._pending_files.append(record)
+        self._save_if_due()
+
+    def store_result(
+        self,
+        url: str,
+        ok: bool,
+        reason: Optional[str],
+        attempts: int,
+    ) -> None:
+        """
+        Record the result of a settled URL.
+        """
+        with self._lock:
+            self._pending_urls.append((url, int(ok), reason, attempts))
+        self._save_if_due()
+
+    def _save_if_due(self) -> None:
+        if time.monotonic() - self._saved_at >= self.interval:
+            self.save()
+
+    def save(self) -> None:
+        """
+        Write the buffered records to the state file.
+        """
+        with self._lock:
+            files, self._pending_files = self._pending_files, []
+            urls, self._pending_urls = self._pending_urls, []
+            self._saved_at = time.monotonic()
+
+            if not files and not urls:
+                return
+
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (path, urls) VALUES (?, ?)",
+                files,
+            )
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO urls (url, ok, reason, attempts)
+                VALUES (?, ?, ?, ?)
+                """,
+                urls,
+            )
+            self._conn.execute("COMMIT")
+
+        logger.debug(
+            f"💾 Checkpoint: {len(files)} file(s), {len(urls)} URL(s) saved"
+        )
+
+    def finish(self) -> None:
+        """
+        Mark the run as finished: the next resume starts over.
+        """
+        self.save()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE meta SET value = '1' WHERE key = 'finished'"
+            )
+
+    def close(self) -> None:
+        """
+        Save the buffered records and close the state file.
+        """
+        self.save()
+        with self._lock:
+            self._conn.close()
@@ -1,29 +1,74 @@
 import threading
+from concurrent.futures import Future
 from typing import Optional
 
+from adoc_link_checker.core.cache import ResultCache
+from adoc_link_checker.core.metrics import RunMetrics
+from adoc_link_checker.http.breaker import CircuitBreaker
+from adoc_link_checker.http.checker import CheckResult
+from adoc_link_checker.http.methods import HostMethodCache
+from adoc_link_checker.http.ratelimit import HostRateLimiter
+from adoc_link_checker.http.retry import RetryPolicy
+from adoc_link_checker.utils.domains import DomainMatcher
+
 
 class LinkCheckContext:
     """
     Shared, thread-safe context for link checking.
 
     Responsibilities:
-    - store global configuration (timeout, blacklist)
-    - cache URL check results to avoid duplicate HTTP calls
+    - store global configuration (timeout, blacklist, rate limiter,
+      retry policy, circuit breaker, run metrics)
+    - remember the hosts rejecting HEAD requests
+    - cache URL check results to avoid duplicate HTTP calls,
+      backed by an optional persistent cache shared across runs
+    - coalesce concurrent checks of the same URL (single-flight)
     """
 
-    def __init__(self, timeout: int, blacklist: list[str]):
+    def __init__(
+        self,
+        timeout: int,
+        blacklist: list[str],
+        rate_limiter: Optional[HostRateLimiter] = None,
+        result_cache: Optional[ResultCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[RunMetrics] = None,
+    ):
         self.timeout = timeout
         self.blacklist = blacklist
+        self.blacklist_matcher = DomainMatcher(blacklist)
+        self.methods = HostMethodCache()
+        self.rate_limiter = rate_limiter
+        self.result_cache = result_cache
+        self.retry_policy = retry_policy
+        self.breaker = breaker
+        self.metrics = metrics
 
         self._cache: dict[str, bool] = {}
+        self.counters: dict[str, int] = {}
+        self.attempts: dict[str, int] = {}
+        self.reasons: dict[str, str] = {}
+        self._inflight: dict[str, Future] = {}
         self._lock = threading.Lock()
 
     def get_cached(self, url: str) -> Optional[bool]:
         """
         Return cached result for URL if present, else None.
+
+        Fresh entries of the persistent cache are promoted to the
+        in-memory cache on first access.
         """
         with self._lock:
-            return self._cache.get(url)
+            cached = self._cache.get(url)
+
+        if cached is None and self.result_cache is not None:
+            entry = self.result_cache.get(url)
+            if entry is not None:
+                with self._lock:
+                    cached = self._cache.setdefault(url, entry.ok)
+
+        return cached
 
     def set_cached(self, url: str, result: bool) -> None:
         """
@@ -32,6 +77,86 @@ class LinkCheckContext:
         with self._lock:
             self._cache[url] = result
 
+    def previous_result(self, url: str) -> Optional[CheckResult]:
+        """
+        Return an expired cached result worth revalidating, if any.
+        """
+        if self.result_cache is None:
+            return None
+
+        entry = self.result_cache.get_revalidatable(url)
+        return entry.result if entry is not None else None
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """
+        Increment a run counter (e.g. "revalidated").
+        """
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def record_attempt(self, url: str, number: int) -> None:
+        """
+        Record the number of HTTP attempts made for a URL.
+        """
+        with self._lock:
+            self.attempts[url] = number
+
+    def record_reason(self, url: str, reason: str) -> None:
+        """
+        Record why a URL failed, when it differs from the default reason.
+        """
+        with self._lock:
+            self.reasons[url] = reason
+
+    def persist(self, url: str, result: CheckResult) -> None:
+        """
+        Store a fresh HTTP check result in the persistent cache, if any.
+        """
+        if self.result_cache is not None:
+            self.result_cache.put(url, result)
+
+    def begin_check(self, url: str) -> tuple[Future, bool]:
+        """
+        Claim the check of a URL.
+
+        Returns (future, owner). Only the owner performs the check and
+        must call `finish_check`; other callers wait on the future.
+        """
+        with self._lock:
+            future = self._inflight.get(url)
+            if future is not None:
+                return future, False
+
+            future = Future()
+            if url in self._cache:
+                future.set_result(self._cache[url])
+                return future, False
+
+            self._inflight[url] = future
+            return future, True
+
+    def finish_check(
+        self,
+        url: str,
+        result: Optional[bool] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Publish the outcome of an in-flight check to waiting callers.
+
+        Successful results are cached; errors are propagated to waiters
+        without being cached.
+        """
+        with self._lock:
+            future = self._inflight.pop(url)
+            if error is None:
+                self._cache[url] = result
+
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
     def clear_cache(self) -> None:
         """
         Clear the URL cache (useful for tests or repeated runs).
@@ -1,20 +1,97 @@
 import os
+from typing import Iterable, Iterator
 
+from adoc_link_checker.config import EXCLUDE_DIRS, IGNORE_FILES
+from adoc_link_checker.utils.ignore import IgnoreRules
 
-def find_adoc_files(path: str) -> list[str]:
+# (base directory relative to the root, rules loaded from it)
+_RuleChain = tuple[tuple[str, IgnoreRules], ...]
+
+
+def _is_ignored(chain: _RuleChain, rel_path: str, is_dir: bool) -> bool:
+    ignored = False
+    for base, rules in chain:
+        if base:
+            sub_path = rel_path[len(base) + 1:]
+        else:
+            sub_path = rel_path
+        matched = rules.match(sub_path, is_dir)
+        if matched is not None:
+            ignored = matched
+    return ignored
+
+
+def _walk(
+    directory: str,
+    rel_dir: str,
+    chain: _RuleChain,
+    excluded: IgnoreRules,
+    ignore_files: tuple[str, ...],
+) -> Iterator[str]:
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    names = {entry.name for entry in entries}
+    for name in ignore_files:
+        if name in names:
+            rules = IgnoreRules.from_file(os.path.join(directory, name))
+            if rules:
+                chain = chain + ((rel_dir, rules),)
+
+    for entry in entries:
+        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+
+        if entry.is_dir(follow_symlinks=False):
+            if excluded.match(rel_path, True):
+                continue
+            if _is_ignored(chain, rel_path, True):
+                continue
+            yield from _walk(
+                entry.path, rel_path, chain, excluded, ignore_files
+            )
+
+        elif entry.name.endswith(".adoc") and entry.is_file():
+            if not _is_ignored(chain, rel_path, False):
+                yield entry.path
+
+
+def iter_adoc_files(
+    path: str,
+    exclude_dirs: Iterable[str] = (),
+    use_ignore_files: bool = True,
+) -> Iterator[str]:
     """
-    Return a list of .adoc files from a file or directory path.
+    Yield .adoc files from a file or directory path, as they are found.
+
+    - directories matching `exclude_dirs` (gitignore-style globs) or
+      the default EXCLUDE_DIRS are pruned without being scanned
+    - IGNORE_FILES found in the tree are honoured, like git does,
+      unless `use_ignore_files` is False
     """
     if os.path.isfile(path):
         if not path.endswith(".adoc"):
             raise ValueError("Provided file is not a .adoc file")
-        return [path]
+        yield path
+        return
 
-    adoc_files: list[str] = []
+    excluded = IgnoreRules(
+        pattern.rstrip("/") + "/"
+        for pattern in [*EXCLUDE_DIRS, *exclude_dirs]
+    )
+    ignore_files = tuple(IGNORE_FILES) if use_ignore_files else ()
 
-    for root, _, files in os.walk(path):
-        for file in files:
-            if file.endswith(".adoc"):
-                adoc_files.append(os.path.join(root, file))
+    yield from _walk(path, "", (), excluded, ignore_files)
 
-    return adoc_files
+
+def find_adoc_files(
+    path: str,
+    exclude_dirs: Iterable[str] = (),
+    use_ignore_files: bool = True,
+) -> list[str]:
+    """
+    Return a list of .adoc files from a file or directory path.
+    """
+    return list(iter_adoc_files(path, exclude_dirs, use_ignore_files))
@@ -0,0 +1,101 @@
+import os
+import hashlib
+import logging
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from adoc_link_checker.config import EXTRACT_CHUNK_SIZE, EXTRACT_CHUNKS_PER_WORKER
+from adoc_link_checker.core.extractor import extract_links_from_text
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ExtractedFile:
+    """
+    Links extracted from one file, with the file fingerprint.
+
+    `sha256` is None when the file could not be read.
+    """
+
+    path: str
+    urls: frozenset[str]
+    size: int = 0
+    mtime_ns: int = 0
+    sha256: Optional[str] = None
+
+
+def extract_file(file_path: str) -> ExtractedFile:
+    """
+    Read a file once, fingerprint it and extract its links.
+    """
+    try:
+        stat = os.stat(file_path)
+        with open(file_path, "rb") as f:
+            data = f.read()
+
+        return ExtractedFile(
+            path=file_path,
+            urls=frozenset(extract_links_from_text(data.decode("utf-8"))),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sha256=hashlib.sha256(data).hexdigest(),
+        )
+
+    except Exception as e:
+        logger.debug(f"Error reading {file_path}: {e}")
+        return ExtractedFile(path=file_path, urls=frozenset())
+
+
+def _extract_chunk(paths: list[str]) -> list[ExtractedFile]:
+    return [extract_file(path) for path in paths]
+
+
+def iter_extractions(
+    files: Iterable[str],
+    workers: int = 0,
+    chunk_size: int = EXTRACT_CHUNK_SIZE,
+) -> Iterator[ExtractedFile]:
+    """
+    Extract files and yield results as they become available.
+
+    With `workers` > 1, chunks of `chunk_size` files are extracted on a
+    process pool, so CPU-bound regex work scales with cores and does
+    not contend with HTTP threads for the GIL. Results are yielded
+    per chunk, in completion order.
+
+    At most EXTRACT_CHUNKS_PER_WORKER chunks per worker are in flight:
+    files are pulled from `files` as chunks complete, so a large tree
+    is never queued to the pool at once.
+    """
+    if workers <= 1:
+        for file_path in files:
+            yield extract_file(file_path)
+        return
+
+    window = workers * EXTRACT_CHUNKS_PER_WORKER
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: set = set()
+        chunk: list[str] = []
+
+        for file_path in files:
+            chunk.append(file_path)
+            if len(chunk) < chunk_size:
+                continue
+
+            pending.add(executor.submit(_extract_chunk, chunk))
+            chunk = []
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+        if chunk:
+            pending.add(executor.submit(_extract_chunk, chunk))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
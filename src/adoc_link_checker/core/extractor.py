@@ -1,7 +1,7 @@
 import re
 import logging
 
-from adoc_link_checker.config import LINK_PATTERNS
+from adoc_link_checker.config import URL_PATTERN, VIDEO_PATTERN
 from adoc_link_checker.utils.url import (
     is_valid_url,
     normalize_url,
@@ -10,6 +10,10 @@ from adoc_link_checker.utils.url import (
 
 logger = logging.getLogger(__name__)
 
+# Both patterns compiled once into a single alternation, so content
+# is scanned in one pass: a match is a video when group 1 is set.
+_LINK_RE = re.compile(f"{URL_PATTERN}|{VIDEO_PATTERN}")
+
 
 def extract_links(file_path: str) -> set[str]:
     """
@@ -19,20 +23,36 @@ def extract_links(file_path: str) -> set[str]:
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
 
-        links: set[str] = set()
-
-        for pattern in LINK_PATTERNS:
-            for match in re.finditer(pattern, content):
-                if pattern == LINK_PATTERNS[1]:
-                    url = youtube_id_to_url(match.group(1))
-                else:
-                    url = normalize_url(match.group(0).replace("link:", ""))
-
-                if is_valid_url(url):
-                    links.add(url)
-
-        return links
+        return extract_links_from_text(content)
 
     except Exception as e:
         logger.debug(f"Error reading {file_path}: {e}")
         return set()
+
+
+def extract_links_from_text(content: str) -> set[str]:
+    """
+    Extract all valid HTTP/HTTPS URLs from AsciiDoc content.
+
+    Raw matches are deduplicated before being normalized and validated.
+    """
+    raw_urls: set[str] = set()
+    video_ids: set[str] = set()
+    for match in _LINK_RE.finditer(content):
+        video_id = match.group(1)
+        if video_id is None:
+            raw_urls.add(match.group(0))
+        else:
+            video_ids.add(video_id)
+
+    links: set[str] = set()
+
+    for raw_url in raw_urls:
+        url = normalize_url(raw_url.replace("link:", ""))
+        if is_valid_url(url):
+            links.add(url)
+
+    for video_id in video_ids:
+        links.add(youtube_id_to_url(video_id))
+
+    return links
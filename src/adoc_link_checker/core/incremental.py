@@ -0,0 +1,124 @@
+import os
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Optional
+
+from adoc_link_checker.core.extraction import ExtractedFile
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalExtractor:
+    """
+    Index of previous extractions, to skip unchanged files.
+
+    The index (path -> size, mtime, content hash, extracted URLs) is
+    persisted in a SQLite file between runs:
+    - same size and mtime: previous URLs reused without reading the file
+    - same content hash: previous URLs reused without running the regexes
+    - otherwise the file must be extracted again and `store`d
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.reused = 0
+        self.extracted = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS extracted_files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                urls TEXT NOT NULL
+            )
+            """
+        )
+
+    def lookup(self, file_path: str) -> Optional[set[str]]:
+        """
+        Return the previous URLs of an unchanged file, else None.
+        """
+        key = os.path.abspath(file_path)
+
+        try:
+            stat = os.stat(key)
+            row = self._row(key)
+            if row is None:
+                return None
+
+            if row[0] != stat.st_size or row[1] != stat.st_mtime_ns:
+                with open(key, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+                if row[2] != digest:
+                    return None
+                self._write(key, stat.st_size, stat.st_mtime_ns, digest, row[3])
+
+        except OSError as e:
+            logger.debug(f"Error reading {file_path}: {e}")
+            return None
+
+        with self._lock:
+            self.reused += 1
+        return set(json.loads(row[3]))
+
+    def store(self, extracted: ExtractedFile) -> None:
+        """
+        Record a fresh extraction (unreadable files are not recorded).
+        """
+        with self._lock:
+            self.extracted += 1
+
+        if extracted.sha256 is None:
+            return
+
+        self._write(
+            os.path.abspath(extracted.path),
+            extracted.size,
+            extracted.mtime_ns,
+            extracted.sha256,
+            json.dumps(sorted(extracted.urls)),
+        )
+
+    def _row(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                """
+                SELECT size, mtime_ns, sha256, urls
+                FROM extracted_files WHERE path = ?
+                """,
+                (key,),
+            ).fetchone()
+
+    def _write(
+        self,
+        key: str,
+        size: int,
+        mtime_ns: int,
+        digest: str,
+        urls: str,
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO extracted_files
+                    (path, size, mtime_ns, sha256, urls)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, size, mtime_ns, digest, urls),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
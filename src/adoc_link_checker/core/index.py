@@ -0,0 +1,103 @@
+DEFAULT_REASON = "URL not accessible"
+
+
+class UrlIndex:
+    """
+    Inverted index of extracted URLs.
+
+    Maps every unique URL to the files citing it, so each URL is
+    checked once and its result fanned back to all those files.
+    """
+
+    def __init__(self):
+        self._urls_by_file: dict[str, list[str]] = {}
+        self._files_by_url: dict[str, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._files_by_url)
+
+    def add(self, file_path: str, urls) -> None:
+        """
+        Register the URLs extracted from a file.
+        """
+        urls = sorted(set(urls))
+        self._urls_by_file[file_path] = urls
+
+        for url in urls:
+            self._files_by_url.setdefault(url, []).append(file_path)
+
+    def urls(self) -> list[str]:
+        """
+        Return the unique URLs, in first-seen order.
+        """
+        return list(self._files_by_url)
+
+    def files_for(self, url: str) -> list[str]:
+        """
+        Return the files citing a URL.
+        """
+        return list(self._files_by_url.get(url, []))
+
+    @property
+    def files(self) -> int:
+        """
+        Number of indexed files.
+        """
+        return len(self._urls_by_file)
+
+    @property
+    def occurrences(self) -> int:
+        """
+        Total number of (file, URL) pairs.
+        """
+        return sum(len(urls) for urls in self._urls_by_file.values())
+
+    def group_by_file(self, urls) -> dict[str, list[str]]:
+        """
+        Return the files citing some of `urls`, sorted by path, with
+        those URLs.
+        """
+        urls = set(urls)
+        grouped: dict[str, list[str]] = {}
+
+        for file_path in sorted(self._urls_by_file):
+            cited = [url for url in self._urls_by_file[file_path] if url in urls]
+            if cited:
+                grouped[file_path] = cited
+
+        return grouped
+
+    def build_report(
+        self,
+        results: dict[str, bool],
+        attempts: dict[str, int] | None = None,
+        reasons: dict[str, str] | None = None,
+    ) -> dict[str, list[tuple]]:
+        """
+        Build the per-file broken links report from per-URL results.
+
+        Only files containing broken links appear in the report,
+        sorted by path. `reasons` overrides the default reason of some
+        URLs. With `attempts`, each entry also carries the number of
+        HTTP attempts made for the URL (0 = cached result).
+        """
+        reasons = reasons or {}
+        broken_links: dict[str, list[tuple]] = {}
+
+        for file_path in sorted(self._urls_by_file):
+            urls = self._urls_by_file[file_path]
+            broken = [
+                (url, reasons.get(url, DEFAULT_REASON))
+                if attempts is None
+                else (
+                    url,
+                    reasons.get(url, DEFAULT_REASON),
+                    attempts.get(url, 0),
+                )
+                for url in urls
+                if not results.get(url, True)
+            ]
+            if broken:
+                broken_links[file_path] = broken
+
+        return broken_links
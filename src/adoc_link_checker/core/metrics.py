@@ -0,0 +1,160 @@
+import math
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, TypeVar
+
+from adoc_link_checker.config import LATENCY_BUCKETS
+from adoc_link_checker.http.checker import CheckResult
+from adoc_link_checker.utils.url import get_host
+
+T = TypeVar("T")
+
+
+class RunMetrics:
+    """
+    Instrumentation of a run: phase timings and request statistics.
+
+    - phases: wall time of each pipeline phase (discovery time is
+      measured inside the file stream feeding extraction)
+    - requests: per-host and per-status counts, latency histogram,
+      body bytes received and time spent waiting for the rate limiter
+    - cache: hits and misses of the result cache
+
+    The hot path only appends a latency and bumps a few counters under
+    a lock; quantiles are computed once, in `snapshot`. Thread-safe.
+    """
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = sorted(buckets)
+        self.phases: dict[str, float] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        self._latencies: list[float] = []
+        self._hosts: dict[str, int] = {}
+        self._statuses: dict[str, int] = {}
+        self._received = 0
+        self._throttle_wait = 0.0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Add the wall time of the enclosed block to phase `name`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def timed(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """
+        Yield `items`, adding the time spent producing them to phase `name`.
+        """
+        iterator = iter(items)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_phase(name, time.perf_counter() - start)
+                return
+            self.add_phase(name, time.perf_counter() - start)
+            yield item
+
+    def observe_request(
+        self,
+        url: str,
+        result: CheckResult,
+        latency: float,
+        waited: float = 0.0,
+    ) -> None:
+        """
+        Record one HTTP attempt: its latency and the throttling wait.
+        """
+        host = get_host(url)
+        if result.status is not None:
+            status = str(result.status)
+        else:
+            status = result.error or "unknown"
+
+        with self._lock:
+            self._latencies.append(latency)
+            self._hosts[host] = self._hosts.get(host, 0) + 1
+            self._statuses[status] = self._statuses.get(status, 0) + 1
+            self._received += result.received
+            self._throttle_wait += waited
+
+    def snapshot(
+        self,
+        urls: Optional[dict[str, int]] = None,
+        counters: Optional[dict[str, int]] = None,
+        dns: Optional[dict[str, float]] = None,
+        connections: Optional[dict[str, int]] = None,
+    ) -> dict:
+        """
+        Return every metric of the run as a JSON-serializable dict.
+
+        URL totals, run `counters` (retries, revalidations...), DNS and
+        connection pool statistics are merged in when given.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            cumulative = [
+                bisect.bisect_right(latencies, bound) for bound in self.buckets
+            ]
+            lookups = self.cache_hits + self.cache_misses
+
+            return {
+                "phases": {
+                    name: round(seconds, 6)
+                    for name, seconds in self.phases.items()
+                },
+                "urls": dict(urls or {}),
+                "cache": {
+                    "hits": self.cache_hits,
+                    "misses": self.cache_misses,
+                    "hit_ratio": (
+                        round(self.cache_hits / lookups, 4) if lookups else 0.0
+                    ),
+                },
+                "requests": {
+                    "total": len(latencies),
+                    "by_host": dict(sorted(self._hosts.items())),
+                    "by_status": dict(sorted(self._statuses.items())),
+                    "bytes_received": self._received,
+                    "throttle_wait": round(self._throttle_wait, 6),
+                },
+                "latency": {
+                    "count": len(latencies),
+                    "sum": round(sum(latencies), 6),
+                    "p50": _quantile(latencies, 0.50),
+                    "p95": _quantile(latencies, 0.95),
+                    "p99": _quantile(latencies, 0.99),
+                    "max": round(latencies[-1], 6) if latencies else 0.0,
+                    "buckets": {
+                        str(bound): count
+                        for bound, count in zip(self.buckets, cumulative)
+                    },
+                },
+                "counters": dict(sorted((counters or {}).items())),
+                "dns": dict(dns or {}),
+                "connections": dict(connections or {}),
+            }
+
+
+def _quantile(values: list[float], q: float) -> float:
+    """
+    Nearest-rank quantile of sorted `values` (0.0 when empty).
+    """
+    if not values:
+        return 0.0
+    rank = max(math.ceil(q * len(values)) - 1, 0)
+    return round(values[rank], 6)
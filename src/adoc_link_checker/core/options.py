@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from adoc_link_checker.config import (
+    MAX_HOST_CONNECTIONS,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    HOST_BATCH_SIZE,
+    CACHE_TTL_OK,
+    CACHE_TTL_BROKEN,
+    EXTRACT_WORKERS,
+    RETRY_CONFIG,
+    BREAKER_THRESHOLD,
+    DNS_WORKERS,
+    REPORT_FORMAT,
+)
+from adoc_link_checker.http.ratelimit import HostLimit
+
+
+@dataclass(frozen=True)
+class CheckOptions:
+    """
+    How URLs are checked: connections, retries, DNS and result cache.
+    """
+
+    max_host_connections: int = MAX_HOST_CONNECTIONS
+    host_limits: dict[str, HostLimit] = field(default_factory=dict)
+    pool_connections: int = POOL_CONNECTIONS
+    pool_maxsize: int = POOL_MAXSIZE
+    host_batch_size: int = HOST_BATCH_SIZE
+    adaptive: bool = False
+    retries: int = RETRY_CONFIG["total"]
+    breaker_threshold: int = BREAKER_THRESHOLD
+    dns_workers: int = DNS_WORKERS
+    cache_file: Optional[str] = None
+    cache_ttl_ok: float = CACHE_TTL_OK
+    cache_ttl_broken: float = CACHE_TTL_BROKEN
+
+
+@dataclass(frozen=True)
+class DiscoveryOptions:
+    """
+    Which files are visited and how their links are extracted.
+    """
+
+    exclude_dirs: list[str] = field(default_factory=list)
+    use_ignore_files: bool = True
+    antora: bool = False
+    components: list[str] = field(default_factory=list)
+    changed_since: Optional[str] = None
+    extract_workers: int = EXTRACT_WORKERS
+    incremental: bool = False
+
+
+@dataclass(frozen=True)
+class ReportOptions:
+    """
+    What the run writes besides the broken links report.
+    """
+
+    report_format: str = REPORT_FORMAT
+    unchecked_output: Optional[str] = None
+    stats_json: Optional[str] = None
+    prometheus_textfile: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    """
+    Run control: checkpointing, time budget and profiling.
+    """
+
+    checkpoint: Optional[str] = None
+    resume: bool = False
+    max_duration: Optional[float] = None
+    profile: Optional[str] = None
+    profile_memory: bool = False
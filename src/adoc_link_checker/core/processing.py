@@ -1,6 +1,7 @@
-import time
 import logging
 
+import requests
+
 from adoc_link_checker.core.extractor import extract_links
 from adoc_link_checker.http.checker import create_session
 from adoc_link_checker.core.context import LinkCheckContext
@@ -14,14 +15,19 @@ def process_file(
     delay: float,
     context: LinkCheckContext,
     excluded_urls: set[str],
+    session: requests.Session | None = None,
 ) -> list[tuple[str, str]]:
     """
     Process a single .adoc file and return its broken links.
 
-    - One HTTP session per thread
-    - Uses shared LinkCheckContext for caching
+    - Reuses `session` when given, else creates one for this file
+    - Uses shared LinkCheckContext for caching and per-host throttling
+
+    `delay` is kept for backward compatibility: requests are now
+    throttled per host by the context's rate limiter.
     """
-    session = create_session()
+    if session is None:
+        session = create_session()
     checker = LinkChecker(session, context)
 
     broken_links: list[tuple[str, str]] = []
@@ -32,8 +38,6 @@ def process_file(
     logger.debug(f"📂 Processing {file_path} ({len(links)} URLs)")
 
     for url in links:
-        time.sleep(delay)
-
         if not checker.check(url):
             logger.warning(f"❌ Broken URL: {url}")
             broken_links.append((url, "URL not accessible"))
@@ -0,0 +1,209 @@
+import os
+import sys
+import time
+import pstats
+import logging
+import cProfile
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from adoc_link_checker.config import PROFILE_INTERVAL, PROFILE_TOP
+
+logger = logging.getLogger(__name__)
+
+
+class _Sampler(threading.Thread):
+    """
+    Sample the stacks of every other thread at a fixed interval.
+
+    Complements cProfile, which only sees the thread that enabled it,
+    while checks run on worker threads.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(name="adocx-profiler", daemon=True)
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    module = os.path.basename(code.co_filename)
+                    stack.append(f"{module}:{code.co_name}")
+                    frame = frame.f_back
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class _Stage:
+    def __init__(self, name: str):
+        self.name = name
+        self.wall_time = 0.0
+        self.stats: Optional[pstats.Stats] = None
+        self.samples: Counter = Counter()
+        self.memory: list[tracemalloc.StatisticDiff] = []
+        self.peak_memory = 0
+
+
+class StageProfiler:
+    """
+    Profile the stages of a run and write the data to `directory`.
+
+    For each stage:
+    - <stage>.prof: cProfile data of the calling thread (pstats format,
+      e.g. `python -m pstats` or snakeviz)
+    - <stage>.stacks.txt: stacks of all threads sampled every
+      `interval` seconds, in collapsed format (flame graph tools)
+    - <stage>.tracemalloc: memory snapshot at the end of the stage,
+      with `trace_memory`
+
+    `write_summary` writes summary.txt with the hot functions of each
+    stage and, with `trace_memory`, the allocations grown by the stage.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        trace_memory: bool = False,
+        interval: float = PROFILE_INTERVAL,
+    ):
+        self.directory = directory
+        self.trace_memory = trace_memory
+        self.interval = interval
+        self.stages: list[_Stage] = []
+
+        os.makedirs(directory, exist_ok=True)
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        if trace_memory:
+            tracemalloc.start()
+            self._snapshot = _take_snapshot()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Profile the enclosed block as stage `name`.
+        """
+        stage = _Stage(name)
+        profile = cProfile.Profile()
+        sampler = _Sampler(self.interval)
+
+        start = time.perf_counter()
+        sampler.start()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            sampler.stop()
+            stage.wall_time = time.perf_counter() - start
+            if self.trace_memory:
+                self._snapshot_memory(stage)
+
+            path = os.path.join(self.directory, f"{name}.prof")
+            profile.dump_stats(path)
+            stage.stats = pstats.Stats(path)
+            stage.samples = sampler.stacks
+            self._write_stacks(name, sampler.stacks)
+
+            self.stages.append(stage)
+
+    def _write_stacks(self, name: str, stacks: Counter) -> None:
+        path = os.path.join(self.directory, f"{name}.stacks.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+    def _snapshot_memory(self, stage: _Stage) -> None:
+        snapshot = _take_snapshot()
+        snapshot.dump(os.path.join(self.directory, f"{stage.name}.tracemalloc"))
+        stage.memory = snapshot.compare_to(self._snapshot, "lineno")
+        stage.peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        self._snapshot = snapshot
+
+    def write_summary(self, top: int = PROFILE_TOP) -> str:
+        """
+        Write summary.txt and return its path.
+        """
+        lines = []
+        for stage in self.stages:
+            lines.append(f"== {stage.name} ({stage.wall_time:.2f}s)")
+            lines.append("")
+
+            lines.append("Hot functions, calling thread (cumulative time):")
+            lines.extend(_top_functions(stage.stats, top))
+            lines.append("")
+
+            total = sum(stage.samples.values())
+            lines.append(f"Hot functions, all threads ({total} samples, self):")
+            leaves = Counter()
+            for stack, count in stage.samples.items():
+                leaves[stack[-1]] += count
+            for function, count in leaves.most_common(top):
+                lines.append(f"  {count / total:6.1%}  {function}")
+            lines.append("")
+
+            if self.trace_memory:
+                lines.append(
+                    f"Memory grown by the stage "
+                    f"(peak {stage.peak_memory / 1024 / 1024:.1f} MiB):"
+                )
+                for diff in stage.memory[:top]:
+                    frame = diff.traceback[0]
+                    lines.append(
+                        f"  {diff.size_diff / 1024:+10.1f} KiB  "
+                        f"{frame.filename}:{frame.lineno}"
+                    )
+                lines.append("")
+
+        path = os.path.join(self.directory, "summary.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+        if self.trace_memory:
+            tracemalloc.stop()
+
+        logger.info(f"🔬 Profile written to: {os.path.abspath(self.directory)}")
+        return path
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """
+    Take a memory snapshot leaving out the profiler's own allocations.
+    """
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, module.__file__)
+        for module in (cProfile, pstats, tracemalloc, sys.modules[__name__])
+    ])
+
+
+def _top_functions(stats: Optional[pstats.Stats], top: int) -> list[str]:
+    if stats is None:
+        return []
+
+    rows = sorted(
+        stats.stats.items(),
+        key=lambda item: item[1][3],
+        reverse=True,
+    )
+    lines = []
+    for (filename, lineno, function), (_, calls, tottime, cumtime, _) in rows[:top]:
+        location = f"{os.path.basename(filename)}:{lineno}" if lineno else filename
+        lines.append(
+            f"  {cumtime:8.3f}s cum {tottime:8.3f}s self {calls:>8} calls  "
+            f"{function} ({location})"
+        )
+    return lines
@@ -1,15 +1,54 @@
-import logging
+import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import logging
+from contextlib import nullcontext
+from typing import Iterable
 
-from adoc_link_checker.core.discovery import find_adoc_files
+from adoc_link_checker.config import EXTRACT_WORKERS
+from adoc_link_checker.core.antora import (
+    iter_antora_files,
+    summarize_by_component,
+)
+from adoc_link_checker.core.cache import ResultCache
+from adoc_link_checker.core.checking import check_urls
+from adoc_link_checker.core.checkpoint import RunCheckpoint
+from adoc_link_checker.core.discovery import iter_adoc_files
 from adoc_link_checker.core.context import LinkCheckContext
+from adoc_link_checker.core.extraction import iter_extractions
+from adoc_link_checker.core.incremental import IncrementalExtractor
+from adoc_link_checker.core.index import DEFAULT_REASON, UrlIndex
+from adoc_link_checker.core.metrics import RunMetrics
+from adoc_link_checker.core.options import (
+    CheckOptions,
+    DiscoveryOptions,
+    ReportOptions,
+    RunOptions,
+)
+from adoc_link_checker.core.profiling import StageProfiler
+from adoc_link_checker.core.scheduler import prioritize
+from adoc_link_checker.http.adaptive import AdaptiveConcurrency
+from adoc_link_checker.http.breaker import CircuitBreaker
+from adoc_link_checker.http.dns import DnsCache
+from adoc_link_checker.http.pool import SessionPool
+from adoc_link_checker.http.ratelimit import HostLimit, HostRateLimiter
+from adoc_link_checker.http.retry import RetryPolicy
+from adoc_link_checker.http.service import HOST_NOT_FOUND
 from adoc_link_checker.reporting.json import write_report
-from adoc_link_checker.core.processing import process_file
-from adoc_link_checker.utils.exclusions import load_excluded_urls
+from adoc_link_checker.reporting.ndjson import NdjsonReportWriter
+from adoc_link_checker.reporting.metrics import (
+    write_prometheus_textfile,
+    write_stats_json,
+)
+from adoc_link_checker.utils.exclusions import load_url_matcher
+from adoc_link_checker.utils.git import changed_files
+from adoc_link_checker.utils.matcher import UrlMatcher
+from adoc_link_checker.utils.url import get_host
 
 logger = logging.getLogger(__name__)
 
+REPORT_FORMATS = ("json", "ndjson")
+
 
 def run_check(
     root_path: str,
@@ -20,37 +59,462 @@ def run_check(
     blacklist: list[str],
     exclude_from: str | None,
     fail_on_broken: bool = False,
+    check: CheckOptions | None = None,
+    discovery: DiscoveryOptions | None = None,
+    report: ReportOptions | None = None,
+    run: RunOptions | None = None,
 ) -> None:
+    """
+    Run a full link check.
+
+    Pipeline:
+    - discover files, streaming them into extraction
+    - extract every file into a URL -> files index
+    - check each unique URL once
+    - fan results back into the per-file report
+
+    The arguments of the original API come first; the other options are
+    grouped by concern: `check` (CheckOptions), `discovery`
+    (DiscoveryOptions), `report` (ReportOptions) and `run` (RunOptions),
+    all optional.
+
+    `delay` is the minimum delay between two requests to the same host;
+    `check.host_limits` override it per domain.
+
+    With `check.cache_file`, results are persisted between runs and
+    reused until they expire; only URLs without a fresh result are
+    scheduled. `discovery.incremental` also reuses the previous
+    extraction of unchanged files (requires `check.cache_file`).
+    `discovery.changed_since` limits the check to files changed since a
+    git ref. With `discovery.extract_workers` > 1, extraction runs on a
+    process pool.
+
+    Discovery skips `discovery.exclude_dirs` and, unless
+    `discovery.use_ignore_files` is False, paths ignored by .gitignore
+    files. With `discovery.antora`, only the pages, partials and
+    examples of the Antora components found in `root_path` (a playbook
+    or a directory) are visited, optionally restricted to
+    `discovery.components` (NAME or NAME@VERSION).
+
+    Failed checks are retried up to `check.retries` times by the engine
+    scheduler, honouring Retry-After; the report records the number of
+    attempts made for each broken URL. After `check.breaker_threshold`
+    consecutive connection failures on a host (0 = never), its remaining
+    URLs are failed fast.
+
+    With `check.dns_workers` > 0, the hosts to check are resolved
+    concurrently before checking and cached for the run; URLs on hosts
+    that do not exist fail without being scheduled.
+
+    URLs are checked in batches of `check.host_batch_size` URLs of the
+    same host, so each worker reuses one keep-alive connection per
+    batch; the batches of a host in flight are capped by its connection
+    limit.
+
+    With `check.adaptive`, the concurrency of each host is adjusted from
+    its latency and errors (AIMD) within `check.max_host_connections`;
+    learned limits are kept in `check.cache_file`, when given, for the
+    next run.
+
+    Phase timings and request metrics are logged at the end of the run
+    and written to `report.stats_json` and/or
+    `report.prometheus_textfile` (Prometheus text format, for the node
+    exporter textfile collector).
+
+    With `run.profile`, the extraction and checking stages are profiled
+    separately (cProfile, sampled stacks of all threads and, with
+    `run.profile_memory`, tracemalloc snapshots at stage boundaries)
+    into the `run.profile` directory, with a hot-function summary.
+
+    With `report.report_format` "ndjson", `output_file` is written as
+    the run progresses: one record per URL (result, reason, attempts,
+    citing files) as soon as it is settled, then a summary record.
+
+    With `run.checkpoint`, processed files and settled URLs are saved to
+    that state file at regular intervals. With `run.resume`, the files
+    and URLs done by an interrupted run recorded there are skipped; a
+    finished run's state starts over.
+
+    With `run.max_duration`, the run fits a wall-clock budget (seconds),
+    counted from the start of discovery: the time spent discovering and
+    extracting files is taken out of the checks' share. URLs are checked
+    by priority (never checked, previously broken, then previously
+    accessible, the longest accessible last, from `check.cache_file`)
+    and no check starts later than `timeout` seconds before the budget
+    ends. URLs left unchecked are not reported as broken: they are
+    listed in `report.unchecked_output`, when given, and stay pending in
+    the checkpoint for `run.resume`.
+    """
+    check = check or CheckOptions()
+    discovery = discovery or DiscoveryOptions()
+    report = report or ReportOptions()
+    run = run or RunOptions()
+
     if not output_file:
         raise ValueError("output_file must be provided")
 
-    files = find_adoc_files(root_path)
-    logger.info(f"📄 Found {len(files)} .adoc file(s)")
+    if report.report_format not in REPORT_FORMATS:
+        raise ValueError(f"Unknown report format: {report.report_format}")
+
+    if check.retries < 0:
+        raise ValueError("retries must be >= 0")
 
-    excluded_urls = load_excluded_urls(exclude_from)
-    context = LinkCheckContext(timeout=timeout, blacklist=blacklist)
+    if discovery.incremental and not check.cache_file:
+        raise ValueError("incremental mode requires a cache file")
 
-    broken_links: dict[str, list[tuple[str, str]]] = {}
+    if run.resume and not run.checkpoint:
+        raise ValueError("resume requires a checkpoint file")
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(
-                process_file,
-                file,
-                delay,
-                context,
+    if run.max_duration is not None and run.max_duration <= timeout:
+        raise ValueError(
+            f"max_duration ({run.max_duration:g}s) must be greater than "
+            f"timeout ({timeout:g}s): no check could start"
+        )
+
+    file_components: dict[str, str] = {}
+    files: Iterable[str]
+
+    if discovery.antora:
+        antora_files = iter_antora_files(
+            root_path,
+            discovery.components,
+            discovery.exclude_dirs,
+            discovery.use_ignore_files,
+        )
+
+        def tagged():
+            for antora_file in antora_files:
+                file_components[antora_file.path] = antora_file.component.key
+                yield antora_file.path
+
+        files = tagged()
+    else:
+        files = iter_adoc_files(
+            root_path,
+            discovery.exclude_dirs,
+            discovery.use_ignore_files,
+        )
+
+    if discovery.changed_since:
+        changed = changed_files(root_path, discovery.changed_since)
+        files = (f for f in files if os.path.realpath(f) in changed)
+        logger.info(
+            f"🔀 Only checking files changed since {discovery.changed_since}"
+        )
+
+    run_start = time.perf_counter()
+    stop_at = (
+        time.monotonic() + run.max_duration - timeout
+        if run.max_duration is not None
+        else None
+    )
+    metrics = RunMetrics()
+    profiler = (
+        StageProfiler(run.profile, trace_memory=run.profile_memory)
+        if run.profile
+        else None
+    )
+
+    def stage(name: str):
+        return profiler.stage(name) if profiler is not None else nullcontext()
+
+    excluded_urls = load_url_matcher(exclude_from, blacklist)
+    result_cache = (
+        ResultCache(
+            check.cache_file,
+            check.cache_ttl_ok,
+            check.cache_ttl_broken,
+        )
+        if check.cache_file
+        else None
+    )
+    controller = (
+        AdaptiveConcurrency(
+            learned=(
+                result_cache.load_host_limits()
+                if result_cache is not None
+                else None
+            ),
+        )
+        if check.adaptive
+        else None
+    )
+    rate_limiter = HostRateLimiter(
+        default=HostLimit(
+            rate=1 / delay if delay > 0 else 0,
+            max_connections=check.max_host_connections,
+        ),
+        overrides=check.host_limits,
+        adaptive=controller,
+    )
+    context = LinkCheckContext(
+        timeout=timeout,
+        blacklist=blacklist,
+        rate_limiter=rate_limiter,
+        result_cache=result_cache,
+        retry_policy=RetryPolicy(max_attempts=check.retries + 1),
+        breaker=(
+            CircuitBreaker(threshold=check.breaker_threshold)
+            if check.breaker_threshold > 0
+            else None
+        ),
+        metrics=metrics,
+    )
+
+    dns_cache = DnsCache() if check.dns_workers > 0 else None
+    sessions = SessionPool(
+        pool_connections=check.pool_connections,
+        pool_maxsize=check.pool_maxsize,
+        dns_cache=dns_cache,
+    )
+    extractor = (
+        IncrementalExtractor(check.cache_file)
+        if discovery.incremental
+        else None
+    )
+    state = (
+        RunCheckpoint(run.checkpoint, root_path, run.resume)
+        if run.checkpoint
+        else None
+    )
+    writer = (
+        NdjsonReportWriter(output_file)
+        if report.report_format == "ndjson"
+        else None
+    )
+
+    def stream(url: str, ok: bool) -> None:
+        writer.write_result(
+            url,
+            ok,
+            None if ok else context.reasons.get(url, DEFAULT_REASON),
+            context.attempts.get(url, 0),
+            index.files_for(url),
+        )
+
+    def settle(url: str, ok: bool) -> None:
+        if state is not None:
+            state.store_result(
+                url,
+                ok,
+                None if ok else context.reasons.get(url, DEFAULT_REASON),
+                context.attempts.get(url, 0),
+            )
+        if writer is not None:
+            stream(url, ok)
+
+    on_result = settle if writer is not None or state is not None else None
+
+    try:
+        start = time.perf_counter()
+        with stage("extraction"):
+            index = build_index(
+                metrics.timed("discovery", files),
                 excluded_urls,
-            ): file
-            for file in files
-        }
+                discovery.extract_workers,
+                extractor,
+                state,
+            )
+        # Discovery is streamed into extraction: split their time
+        metrics.add_phase(
+            "extraction",
+            time.perf_counter() - start - metrics.phases.get("discovery", 0.0),
+        )
+        logger.info(f"📄 Indexed {index.files} .adoc file(s)")
+        if extractor is not None:
+            logger.info(
+                f"♻️ Reused extraction of {extractor.reused} unchanged "
+                f"file(s), extracted {extractor.extracted}"
+            )
+
+        logger.info(
+            f"🔗 Found {len(index)} unique URL(s) "
+            f"in {index.occurrences} occurrence(s)"
+        )
+
+        results: dict[str, bool] = {}
+        pending: list[str] = []
+        resumed = 0
+        with metrics.phase("cache"):
+            for url in index.urls():
+                entry = state.result(url) if state is not None else None
+                if entry is not None:
+                    results[url] = entry.ok
+                    context.record_attempt(url, entry.attempts)
+                    if not entry.ok:
+                        context.record_reason(url, entry.reason)
+                    resumed += 1
+                    continue
+
+                cached = context.get_cached(url)
+                if cached is None:
+                    pending.append(url)
+                else:
+                    results[url] = cached
+        metrics.cache_hits = len(results) - resumed
+        metrics.cache_misses = len(pending)
+        if writer is not None:
+            for url, ok in results.items():
+                stream(url, ok)
+
+        if state is not None and state.resumed:
+            logger.info(
+                f"⏯️ Resumed {resumed} URL result(s) and {state.files} "
+                f"processed file(s) from {run.checkpoint}"
+            )
+
+        logger.info(
+            f"🌐 {len(pending)} URL(s) to check, "
+            f"{metrics.cache_hits} served from cache"
+        )
 
-        for future in as_completed(futures):
-            file = futures[future]
-            result = future.result()
-            if result:
-                broken_links[file] = result
+        with stage("checking"):
+            if dns_cache is not None:
+                with metrics.phase("dns"):
+                    pending, unresolved = resolve_hosts(
+                        pending,
+                        dns_cache,
+                        check.dns_workers,
+                    )
+                for url in unresolved:
+                    results[url] = False
+                    context.record_reason(url, HOST_NOT_FOUND)
+                    if on_result is not None:
+                        on_result(url, False)
 
-    write_report(output_file, broken_links)
+            if stop_at is not None:
+                pending = prioritize(pending, result_cache)
+                logger.info(
+                    f"⏳ {max(stop_at - time.monotonic(), 0.0):.1f}s of the "
+                    f"time budget left to start checks"
+                )
+
+            with metrics.phase("check"):
+                results.update(
+                    check_urls(
+                        pending,
+                        context,
+                        max_workers,
+                        sessions,
+                        check.host_batch_size,
+                        on_result,
+                        stop_at,
+                    )
+                )
+
+            unchecked = (
+                [url for url in pending if url not in results]
+                if stop_at is not None
+                else []
+            )
+            checked = len(pending) - len(unchecked)
+
+        if writer is not None:
+            for url in unchecked:
+                writer.write_unchecked(url, index.files_for(url))
+            writer.write_summary(
+                files=index.files,
+                urls=len(index),
+                checked=checked,
+                broken=sum(not ok for ok in results.values()),
+                unchecked=len(unchecked),
+            )
+
+        if state is not None and not unchecked:
+            state.finish()
+
+        log_connection_reuse(sessions)
+    finally:
+        sessions.close()
+        if writer is not None:
+            writer.close()
+        if state is not None:
+            state.close()
+        if extractor is not None:
+            extractor.close()
+        if result_cache is not None:
+            if controller is not None:
+                result_cache.save_host_limits(controller.limits())
+            result_cache.close()
+
+    if unchecked:
+        logger.warning(
+            f"⏳ Time budget of {run.max_duration:g}s reached: "
+            f"{len(unchecked)} URL(s) left unchecked"
+        )
+
+    if controller is not None and controller.backoffs:
+        logger.info(
+            f"📉 Backed off {controller.backoffs} time(s) on overloaded "
+            f"host(s)"
+        )
+
+    revalidated = context.counters.get("revalidated", 0)
+    if revalidated:
+        logger.info(
+            f"🔄 {revalidated} URL(s) revalidated with a conditional request"
+        )
+
+    retried = context.counters.get("retries", 0)
+    if retried:
+        logger.info(f"🔁 {retried} retr{'y' if retried == 1 else 'ies'} scheduled")
+
+    failed_fast = context.counters.get("circuit_open", 0)
+    if failed_fast:
+        logger.warning(
+            f"⚡ {failed_fast} URL(s) failed fast on unreachable host(s): "
+            + ", ".join(context.breaker.tripped_hosts())
+        )
+
+    broken = sum(not ok for ok in results.values())
+    with metrics.phase("report"):
+        broken_links = index.build_report(
+            results,
+            context.attempts,
+            context.reasons,
+        )
+        if writer is None:
+            write_report(output_file, broken_links)
+        else:
+            logger.info(
+                f"📊 Broken links report streamed to: "
+                f"{os.path.abspath(output_file)}"
+            )
+        if report.unchecked_output:
+            write_report(
+                report.unchecked_output,
+                index.group_by_file(unchecked),
+                title="Unchecked URLs",
+            )
+
+    metrics.add_phase("total", time.perf_counter() - run_start)
+    log_phases(metrics)
+
+    if profiler is not None:
+        profiler.write_summary()
+
+    if report.stats_json or report.prometheus_textfile:
+        snapshot = metrics.snapshot(
+            urls={
+                "files": index.files,
+                "unique": len(index),
+                "occurrences": index.occurrences,
+                "checked": checked,
+                "broken": broken,
+                "unchecked": len(unchecked),
+            },
+            counters=context.counters,
+            dns=dns_cache.stats() if dns_cache is not None else None,
+            connections=sessions.stats(),
+        )
+        if report.stats_json:
+            write_stats_json(report.stats_json, snapshot)
+        if report.prometheus_textfile:
+            write_prometheus_textfile(report.prometheus_textfile, snapshot)
+
+    summary = summarize_by_component(broken_links, file_components)
+    for key, count in summary.items():
+        logger.info(f"🧩 {key}: {count} broken link(s)")
 
     if not broken_links:
         logger.info("✅ No broken links found.")
@@ -58,3 +522,124 @@ def run_check(
     if fail_on_broken and broken_links:
         logger.error("❌ Broken links detected.")
         sys.exit(1)
+
+
+def build_index(
+    files: Iterable[str],
+    excluded_urls: UrlMatcher | set[str],
+    extract_workers: int = EXTRACT_WORKERS,
+    incremental: IncrementalExtractor | None = None,
+    checkpoint: RunCheckpoint | None = None,
+) -> UrlIndex:
+    """
+    Extract every file into a URL -> files index, skipping excluded URLs.
+
+    Exclusion rules (and blacklisted domains) are evaluated once per
+    unique URL, so excluded URLs never reach the HTTP path.
+
+    Files unchanged since the previous run are served by `incremental`;
+    the others are extracted (on a process pool if `extract_workers` > 1)
+    and indexed as results stream back. Files processed by an
+    interrupted run are served by `checkpoint`, which records the
+    others.
+    """
+    index = UrlIndex()
+    excluded: dict[str, bool] = {}
+
+    def is_excluded(url: str) -> bool:
+        if url not in excluded:
+            excluded[url] = url in excluded_urls
+        return excluded[url]
+
+    def add(file_path: str, urls) -> None:
+        index.add(
+            file_path,
+            (url for url in urls if not is_excluded(url)),
+        )
+
+    def lookup(file_path: str):
+        if checkpoint is not None:
+            urls = checkpoint.lookup(file_path)
+            if urls is not None:
+                return urls
+
+        urls = incremental.lookup(file_path) if incremental else None
+        if urls is not None and checkpoint is not None:
+            checkpoint.store_file(file_path, urls)
+        return urls
+
+    def to_extract():
+        for file_path in files:
+            urls = lookup(file_path)
+            if urls is None:
+                yield file_path
+            else:
+                add(file_path, urls)
+
+    for extracted in iter_extractions(to_extract(), extract_workers):
+        if incremental is not None:
+            incremental.store(extracted)
+        if checkpoint is not None:
+            checkpoint.store_file(extracted.path, extracted.urls)
+        add(extracted.path, extracted.urls)
+
+    logger.debug(
+        f"🚫 {sum(excluded.values())} unique URL(s) excluded or blacklisted"
+    )
+    return index
+
+
+def resolve_hosts(
+    urls: list[str],
+    dns_cache: DnsCache,
+    workers: int,
+) -> tuple[list[str], list[str]]:
+    """
+    Resolve the hosts of `urls` concurrently ahead of checking.
+
+    Returns (URLs to check, URLs on hosts that do not exist).
+    """
+    hosts = {get_host(url) for url in urls}
+    dns_cache.prefetch(hosts, workers)
+
+    stats = dns_cache.stats()
+    logger.info(
+        f"🧭 Resolved {len(hosts)} host(s) in {stats['resolve_time']:.2f}s "
+        f"(DNS time), {stats['not_found']} not found"
+    )
+
+    to_check: list[str] = []
+    unresolved: list[str] = []
+    for url in urls:
+        if dns_cache.not_found(get_host(url)):
+            unresolved.append(url)
+        else:
+            to_check.append(url)
+    return to_check, unresolved
+
+
+def log_phases(metrics: RunMetrics) -> None:
+    """
+    Log the wall time of each phase of the run.
+    """
+    logger.info(
+        "⏱️ "
+        + ", ".join(
+            f"{name} {seconds:.2f}s" for name, seconds in metrics.phases.items()
+        )
+    )
+
+
+def log_connection_reuse(sessions: SessionPool) -> None:
+    """
+    Log how many requests reused a keep-alive connection.
+    """
+    stats = sessions.stats()
+    if not stats["requests"]:
+        return
+
+    logger.info(
+        f"🔌 {stats['requests']} request(s): {stats['reused']} reused a "
+        f"keep-alive connection, {stats['connections']} opened a new one "
+        f"({stats['reused'] / stats['requests']:.0%} reuse)"
+    )
@@ -0,0 +1,213 @@
+import time
+import heapq
+import itertools
+from collections import deque
+from typing import Callable, Iterable, Optional
+
+from adoc_link_checker.core.cache import ResultCache
+from adoc_link_checker.http.service import Attempt
+from adoc_link_checker.utils.url import get_host
+
+
+class RetryScheduler:
+    """
+    Order the check steps of a run.
+
+    URLs are grouped by host and handed out in host batches: a worker
+    runs a whole batch with its own session, so consecutive requests
+    reuse the same keep-alive connection. Hosts are served round-robin
+    and `host_parallelism(host)` caps the batches of a host in flight
+    (0 = unlimited), leaving the other workers to other hosts.
+
+    Failed attempts go to a delayed queue keyed by due time and come
+    back at the front of their host once due. A host that asked to be
+    left alone (Retry-After, 429) is paused: its URLs wait without
+    being attempted, while other hosts keep going.
+
+    Not thread-safe: driven by a single engine loop.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        batch_size: int = 1,
+        host_parallelism: Optional[Callable[[str], int]] = None,
+    ):
+        self.batch_size = max(batch_size, 1)
+        self.host_parallelism = host_parallelism
+
+        # Insertion order is the round-robin order of hosts
+        self._queues: dict[str, deque[tuple[str, int]]] = {}
+        for url in urls:
+            self._queues.setdefault(get_host(url), deque()).append((url, 1))
+
+        self._delayed: list[tuple[float, int, str, int]] = []
+        self._paused: dict[str, float] = {}
+        self._running: dict[str, int] = {}
+        self._seq = itertools.count()
+
+    def __bool__(self) -> bool:
+        return bool(self._queues or self._delayed)
+
+    def next_batch(self, now: Optional[float] = None) -> list[tuple[str, int]]:
+        """
+        Return the next batch of (url, attempt number) on a single host.
+
+        The host stays busy until the batch is passed to `record_batch`.
+        Returns an empty list when nothing is ready.
+        """
+        batch = self._take(self.batch_size, now)
+        if batch:
+            host = get_host(batch[0][0])
+            self._running[host] = self._running.get(host, 0) + 1
+        return batch
+
+    def wait_time(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds until a delayed step is due or a paused host resumes
+        (None if nothing is waiting).
+        """
+        now = time.monotonic() if now is None else now
+
+        times = [
+            self._paused[host]
+            for host in self._queues
+            if self._paused.get(host, 0.0) > now
+        ]
+        if self._delayed:
+            times.append(self._delayed[0][0])
+
+        if not times:
+            return None
+        return max(min(times) - now, 0.0)
+
+    def record(
+        self,
+        url: str,
+        attempt: Attempt,
+        now: Optional[float] = None,
+    ) -> bool:
+        """
+        Record the outcome of a step; return True if the check is complete.
+        """
+        now = time.monotonic() if now is None else now
+
+        if attempt.host_pause:
+            host = get_host(url)
+            self._paused[host] = max(
+                self._paused.get(host, 0.0),
+                now + attempt.host_pause,
+            )
+
+        if attempt.complete:
+            return True
+
+        heapq.heappush(
+            self._delayed,
+            (now + attempt.retry_in, next(self._seq), url, attempt.number + 1),
+        )
+        return False
+
+    def record_batch(
+        self,
+        batch: list[tuple[str, int]],
+        attempts: list[Attempt],
+        now: Optional[float] = None,
+    ) -> list[tuple[str, Attempt]]:
+        """
+        Record the outcome of a batch and free its host.
+
+        `attempts` may be shorter than `batch` when the worker stopped
+        early (host paused): the remaining steps go back to the front
+        of their host. Returns the completed (url, attempt) pairs.
+        """
+        now = time.monotonic() if now is None else now
+        if not batch:
+            return []
+
+        completed = [
+            (url, attempt)
+            for (url, _), attempt in zip(batch, attempts)
+            if self.record(url, attempt, now)
+        ]
+
+        host = get_host(batch[0][0])
+        self._requeue(host, batch[len(attempts):])
+        self._release(host)
+        return completed
+
+    def _take(self, size: int, now: Optional[float]) -> list[tuple[str, int]]:
+        now = time.monotonic() if now is None else now
+        self._release_due(now)
+
+        for host, queue in self._queues.items():
+            if self._paused.get(host, 0.0) > now or self._saturated(host):
+                continue
+
+            batch = [queue.popleft() for _ in range(min(size, len(queue)))]
+
+            # Rotate the host to the end of the round-robin
+            del self._queues[host]
+            if queue:
+                self._queues[host] = queue
+            return batch
+
+        return []
+
+    def _release_due(self, now: float) -> None:
+        due: dict[str, list[tuple[str, int]]] = {}
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, url, number = heapq.heappop(self._delayed)
+            due.setdefault(get_host(url), []).append((url, number))
+
+        for host, steps in due.items():
+            self._requeue(host, steps)
+
+    def _requeue(self, host: str, steps: list[tuple[str, int]]) -> None:
+        if not steps:
+            return
+        queue = self._queues.setdefault(host, deque())
+        queue.extendleft(reversed(steps))
+
+    def _saturated(self, host: str) -> bool:
+        if self.host_parallelism is None:
+            return False
+        limit = self.host_parallelism(host)
+        return limit > 0 and self._running.get(host, 0) >= limit
+
+    def _release(self, host: str) -> None:
+        running = self._running.get(host, 0) - 1
+        if running > 0:
+            self._running[host] = running
+        else:
+            self._running.pop(host, None)
+
+
+def prioritize(
+    urls: Iterable[str],
+    result_cache: Optional[ResultCache],
+) -> list[str]:
+    """
+    Order URLs by check priority, from the results of previous runs.
+
+    - never checked
+    - previously broken
+    - previously accessible, the longest accessible last
+
+    URLs of the same priority keep their order. Fed to RetryScheduler,
+    hosts are first served in the order of their most urgent URL.
+    """
+    if result_cache is None:
+        return list(urls)
+
+    def priority(url: str) -> tuple[int, float]:
+        entry = result_cache.last_result(url)
+        if entry is None:
+            return (0, 0.0)
+        if not entry.ok:
+            return (1, 0.0)
+        if entry.ok_since is None:
+            return (2, -entry.checked_at)
+        return (2, -entry.ok_since)
+
+    return sorted(urls, key=priority)
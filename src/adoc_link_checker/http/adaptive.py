@@ -0,0 +1,114 @@
+import time
+import logging
+import threading
+from typing import Optional
+
+from adoc_link_checker.config import (
+    ADAPTIVE_INITIAL_CONNECTIONS,
+    ADAPTIVE_LATENCY_TARGET,
+    ADAPTIVE_DECREASE,
+    ADAPTIVE_OVERLOAD_STATUSES,
+)
+from adoc_link_checker.http.checker import TIMEOUT_ERROR, CheckResult
+from adoc_link_checker.utils.url import get_host
+
+logger = logging.getLogger(__name__)
+
+
+class _HostWindow:
+    def __init__(self, size: float):
+        self.size = size
+        self.decreased_at = float("-inf")
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD controller of the concurrent requests allowed per host.
+
+    - additive increase: a successful response faster than
+      `latency_target` grows the window by 1/window, i.e. about one
+      connection per window's worth of healthy responses
+    - multiplicative decrease: a 429/503 or a timeout multiplies the
+      window by `decrease` (never below 1); requests sent before the
+      last decrease do not shrink it again, so a burst of errors
+      counts once
+    - slow but successful responses hold the window
+
+    Windows never exceed the ceiling given by the caller (the static
+    host connection limit). `learned` seeds windows from a previous
+    run. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        initial: int = ADAPTIVE_INITIAL_CONNECTIONS,
+        latency_target: float = ADAPTIVE_LATENCY_TARGET,
+        decrease: float = ADAPTIVE_DECREASE,
+        learned: Optional[dict[str, float]] = None,
+    ):
+        self.initial = initial
+        self.latency_target = latency_target
+        self.decrease = decrease
+        self.backoffs = 0
+
+        self._windows = {
+            host: _HostWindow(size)
+            for host, size in (learned or {}).items()
+        }
+        self._lock = threading.Lock()
+
+    def limit(self, host: str, ceiling: int) -> int:
+        """
+        Return the concurrent requests currently allowed to a host.
+        """
+        with self._lock:
+            window = self._windows.get(host)
+            size = window.size if window is not None else self.initial
+        return max(1, min(int(size), ceiling))
+
+    def record(
+        self,
+        url: str,
+        result: CheckResult,
+        started: float,
+        ceiling: int,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Adjust the window of the URL's host after a response.
+
+        `started` is the monotonic time the request was sent.
+        """
+        now = time.monotonic() if now is None else now
+        host = get_host(url)
+        overloaded = (
+            result.status in ADAPTIVE_OVERLOAD_STATUSES
+            or result.error == TIMEOUT_ERROR
+        )
+
+        with self._lock:
+            window = self._windows.setdefault(host, _HostWindow(self.initial))
+
+            if overloaded:
+                if started < window.decreased_at:
+                    return
+                size = max(1.0, window.size * self.decrease)
+                if size < window.size:
+                    self.backoffs += 1
+                    logger.debug(
+                        f"📉 {host} overloaded (status {result.status}), "
+                        f"concurrency {window.size:.1f} -> {size:.1f}"
+                    )
+                window.size = size
+                window.decreased_at = now
+                return
+
+            if result.ok and now - started <= self.latency_target:
+                window.size = min(window.size + 1 / window.size, float(ceiling))
+
+    def limits(self) -> dict[str, float]:
+        """
+        Return the learned window of every host seen.
+        """
+        with self._lock:
+            return {host: window.size for host, window in self._windows.items()}
@@ -0,0 +1,126 @@
+import time
+import logging
+import threading
+
+from adoc_link_checker.config import BREAKER_THRESHOLD, BREAKER_RESET_TIMEOUT
+from adoc_link_checker.utils.url import get_host
+
+logger = logging.getLogger(__name__)
+
+
+class _HostCircuit:
+    def __init__(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker for dead or unreachable hosts.
+
+    - closed: requests go through; `threshold` consecutive
+      connection-level failures (DNS, refused, TLS, connect timeout)
+      open the circuit
+    - open: requests are failed fast without touching the network
+    - half-open: after `reset_timeout` seconds a single probe request
+      is let through; success closes the circuit, failure reopens it
+
+    Any HTTP response, even an error status, proves the host is
+    reachable and resets the failure count. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+
+        self._hosts: dict[str, _HostCircuit] = {}
+        self._tripped: set[str] = set()
+        self._lock = threading.Lock()
+
+    def is_open(self, url: str) -> bool:
+        """
+        Return True if requests to the URL's host must fail fast.
+
+        Unlike `allow`, never grants the half-open probe.
+        """
+        host = get_host(url)
+        with self._lock:
+            circuit = self._hosts.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return False
+            return circuit.probing or (
+                time.monotonic() - circuit.opened_at < self.reset_timeout
+            )
+
+    def allow(self, url: str) -> bool:
+        """
+        Return True if a request to the URL's host may be sent.
+        """
+        host = get_host(url)
+        with self._lock:
+            circuit = self._hosts.get(host)
+            if circuit is None or circuit.opened_at is None:
+                return True
+
+            if circuit.probing:
+                return False
+
+            if time.monotonic() - circuit.opened_at < self.reset_timeout:
+                return False
+
+            circuit.probing = True
+            logger.debug(f"🔌 Probing {host} (circuit half-open)")
+            return True
+
+    def release(self, url: str) -> None:
+        """
+        Give up the half-open probe of the URL's host without outcome,
+        so that the next request may probe again.
+        """
+        host = get_host(url)
+        with self._lock:
+            circuit = self._hosts.get(host)
+            if circuit is not None:
+                circuit.probing = False
+
+    def record(self, url: str, reachable: bool) -> None:
+        """
+        Record whether a request reached the URL's host.
+        """
+        host = get_host(url)
+        with self._lock:
+            circuit = self._hosts.setdefault(host, _HostCircuit())
+
+            if reachable:
+                if circuit.opened_at is not None:
+                    logger.info(f"🔌 {host} is reachable again, circuit closed")
+                circuit.failures = 0
+                circuit.opened_at = None
+                circuit.probing = False
+                return
+
+            circuit.failures += 1
+            if circuit.probing or (
+                circuit.opened_at is None
+                and circuit.failures >= self.threshold
+            ):
+                if circuit.opened_at is None:
+                    self._tripped.add(host)
+                    logger.warning(
+                        f"⚡ {host} unreachable after {circuit.failures} "
+                        f"consecutive failures, failing its URLs fast"
+                    )
+                circuit.opened_at = time.monotonic()
+                circuit.probing = False
+
+    def tripped_hosts(self) -> list[str]:
+        """
+        Return the hosts whose circuit opened during the run.
+        """
+        with self._lock:
+            return sorted(self._tripped)
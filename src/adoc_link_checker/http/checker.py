@@ -1,24 +1,159 @@
 import logging
 import requests
+from dataclasses import dataclass
+from typing import Optional
 
 from requests.adapters import HTTPAdapter
+from urllib3.exceptions import LocationValueError
 from urllib3.util.retry import Retry
 
-from adoc_link_checker.config import USER_AGENT, RETRY_CONFIG
+from adoc_link_checker.config import (
+    USER_AGENT,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    GET_READ_LIMIT,
+)
+from adoc_link_checker.http.dns import DnsCache, pool_classes
+from adoc_link_checker.http.methods import HostMethodCache
+from adoc_link_checker.http.retry import RETRY_AFTER_STATUSES, parse_retry_after
 from adoc_link_checker.utils.url import is_blacklisted
 
 logger = logging.getLogger(__name__)
 
+CONNECTION_ERROR = "connection"
+TIMEOUT_ERROR = "timeout"
+REQUEST_ERROR = "request"
+INVALID_URL = "invalid_url"
+CIRCUIT_OPEN = "circuit_open"
 
-def create_session() -> requests.Session:
+
+@dataclass(frozen=True)
+class CheckResult:
+    """
+    Outcome of a URL check.
+
+    `status` is the final HTTP status code, or None when no response
+    was received (network error).
+
+    Validators (`etag`, `last_modified`) and the final redirect target
+    are kept to revalidate the URL with a conditional request later;
+    `revalidated` is True when the server answered 304 Not Modified.
+
+    `retry_after` is the delay (seconds) requested by the server with
+    a 429 or 503 response, if any.
+
+    `error` tells why no response was received: CONNECTION_ERROR (DNS,
+    refused, TLS, connect timeout), TIMEOUT_ERROR (connected, but no
+    answer in time), REQUEST_ERROR, or, when the request was not even
+    sent, INVALID_URL (unparsable host) or CIRCUIT_OPEN.
+
+    `received` is the number of body bytes read (GET fallback only).
+    """
+
+    ok: bool
+    status: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    final_url: Optional[str] = None
+    revalidated: bool = False
+    retry_after: Optional[float] = None
+    error: Optional[str] = None
+    received: int = 0
+
+    @property
+    def unreachable(self) -> bool:
+        """
+        True when the host itself could not be reached.
+
+        A read timeout is not: the host accepted the connection and is
+        only slow to answer.
+        """
+        return self.error == CONNECTION_ERROR
+
+    def conditional_headers(self) -> dict[str, str]:
+        """
+        Return the headers revalidating this result.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CountingAdapter(HTTPAdapter):
+    """
+    HTTPAdapter keeping track of connections opened and requests sent.
+
+    Counters of pools evicted from the pool manager are preserved.
+    With a `dns_cache`, connections resolve their host through it.
+    """
+
+    def __init__(self, *args, dns_cache: Optional[DnsCache] = None, **kwargs):
+        self.dns_cache = dns_cache
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if self.dns_cache is not None:
+            self.poolmanager.pool_classes_by_scheme = pool_classes(
+                self.dns_cache
+            )
+        self._retired_connections = 0
+        self._retired_requests = 0
+        self.poolmanager.pools.dispose_func = self._retire_pool
+
+    def _retire_pool(self, pool) -> None:
+        self._retired_connections += pool.num_connections
+        self._retired_requests += pool.num_requests
+        pool.close()
+
+    def connection_stats(self) -> tuple[int, int]:
+        """
+        Return (connections opened, requests sent).
+        """
+        connections = self._retired_connections
+        requests_sent = self._retired_requests
+
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                requests_sent += pool.num_requests
+
+        return connections, requests_sent
+
+
+def create_session(
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE,
+    dns_cache: Optional[DnsCache] = None,
+) -> requests.Session:
     """
-    Create a configured HTTP session with retries and User-Agent.
+    Create a configured HTTP session with User-Agent.
+
+    - pool_connections: number of host pools kept by the session
+    - pool_maxsize: number of keep-alive connections kept per host
+    - dns_cache: run-wide DNS cache shared by the sessions
+
+    The session never retries nor sleeps: retries are scheduled by the
+    check engine (see RetryPolicy), so workers stay busy meanwhile.
     """
     session = requests.Session()
-    retries = Retry(**RETRY_CONFIG)
+    retries = Retry(total=0, read=False, redirect=False, raise_on_status=False)
 
-    session.mount("https://", HTTPAdapter(max_retries=retries))
-    session.mount("http://", HTTPAdapter(max_retries=retries))
+    for prefix in ("https://", "http://"):
+        session.mount(
+            prefix,
+            CountingAdapter(
+                max_retries=retries,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                dns_cache=dns_cache,
+            ),
+        )
     session.headers.update({"User-Agent": USER_AGENT})
 
     return session
@@ -34,30 +169,159 @@ def check_url(
     Check if a URL is accessible.
     Strategy: HEAD first, fallback to GET.
     """
-    if is_blacklisted(url, list(blacklist)):
+    if is_blacklisted(url, blacklist):
         logger.debug(f"Ignoring blacklisted URL: {url}")
         return True
 
+    return probe_url(session, url, timeout).ok
+
+
+def _release(response: requests.Response, limit: int) -> int:
+    """
+    Read at most `limit` bytes of a streamed body, then release it.
+
+    A fully read body returns the connection to the pool; a larger one
+    is closed instead of being downloaded. Returns the bytes read.
+    """
+    read = 0
     try:
-        response = session.head(
-            url,
-            timeout=timeout,
-            allow_redirects=True,
-        )
+        for chunk in response.iter_content(chunk_size=8192):
+            read += len(chunk)
+            if read >= limit:
+                break
+    except requests.RequestException:
+        pass
+    finally:
+        response.close()
+    return read
 
-        if response.status_code >= 400:
-            logger.debug(
-                f"HEAD failed for {url} "
-                f"(status {response.status_code}), retrying with GET"
-            )
-            response = session.get(
-                url,
+
+def _light_get(
+    session: requests.Session,
+    url: str,
+    timeout: int,
+    headers: dict[str, str],
+) -> tuple[requests.Response, int]:
+    """
+    GET only the first byte of a URL and release the connection.
+
+    Returns the response and the body bytes read.
+    """
+    response = session.get(
+        url,
+        timeout=timeout,
+        stream=True,
+        headers={**headers, "Range": "bytes=0-0"},
+    )
+    return response, _release(response, GET_READ_LIMIT)
+
+
+def _is_ok(status: int) -> bool:
+    # 416: the resource exists but is empty, so byte 0 is out of range
+    return status < 400 or status == 416
+
+
+def probe_url(
+    session: requests.Session,
+    url: str,
+    timeout: int,
+    previous: Optional[CheckResult] = None,
+    methods: Optional[HostMethodCache] = None,
+) -> CheckResult:
+    """
+    Probe a URL over HTTP and return the detailed outcome.
+    Strategy: HEAD first, fallback to a lightweight GET.
+
+    The GET fallback only asks for the first byte (`Range: bytes=0-0`),
+    reads at most GET_READ_LIMIT bytes and always releases the
+    connection. With `methods`, hosts rejecting HEAD are remembered and
+    later URLs on them go straight to the GET.
+
+    When a `previous` accessible result carries validators, the request
+    is made conditional (If-None-Match / If-Modified-Since) against its
+    final redirect target, and 304 Not Modified counts as success.
+    """
+    headers = {}
+    target = url
+
+    if previous is not None and previous.ok:
+        headers = previous.conditional_headers()
+        if headers and previous.final_url:
+            target = previous.final_url
+
+    received = 0
+
+    try:
+        if methods is not None and methods.skip_head(target):
+            response, received = _light_get(session, target, timeout, headers)
+        else:
+            response = session.head(
+                target,
                 timeout=timeout,
-                stream=True,
+                allow_redirects=True,
+                headers=headers,
             )
+            response.close()
 
-        return response.status_code < 400
+            # 429: the host asks to slow down, a GET would be rejected too
+            if response.status_code >= 400 and response.status_code != 429:
+                head_status = response.status_code
+                logger.debug(
+                    f"HEAD failed for {url} "
+                    f"(status {head_status}), retrying with GET"
+                )
+                response, received = _light_get(
+                    session,
+                    target,
+                    timeout,
+                    headers,
+                )
+                if methods is not None:
+                    methods.learn(target, head_status, response.status_code)
+
+        if response.status_code == 304 and headers:
+            logger.debug(f"🔄 Not modified: {url}")
+            return CheckResult(
+                ok=True,
+                status=304,
+                etag=response.headers.get("ETag", previous.etag),
+                last_modified=response.headers.get(
+                    "Last-Modified",
+                    previous.last_modified,
+                ),
+                final_url=previous.final_url,
+                revalidated=True,
+                received=received,
+            )
+
+        retry_after = None
+        if response.status_code in RETRY_AFTER_STATUSES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+        return CheckResult(
+            ok=_is_ok(response.status_code),
+            status=response.status_code,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            final_url=response.url or url,
+            retry_after=retry_after,
+            received=received,
+        )
+
+    # ConnectTimeout is both a ConnectionError and a Timeout
+    except requests.ConnectionError as e:
+        logger.warning(f"⚠️ {url} failed: {e}")
+        return CheckResult(ok=False, error=CONNECTION_ERROR)
+
+    except requests.Timeout as e:
+        logger.warning(f"⚠️ {url} failed: {e}")
+        return CheckResult(ok=False, error=TIMEOUT_ERROR)
 
     except requests.RequestException as e:
         logger.warning(f"⚠️ {url} failed: {e}")
-        return False
+        return CheckResult(ok=False, error=REQUEST_ERROR)
+
+    # Raised by urllib3 for hosts it cannot parse (e.g. an empty label)
+    except LocationValueError as e:
+        logger.warning(f"⚠️ {url} is invalid: {e}")
+        return CheckResult(ok=False, error=INVALID_URL)
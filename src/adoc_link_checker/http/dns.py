@@ -0,0 +1,222 @@
+import sys
+import time
+import socket
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, Optional, Union
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    NameResolutionError,
+    NewConnectionError,
+)
+from urllib3.util.connection import allowed_gai_family, create_connection
+
+from adoc_link_checker.config import DNS_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# getaddrinfo errors meaning the name does not exist (not transient)
+_NOT_FOUND_ERRORS = {
+    code
+    for code in (
+        getattr(socket, "EAI_NONAME", None),
+        getattr(socket, "EAI_NODATA", None),
+    )
+    if code is not None
+}
+
+
+class DnsCache:
+    """
+    Run-wide, thread-safe DNS cache.
+
+    - hosts are resolved once per run, whatever the number of sessions
+    - names that do not exist (NXDOMAIN) are cached as failures, so
+      every URL on such a host fails without another lookup
+    - transient failures are not cached
+    - time spent resolving is accounted separately from HTTP time
+    """
+
+    def __init__(self):
+        self._entries: dict[str, Union[list[str], socket.gaierror]] = {}
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+        self.resolve_time = 0.0
+
+    def resolve(self, host: str) -> list[str]:
+        """
+        Return the addresses of a host; raise socket.gaierror on failure.
+        """
+        key = host.lower().rstrip(".")
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+
+        if entry is None:
+            entry = self._lookup(key)
+
+        if isinstance(entry, socket.gaierror):
+            raise entry
+        return entry
+
+    def _lookup(self, host: str) -> Union[list[str], socket.gaierror]:
+        start = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(
+                host,
+                None,
+                allowed_gai_family(),
+                socket.SOCK_STREAM,
+            )
+            entry: Union[list[str], socket.gaierror] = list(
+                dict.fromkeys(info[4][0] for info in infos)
+            )
+        except socket.gaierror as e:
+            if e.errno not in _NOT_FOUND_ERRORS:
+                raise
+            entry = e
+        except UnicodeError as e:
+            # Malformed name (empty or over-long label): it cannot exist
+            entry = socket.gaierror(socket.EAI_NONAME, f"Invalid host: {e}")
+        finally:
+            with self._lock:
+                self.lookups += 1
+                self.resolve_time += time.perf_counter() - start
+
+        with self._lock:
+            self._entries[host] = entry
+        return entry
+
+    def not_found(self, host: str) -> bool:
+        """
+        Return True if the host is known not to exist.
+        """
+        with self._lock:
+            entry = self._entries.get(host.lower().rstrip("."))
+        return isinstance(entry, socket.gaierror)
+
+    def prefetch(self, hosts: Iterable[str], workers: int = DNS_WORKERS) -> None:
+        """
+        Resolve hosts concurrently ahead of checking.
+        """
+        hosts = [host for host in set(hosts) if host]
+        if not hosts:
+            return
+
+        def resolve_quietly(host: str) -> None:
+            try:
+                self.resolve(host)
+            except OSError as e:
+                logger.debug(f"DNS lookup failed for {host}: {e}")
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(hosts))),
+            thread_name_prefix="adocx-dns",
+        ) as executor:
+            list(executor.map(resolve_quietly, hosts))
+
+    def stats(self) -> dict[str, float]:
+        """
+        Return lookup counters and the cumulated resolution time.
+        """
+        with self._lock:
+            return {
+                "hosts": len(self._entries),
+                "not_found": sum(
+                    isinstance(entry, socket.gaierror)
+                    for entry in self._entries.values()
+                ),
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "resolve_time": self.resolve_time,
+            }
+
+
+class _CachedDnsMixin:
+    """
+    urllib3 connection resolving its host through a DnsCache.
+
+    Only the socket is opened on the resolved address, with urllib3's
+    public `create_connection`; TLS SNI, certificate checks and the Host
+    header still use the host name.
+    """
+
+    def __init__(self, *args, dns_cache: Optional[DnsCache] = None, **kwargs):
+        self.dns_cache = dns_cache
+        super().__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        if self.dns_cache is None:
+            return super()._new_conn()
+
+        try:
+            addresses = self.dns_cache.resolve(self.host)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+
+        if not addresses:
+            error = socket.gaierror(socket.EAI_NONAME, "No address found")
+            raise NameResolutionError(self.host, self, error)
+
+        for address in addresses[:-1]:
+            try:
+                return self._connect(address)
+            except (NewConnectionError, ConnectTimeoutError) as e:
+                logger.debug(f"Connection to {address} failed: {e}")
+        return self._connect(addresses[-1])
+
+    def _connect(self, address: str) -> socket.socket:
+        # Same error mapping as urllib3's HTTPConnection._new_conn
+        try:
+            sock = create_connection(
+                (address, self.port),
+                self.timeout,
+                source_address=self.source_address,
+                socket_options=self.socket_options,
+            )
+        except socket.timeout as e:
+            raise ConnectTimeoutError(
+                self,
+                f"Connection to {self.host} timed out. "
+                f"(connect timeout={self.timeout})",
+            ) from e
+        except OSError as e:
+            raise NewConnectionError(
+                self, f"Failed to establish a new connection: {e}"
+            ) from e
+
+        sys.audit("http.client.connect", self, self.host, self.port)
+        return sock
+
+
+class CachedDnsHTTPConnection(_CachedDnsMixin, HTTPConnection):
+    pass
+
+
+class CachedDnsHTTPSConnection(_CachedDnsMixin, HTTPSConnection):
+    pass
+
+
+class CachedDnsHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = CachedDnsHTTPConnection
+
+
+class CachedDnsHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = CachedDnsHTTPSConnection
+
+
+def pool_classes(dns_cache: DnsCache) -> dict:
+    """
+    Return urllib3 pool classes by scheme resolving through `dns_cache`.
+    """
+    return {
+        "http": partial(CachedDnsHTTPConnectionPool, dns_cache=dns_cache),
+        "https": partial(CachedDnsHTTPSConnectionPool, dns_cache=dns_cache),
+    }
@@ -0,0 +1,53 @@
+import logging
+import threading
+
+from adoc_link_checker.config import HEAD_UNSUPPORTED_STATUSES
+from adoc_link_checker.utils.url import get_host
+
+logger = logging.getLogger(__name__)
+
+
+class HostMethodCache:
+    """
+    Remember the hosts that do not support HEAD requests.
+
+    A host is learned when HEAD fails with one of
+    HEAD_UNSUPPORTED_STATUSES (e.g. 405 Method Not Allowed) while the
+    GET fallback succeeds. Later URLs on that host skip HEAD and go
+    straight to a lightweight GET. A 403 is not learned: access rules
+    are often per path, so it only triggers the GET for its own URL.
+    Thread-safe.
+    """
+
+    def __init__(self):
+        self._get_only: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._get_only)
+
+    def skip_head(self, url: str) -> bool:
+        """
+        Return True if HEAD is known to be unsupported by the URL's host.
+        """
+        host = get_host(url)
+        with self._lock:
+            return host in self._get_only
+
+    def learn(self, url: str, head_status: int, get_status: int) -> None:
+        """
+        Record the outcome of a HEAD request followed by a GET fallback.
+        """
+        if head_status not in HEAD_UNSUPPORTED_STATUSES or get_status >= 400:
+            return
+
+        host = get_host(url)
+        with self._lock:
+            if host in self._get_only:
+                return
+            self._get_only.add(host)
+
+        logger.debug(
+            f"🧠 {host} rejects HEAD (status {head_status}), using GET"
+        )
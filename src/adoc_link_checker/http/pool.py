@@ -0,0 +1,96 @@
+import logging
+import threading
+from typing import Optional
+
+import requests
+
+from adoc_link_checker.config import POOL_CONNECTIONS, POOL_MAXSIZE
+from adoc_link_checker.http.checker import create_session
+from adoc_link_checker.http.dns import DnsCache
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPool:
+    """
+    One HTTP session per worker thread, kept for the whole run.
+
+    Sessions (and their urllib3 connection pools) are reused across
+    files, so keep-alive connections and TLS sessions opened for a
+    host serve every later request to that host from the same thread.
+    All sessions share the optional run-wide `dns_cache`.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        dns_cache: Optional[DnsCache] = None,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.dns_cache = dns_cache
+
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> requests.Session:
+        """
+        Return the session bound to the current thread.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = create_session(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                dns_cache=self.dns_cache,
+            )
+            with self._lock:
+                self._sessions.append(session)
+            self._local.session = session
+        return session
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return keep-alive counters aggregated over all sessions.
+
+        - connections: new TCP connections opened
+        - requests: HTTP requests sent
+        - reused: requests served by an already open connection
+        """
+        connections = requests_sent = 0
+
+        with self._lock:
+            sessions = list(self._sessions)
+
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                opened, sent = adapter.connection_stats()
+                connections += opened
+                requests_sent += sent
+
+        return {
+            "sessions": len(sessions),
+            "connections": connections,
+            "requests": requests_sent,
+            "reused": max(requests_sent - connections, 0),
+        }
+
+    def close(self) -> None:
+        """
+        Close every session and log keep-alive counters.
+        """
+        with self._lock:
+            sessions = list(self._sessions)
+
+        for session in sessions:
+            session.close()
+
+        stats = self.stats()
+        logger.debug(
+            f"🔌 {stats['requests']} request(s) over "
+            f"{stats['connections']} new connection(s), "
+            f"{stats['reused']} reused keep-alive "
+            f"({stats['sessions']} session(s))"
+        )
@@ -0,0 +1,163 @@
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from adoc_link_checker.config import ADAPTIVE_MAX_CONNECTIONS
+from adoc_link_checker.http.adaptive import AdaptiveConcurrency
+from adoc_link_checker.http.checker import CheckResult
+from adoc_link_checker.utils.url import get_host
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """
+    Throttling rules for one host.
+
+    - rate: maximum requests per second (0 = unlimited)
+    - max_connections: maximum concurrent requests (0 = unlimited)
+    """
+
+    rate: float
+    max_connections: int
+
+
+class _HostState:
+    def __init__(self, limit: HostLimit):
+        self.limit = limit
+        self.next_slot = 0.0
+        self.active = 0
+
+
+class HostRateLimiter:
+    """
+    Per-host token bucket limiter with a cap on concurrent connections.
+
+    Each host gets its own bucket, so throttling a sensitive host never
+    slows down requests to unrelated hosts.
+
+    Overrides match the exact domain and its subdomains.
+
+    With an `adaptive` controller, the connection cap of each host
+    follows its observed health (AIMD) within the static limit, or
+    ADAPTIVE_MAX_CONNECTIONS when the static limit is unlimited.
+    """
+
+    def __init__(
+        self,
+        default: HostLimit,
+        overrides: Optional[dict[str, HostLimit]] = None,
+        adaptive: Optional[AdaptiveConcurrency] = None,
+    ):
+        self.default = default
+        self.adaptive = adaptive
+        self.overrides = {
+            domain.lower(): limit
+            for domain, limit in (overrides or {}).items()
+        }
+
+        self._hosts: dict[str, _HostState] = {}
+        self._cond = threading.Condition()
+
+    def limit_for(self, host: str) -> HostLimit:
+        """
+        Return the limit applying to a host (most specific override wins).
+        """
+        labels = host.lower().split(".")
+        for i in range(len(labels)):
+            limit = self.overrides.get(".".join(labels[i:]))
+            if limit is not None:
+                return limit
+        return self.default
+
+    def connection_limit(self, host: str) -> int:
+        """
+        Return the concurrent requests currently allowed to a host
+        (0 = unlimited).
+        """
+        static = self.limit_for(host).max_connections
+        if self.adaptive is None:
+            return static
+        return self.adaptive.limit(host, static or ADAPTIVE_MAX_CONNECTIONS)
+
+    def observe(self, url: str, result: CheckResult, started: float) -> None:
+        """
+        Feed the outcome of a request to the adaptive controller, if any.
+
+        `started` is the monotonic time the request was sent.
+        """
+        if self.adaptive is None:
+            return
+
+        host = get_host(url)
+        static = self.limit_for(host).max_connections
+        self.adaptive.record(
+            url,
+            result,
+            started,
+            static or ADAPTIVE_MAX_CONNECTIONS,
+        )
+
+        # A wider window may admit waiting requests
+        with self._cond:
+            self._cond.notify_all()
+
+    @contextmanager
+    def acquire(self, url: str) -> Iterator[None]:
+        """
+        Block until a request to the URL's host is allowed.
+
+        The connection slot is held until the context exits.
+        """
+        host = get_host(url)
+        state = self._enter(host)
+        try:
+            wait = self._reserve(state)
+            if wait > 0:
+                logger.debug(f"⏱️ Throttling {host} for {wait:.2f}s")
+                time.sleep(wait)
+            yield
+        finally:
+            self._leave(state)
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.limit_for(host))
+            self._hosts[host] = state
+        return state
+
+    def _enter(self, host: str) -> _HostState:
+        with self._cond:
+            state = self._state(host)
+            while True:
+                limit = self.connection_limit(host)
+                if not limit or state.active < limit:
+                    break
+                self._cond.wait()
+            state.active += 1
+            return state
+
+    def _leave(self, state: _HostState) -> None:
+        with self._cond:
+            state.active -= 1
+            self._cond.notify_all()
+
+    def _reserve(self, state: _HostState) -> float:
+        """
+        Take the next token of the host bucket.
+
+        Returns how long the caller must wait before sending its request.
+        """
+        if state.limit.rate <= 0:
+            return 0.0
+
+        with self._cond:
+            now = time.monotonic()
+            start = max(now, state.next_slot)
+            state.next_slot = start + 1 / state.limit.rate
+            return start - now
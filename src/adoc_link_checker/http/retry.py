@@ -0,0 +1,71 @@
+import time
+import logging
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from adoc_link_checker.config import RETRY_CONFIG, RETRY_MAX_DELAY
+
+logger = logging.getLogger(__name__)
+
+# Statuses for which the server may ask to retry later
+RETRY_AFTER_STATUSES = (429, 503)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed check.
+
+    - max_attempts: attempts per URL, first one included (1 = no retry)
+    - backoff_factor: attempt n is retried after backoff_factor * 2 ** (n - 1)
+    - statuses: HTTP statuses worth retrying (network errors always are)
+    - max_delay: cap applied to the backoff and to Retry-After
+    """
+
+    max_attempts: int = RETRY_CONFIG["total"] + 1
+    backoff_factor: float = RETRY_CONFIG["backoff_factor"]
+    statuses: frozenset[int] = frozenset(
+        [*RETRY_CONFIG["status_forcelist"], 429]
+    )
+    max_delay: float = RETRY_MAX_DELAY
+
+    def delay(
+        self,
+        ok: bool,
+        status: Optional[int],
+        attempt: int,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Return the delay before the next attempt, or None if the check
+        is complete (success, permanent failure or attempts exhausted).
+
+        A server-provided `retry_after` wins over the backoff.
+        """
+        if ok or attempt >= self.max_attempts:
+            return None
+        if status is not None and status not in self.statuses:
+            return None
+
+        if retry_after is None:
+            retry_after = self.backoff_factor * 2 ** (attempt - 1)
+        return min(max(retry_after, 0.0), self.max_delay)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delay in seconds or HTTP date).
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        logger.debug(f"Ignoring invalid Retry-After header: {value}")
+        return None
@@ -1,14 +1,63 @@
+import time
 import logging
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Optional
 
-from adoc_link_checker.http.checker import check_url
+from adoc_link_checker.http.checker import (
+    CIRCUIT_OPEN,
+    INVALID_URL,
+    CheckResult,
+    probe_url,
+)
 from adoc_link_checker.core.context import LinkCheckContext
 
 logger = logging.getLogger(__name__)
 
+HOST_UNREACHABLE = "Host unreachable (circuit open)"
+HOST_NOT_FOUND = "Host not found (DNS)"
+MALFORMED_URL = "Invalid URL"
+
+
+@dataclass(frozen=True)
+class Attempt:
+    """
+    Outcome of one scheduling step of a URL check.
+
+    - number: attempts made so far (0 = answered without HTTP request)
+    - retry_in: delay before the next attempt, None when complete
+    - host_pause: how long the whole host asked to be left alone
+    """
+
+    ok: bool
+    number: int
+    retry_in: Optional[float] = None
+    host_pause: Optional[float] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.retry_in is None
+
 
 class LinkChecker:
     """
     Service responsible for checking URLs with caching support.
+
+    Concurrent checks of the same URL are coalesced: only the first
+    caller hits the network, the others wait for its result.
+
+    Only real HTTP checks go through the per-host rate limiter:
+    cache hits and blacklisted URLs are never delayed.
+
+    Expired cache entries carrying validators are revalidated with a
+    conditional request instead of a full check.
+
+    URLs on a host whose circuit breaker is open are failed fast,
+    without request nor retry.
+
+    Failed attempts are retried according to the context retry policy:
+    `check` sleeps between attempts, while the check engine drives
+    `step` and schedules retries without blocking a worker.
     """
 
     def __init__(self, session, context: LinkCheckContext):
@@ -18,18 +67,156 @@ class LinkChecker:
     def check(self, url: str) -> bool:
         """
         Check a URL, using the shared cache when possible.
+
+        Retries are waited for in the calling thread.
+        """
+        attempt = self.step(url)
+        while not attempt.complete:
+            time.sleep(attempt.retry_in)
+            attempt = self.step(url, attempt.number + 1)
+        return attempt.ok
+
+    def step(self, url: str, number: int = 1) -> Attempt:
+        """
+        Perform attempt `number` of a URL check.
+
+        The first step answers from the cache, coalesces with an
+        in-flight check or claims the check; while the returned attempt
+        is not complete, the caller owns the check and must call `step`
+        again with the next number once `retry_in` has elapsed.
+        """
+        if number == 1:
+            ok = self._start(url)
+            if ok is not None:
+                return Attempt(ok=ok, number=0)
+
+        result, retry_in = self._attempt(url, number)
+
+        host_pause = result.retry_after
+        if host_pause is None and result.status == 429:
+            host_pause = retry_in
+
+        return Attempt(
+            ok=result.ok,
+            number=number,
+            retry_in=retry_in,
+            host_pause=host_pause,
+        )
+
+    def _start(self, url: str) -> Optional[bool]:
+        """
+        Return the result of a URL known without HTTP request, or None
+        after claiming its check.
         """
         cached = self.context.get_cached(url)
         if cached is not None:
             logger.debug(f"🔁 Cached result for {url}")
             return cached
 
-        result = check_url(
-            session=self.session,
-            url=url,
-            timeout=self.context.timeout,
-            blacklist=tuple(self.context.blacklist),
-        )
+        future, owner = self.context.begin_check(url)
+        if not owner:
+            logger.debug(f"⏳ Waiting for in-flight check of {url}")
+            return future.result()
+
+        if self.context.blacklist_matcher.match(url):
+            logger.debug(f"Ignoring blacklisted URL: {url}")
+            self.context.finish_check(url, True)
+            return True
+
+        return None
+
+    def _attempt(
+        self,
+        url: str,
+        number: int,
+    ) -> tuple[CheckResult, Optional[float]]:
+        """
+        Send one HTTP attempt; publish the result unless it is retried.
+        """
+        try:
+            result = self._probe(url)
+        except BaseException as e:
+            self.context.finish_check(url, error=e)
+            raise
+
+        if result.error == CIRCUIT_OPEN:
+            logger.debug(f"⚡ Failing fast {url}: host circuit open")
+            self.context.increment("circuit_open")
+            self.context.record_reason(url, HOST_UNREACHABLE)
+            self.context.finish_check(url, False)
+            return result, None
 
-        self.context.set_cached(url, result)
+        self.context.record_attempt(url, number)
+
+        if result.error == INVALID_URL:
+            self.context.record_reason(url, MALFORMED_URL)
+
+        retry_in = None
+        policy = self.context.retry_policy
+        # Retrying cannot fix the URL itself
+        if policy is not None and result.error != INVALID_URL:
+            retry_in = policy.delay(
+                result.ok,
+                result.status,
+                number,
+                result.retry_after,
+            )
+
+        if retry_in is not None:
+            logger.debug(
+                f"🔁 Retrying {url} in {retry_in:.1f}s "
+                f"(attempt {number}, status {result.status})"
+            )
+            self.context.increment("retries")
+            return result, retry_in
+
+        if result.revalidated:
+            self.context.increment("revalidated")
+
+        self.context.persist(url, result)
+        self.context.finish_check(url, result.ok)
+        return result, None
+
+    def _probe(self, url: str) -> CheckResult:
+        breaker = self.context.breaker
+        if breaker is not None and breaker.is_open(url):
+            return CheckResult(ok=False, error=CIRCUIT_OPEN)
+
+        queued = time.monotonic()
+        with self._throttle(url):
+            # The circuit may have opened while waiting for a slot
+            if breaker is not None and not breaker.allow(url):
+                return CheckResult(ok=False, error=CIRCUIT_OPEN)
+
+            started = time.monotonic()
+            try:
+                result = probe_url(
+                    session=self.session,
+                    url=url,
+                    timeout=self.context.timeout,
+                    previous=self.context.previous_result(url),
+                    methods=self.context.methods,
+                )
+            except BaseException:
+                if breaker is not None:
+                    breaker.release(url)
+                raise
+
+        if self.context.metrics is not None:
+            self.context.metrics.observe_request(
+                url,
+                result,
+                latency=time.monotonic() - started,
+                waited=started - queued,
+            )
+        if self.context.rate_limiter is not None:
+            self.context.rate_limiter.observe(url, result, started)
+        if breaker is not None:
+            breaker.record(url, reachable=not result.unreachable)
         return result
+
+    def _throttle(self, url: str):
+        limiter = self.context.rate_limiter
+        if limiter is None:
+            return nullcontext()
+        return limiter.acquire(url)
@@ -0,0 +1,158 @@
+import os
+import json
+import logging
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "adocx"
+
+
+def write_stats_json(output_file: str, snapshot: dict) -> None:
+    """
+    Write the run metrics to a JSON file.
+    """
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, indent=2, ensure_ascii=False)
+
+    logger.info(f"📈 Run metrics written to: {os.path.abspath(output_file)}")
+
+
+def write_prometheus_textfile(output_file: str, snapshot: dict) -> None:
+    """
+    Write the run metrics in the Prometheus text format.
+
+    The file is replaced atomically, as expected by the node exporter
+    textfile collector.
+    """
+    directory = os.path.dirname(os.path.abspath(output_file))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(format_prometheus(snapshot))
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    logger.info(
+        f"📈 Prometheus metrics written to: {os.path.abspath(output_file)}"
+    )
+
+
+def format_prometheus(snapshot: dict) -> str:
+    """
+    Render a metrics snapshot in the Prometheus text exposition format.
+    """
+    lines: list[str] = []
+
+    def metric(name, kind, help_text, samples):
+        name = f"{PREFIX}_{name}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            lines.append(f"{name}{_labels(labels)} {_value(value)}")
+
+    metric(
+        "phase_duration_seconds",
+        "gauge",
+        "Wall time of each run phase.",
+        [({"phase": phase}, seconds) for phase, seconds in snapshot["phases"].items()],
+    )
+    metric(
+        "urls",
+        "gauge",
+        "URLs of the run by kind.",
+        [({"kind": kind}, count) for kind, count in snapshot["urls"].items()],
+    )
+    metric(
+        "cache_lookups_total",
+        "counter",
+        "Result cache lookups by outcome.",
+        [
+            ({"result": "hit"}, snapshot["cache"]["hits"]),
+            ({"result": "miss"}, snapshot["cache"]["misses"]),
+        ],
+    )
+
+    requests = snapshot["requests"]
+    metric(
+        "requests_total",
+        "counter",
+        "HTTP check attempts by host.",
+        [({"host": host}, count) for host, count in requests["by_host"].items()],
+    )
+    metric(
+        "responses_total",
+        "counter",
+        "HTTP check attempts by status code or error.",
+        [
+            ({"status": status}, count)
+            for status, count in requests["by_status"].items()
+        ],
+    )
+    metric(
+        "received_bytes_total",
+        "counter",
+        "Response body bytes read.",
+        [({}, requests["bytes_received"])],
+    )
+    metric(
+        "throttle_wait_seconds_total",
+        "counter",
+        "Time spent waiting for the per-host rate limiter.",
+        [({}, requests["throttle_wait"])],
+    )
+
+    latency = snapshot["latency"]
+    name = f"{PREFIX}_request_duration_seconds"
+    lines.append(f"# HELP {name} Latency of HTTP check attempts.")
+    lines.append(f"# TYPE {name} histogram")
+    for bound, count in latency["buckets"].items():
+        lines.append(f"{name}_bucket{_labels({'le': bound})} {count}")
+    lines.append(f"{name}_bucket{_labels({'le': '+Inf'})} {latency['count']}")
+    lines.append(f"{name}_sum {_value(latency['sum'])}")
+    lines.append(f"{name}_count {latency['count']}")
+
+    metric(
+        "events_total",
+        "counter",
+        "Run counters (retries, revalidations, circuit breaker...).",
+        [({"event": event}, count) for event, count in snapshot["counters"].items()],
+    )
+    metric(
+        "dns",
+        "gauge",
+        "DNS cache statistics.",
+        [({"stat": stat}, value) for stat, value in snapshot["dns"].items()],
+    )
+    metric(
+        "connections",
+        "gauge",
+        "HTTP connection pool statistics.",
+        [
+            ({"stat": stat}, value)
+            for stat, value in snapshot["connections"].items()
+        ],
+    )
+
+    return "\n".join(lines) + "\n"
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{key}="{_escape(str(value))}"' for key, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _value(value) -> str:
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
@@ -0,0 +1,172 @@
+import os
+import json
+import time
+import logging
+import threading
+from typing import Iterable, Iterator, Optional
+
+from adoc_link_checker.config import NDJSON_FLUSH_EVERY, NDJSON_FLUSH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class NdjsonReportWriter:
+    """
+    Stream the report as newline-delimited JSON, one record per line.
+
+    - {"type": "url", ...}: result of one URL and the files citing it,
+      written as soon as the URL is settled
+    - {"type": "unchecked", ...}: URL left unchecked when the time
+      budget ran out, and the files citing it
+    - {"type": "summary", ...}: totals, written last by a finished run
+
+    Records are buffered and flushed every `flush_every` records or
+    `flush_interval` seconds, so the file can be tailed while the run
+    progresses. A run cut short leaves a valid prefix, without summary.
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        output_file: str,
+        flush_every: int = NDJSON_FLUSH_EVERY,
+        flush_interval: float = NDJSON_FLUSH_INTERVAL,
+    ):
+        self.output_file = output_file
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.written = 0
+
+        self._file = open(output_file, "w", encoding="utf-8")
+        self._pending = 0
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "NdjsonReportWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write_result(
+        self,
+        url: str,
+        ok: bool,
+        reason: Optional[str],
+        attempts: int,
+        files: list[str],
+    ) -> None:
+        """
+        Append the result of a URL.
+        """
+        self.write({
+            "type": "url",
+            "url": url,
+            "ok": ok,
+            "reason": reason,
+            "attempts": attempts,
+            "files": files,
+            "checked_at": round(time.time(), 3),
+        })
+
+    def write_unchecked(self, url: str, files: list[str]) -> None:
+        """
+        Append a URL left unchecked.
+        """
+        self.write({"type": "unchecked", "url": url, "files": files})
+
+    def write_summary(self, **totals: int) -> None:
+        """
+        Append the summary record closing a finished run.
+        """
+        self.write({"type": "summary", **totals})
+
+    def write(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self.written += 1
+            self._pending += 1
+            now = time.monotonic()
+            if (
+                self._pending >= self.flush_every
+                or now - self._flushed_at >= self.flush_interval
+            ):
+                self._flush(now)
+
+    def _flush(self, now: float) -> None:
+        self._file.flush()
+        self._pending = 0
+        self._flushed_at = now
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def read_records(input_file: str) -> Iterator[dict]:
+    """
+    Yield the records of an NDJSON report.
+
+    Lines that do not parse, like the last line of a run killed while
+    writing, are skipped with a warning.
+    """
+    with open(input_file, encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(
+                    f"⚠️ Skipping invalid record at {input_file}:{number}"
+                )
+
+
+def merge_results(input_files: Iterable[str]) -> dict[str, dict]:
+    """
+    Merge the URL records of NDJSON reports, the last record of a URL
+    winning (later files and later lines take precedence).
+    """
+    merged: dict[str, dict] = {}
+    for input_file in input_files:
+        for record in read_records(input_file):
+            if record.get("type") == "url":
+                merged.pop(record["url"], None)
+                merged[record["url"]] = record
+    return merged
+
+
+def to_json_report(records: Iterable[dict]) -> dict[str, list[tuple]]:
+    """
+    Build the per-file broken links report of the JSON format from URL
+    records: files sorted by path, with their (url, reason, attempts).
+    """
+    broken_links: dict[str, list[tuple]] = {}
+    for record in records:
+        if record["ok"]:
+            continue
+        for file_path in record["files"]:
+            broken_links.setdefault(file_path, []).append(
+                (record["url"], record["reason"], record["attempts"])
+            )
+
+    return {
+        file_path: sorted(broken_links[file_path])
+        for file_path in sorted(broken_links)
+    }
+
+
+def write_ndjson_report(output_file: str, records: Iterable[dict]) -> None:
+    """
+    Write URL records to an NDJSON report.
+    """
+    with NdjsonReportWriter(output_file) as writer:
+        for record in records:
+            writer.write(record)
+
+    logger.info(
+        f"📊 NDJSON report written to: {os.path.abspath(output_file)}"
+    )
@@ -0,0 +1,49 @@
+from typing import Iterable
+from urllib.parse import urlparse
+
+
+class DomainMatcher:
+    """
+    Match hosts against domains and their subdomains.
+
+    Domains are stored in a suffix set: a host is looked up once per
+    label ("a.b.example.com", "b.example.com", "example.com", "com"),
+    whatever the number of domains.
+    """
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self._domains: set[str] = set()
+        for domain in domains:
+            self.add(domain)
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def add(self, domain: str) -> None:
+        domain = domain.strip().lower().strip(".")
+        if domain:
+            self._domains.add(domain)
+
+    def match_host(self, host: str) -> bool:
+        if not self._domains:
+            return False
+
+        host = host.lower()
+        while True:
+            if host in self._domains:
+                return True
+            _, dot, host = host.partition(".")
+            if not dot:
+                return False
+
+    def match(self, url: str) -> bool:
+        """
+        Return True if the URL host is a domain or one of its subdomains.
+        """
+        if not self._domains:
+            return False
+        try:
+            host = urlparse(url).hostname
+        except ValueError:
+            return False
+        return bool(host) and self.match_host(host)
@@ -1,32 +1,54 @@
 import logging
+from typing import Iterable
 
+from adoc_link_checker.utils.matcher import UrlMatcher
 from adoc_link_checker.utils.url import normalize_url
 
 logger = logging.getLogger(__name__)
 
 
-def load_excluded_urls(exclude_from: str | None) -> set[str]:
+def _read_rules(exclude_from: str | None) -> list[str]:
     """
-    Load excluded URLs from a file.
-
-    Rules:
-    - one URL per line
-    - empty lines ignored
-    - lines starting with '#' ignored
-    - URLs are normalized for consistent comparison
+    Read the non-empty, non-comment lines of an exclusion file.
     """
     if not exclude_from:
-        return set()
+        return []
 
     try:
         with open(exclude_from, "r", encoding="utf-8") as f:
-            return {
-                normalize_url(line.strip())
+            return [
+                line.strip()
                 for line in f
                 if line.strip() and not line.strip().startswith("#")
-            }
+            ]
     except Exception as e:
         logger.warning(
             f"Unable to read exclusion file {exclude_from}: {e}"
         )
-        return set()
+        return []
+
+
+def load_excluded_urls(exclude_from: str | None) -> set[str]:
+    """
+    Load excluded URLs from a file.
+
+    Rules:
+    - one URL per line
+    - empty lines ignored
+    - lines starting with '#' ignored
+    - URLs are normalized for consistent comparison
+    """
+    return {normalize_url(line) for line in _read_rules(exclude_from)}
+
+
+def load_url_matcher(
+    exclude_from: str | None,
+    blacklist: Iterable[str] = (),
+) -> UrlMatcher:
+    """
+    Compile the exclusion file and blacklisted domains into one matcher.
+
+    Besides exact URLs, the file accepts prefix (`.../*`), glob,
+    `re:<regex>` and `domain:<domain>` rules (see UrlMatcher).
+    """
+    return UrlMatcher(_read_rules(exclude_from), domains=blacklist)
@@ -0,0 +1,71 @@
+import os
+import logging
+import subprocess
+
+logger = logging.getLogger(__name__)
+
+
+def _run(cwd: str, *args: str) -> str:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except FileNotFoundError:
+        raise ValueError("git executable not found")
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"git {' '.join(args)} failed: {e.stderr.strip()}")
+
+    return result.stdout
+
+
+def _git(cwd: str, *args: str) -> list[str]:
+    return [line for line in _run(cwd, *args).splitlines() if line]
+
+
+def _git_paths(cwd: str, *args: str) -> list[str]:
+    # Output of a -z command: paths verbatim, NUL-separated
+    return [name for name in _run(cwd, *args).split("\0") if name]
+
+
+def changed_files(path: str, ref: str) -> set[str]:
+    """
+    Return the absolute paths of files changed since a git ref.
+
+    Includes committed and uncommitted changes to tracked files, plus
+    untracked files. Deleted files are ignored.
+    """
+    cwd = path if os.path.isdir(path) else os.path.dirname(path) or "."
+
+    toplevel = _git(cwd, "rev-parse", "--show-toplevel")[0]
+    changed = _git_paths(
+        toplevel,
+        "diff",
+        "--name-only",
+        "-z",
+        "--diff-filter=d",
+        ref,
+        "--",
+    )
+    untracked = _git_paths(
+        toplevel,
+        "ls-files",
+        "-z",
+        "--others",
+        "--exclude-standard",
+    )
+
+    return {
+        os.path.normpath(os.path.join(toplevel, name))
+        for name in changed + untracked
+    }
+
+
+def current_branch(path: str) -> str:
+    """
+    Return the name of the branch checked out in `path`.
+    """
+    return _git(path, "rev-parse", "--abbrev-ref", "HEAD")[0]
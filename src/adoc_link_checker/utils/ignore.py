@@ -0,0 +1,124 @@
+import re
+import logging
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Rule:
+    regex: re.Pattern
+    negate: bool
+    dir_only: bool
+
+
+def _translate(pattern: str) -> str:
+    """
+    Translate a gitignore glob into a regular expression.
+    """
+    out: list[str] = []
+    i, n = 0, len(pattern)
+
+    while i < n:
+        c = pattern[i]
+
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[" and "]" in pattern[i + 2:]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+
+        i += 1
+
+    return "".join(out)
+
+
+def _parse(line: str) -> Optional[_Rule]:
+    line = line.rstrip("\n").rstrip()
+    if not line or line.startswith("#"):
+        return None
+
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    anchored = "/" in line
+    regex = _translate(line.lstrip("/"))
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+
+    return _Rule(re.compile(regex), negate, dir_only)
+
+
+class IgnoreRules:
+    """
+    Ignore rules using the .gitignore syntax.
+
+    Supported:
+    - comments and blank lines
+    - `*`, `?`, `[...]` and `**` globs
+    - patterns containing a `/` are anchored to the base directory
+    - trailing `/` only matches directories
+    - `!` re-includes a previously ignored path
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self._rules = [
+            rule for rule in map(_parse, patterns) if rule is not None
+        ]
+
+    @classmethod
+    def from_file(cls, path: str) -> "IgnoreRules":
+        """
+        Load rules from an ignore file (empty if unreadable).
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(f)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Unable to read ignore file {path}: {e}")
+            return cls()
+
+    def __bool__(self) -> bool:
+        return bool(self._rules)
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Match a `/`-separated path relative to the rules base directory.
+
+        Returns True if ignored, False if re-included, None if no
+        rule applies. The last matching rule wins.
+        """
+        result = None
+        for rule in self._rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.fullmatch(rel_path):
+                result = not rule.negate
+        return result
@@ -0,0 +1,117 @@
+import re
+import fnmatch
+import logging
+from typing import Iterable, Optional
+
+from adoc_link_checker.utils.domains import DomainMatcher
+from adoc_link_checker.utils.url import normalize_url
+
+logger = logging.getLogger(__name__)
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+_TERMINAL = ""
+
+
+class UrlMatcher:
+    """
+    Precompiled URL exclusion rules.
+
+    Rule syntax (one per line in an exclusion file):
+    - `https://example.com/page`: exact URL (normalized)
+    - `https://example.com/docs/*`: URL prefix (single trailing `*`)
+    - `https://*.example.com/*.pdf`: glob
+    - `re:<regex>`: regular expression searched in the URL
+    - `domain:example.com`: domain and its subdomains
+
+    Globs and regexes are combined into one pattern each, prefixes
+    into a character trie and domains into a suffix set, so the cost
+    of a lookup does not grow with the number of rules.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[str] = (),
+        domains: Iterable[str] = (),
+    ):
+        self.domains = DomainMatcher(domains)
+        self._exact: set[str] = set()
+        self._prefixes: dict = {}
+        globs: list[str] = []
+        regexes: list[str] = []
+
+        for rule in rules:
+            rule = rule.strip()
+            if not rule or rule.startswith("#"):
+                continue
+
+            if rule.startswith("domain:"):
+                self.domains.add(rule[len("domain:"):])
+            elif rule.startswith("re:"):
+                regexes.append(self._check_regex(rule[len("re:"):]))
+            elif rule.endswith("*") and not _GLOB_CHARS.search(rule[:-1]):
+                self._add_prefix(rule[:-1])
+            elif _GLOB_CHARS.search(rule):
+                globs.append(fnmatch.translate(rule))
+            else:
+                self._exact.add(normalize_url(rule))
+
+        self._glob = self._combine(globs)
+        self._regex = self._combine(r for r in regexes if r)
+
+    @staticmethod
+    def _check_regex(pattern: str) -> str:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            logger.warning(f"Ignoring invalid exclusion regex {pattern!r}: {e}")
+            return ""
+        return pattern
+
+    @staticmethod
+    def _combine(patterns: Iterable[str]) -> Optional[re.Pattern]:
+        patterns = list(patterns)
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+    def _add_prefix(self, prefix: str) -> None:
+        node = self._prefixes
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = True
+
+    def _match_prefix(self, url: str) -> bool:
+        node = self._prefixes
+        if _TERMINAL in node:
+            return True
+        for char in url:
+            node = node.get(char)
+            if node is None:
+                return False
+            if _TERMINAL in node:
+                return True
+        return False
+
+    def __bool__(self) -> bool:
+        return bool(
+            self._exact
+            or self._prefixes
+            or self._glob
+            or self._regex
+            or len(self.domains)
+        )
+
+    def __contains__(self, url: str) -> bool:
+        return self.match(url)
+
+    def match(self, url: str) -> bool:
+        """
+        Return True if the URL matches any rule.
+        """
+        return (
+            url in self._exact
+            or (bool(self._prefixes) and self._match_prefix(url))
+            or self.domains.match(url)
+            or (self._glob is not None and self._glob.match(url) is not None)
+            or (self._regex is not None and self._regex.search(url) is not None)
+        )
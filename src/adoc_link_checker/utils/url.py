@@ -1,6 +1,10 @@
 import logging
+from functools import lru_cache
+from typing import Iterable
 from urllib.parse import urlparse
 
+from adoc_link_checker.utils.domains import DomainMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +20,16 @@ def is_valid_url(url: str) -> bool:
         return False
 
 
+def get_host(url: str) -> str:
+    """
+    Return the lowercased host of a URL ("" if it has none).
+    """
+    try:
+        return (urlparse(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
 def normalize_url(url: str) -> str:
     """
     Normalize a URL by removing fragments, queries,
@@ -36,25 +50,22 @@ def normalize_url(url: str) -> str:
     return url
 
 
-def is_blacklisted(url: str, blacklist: list[str]) -> bool:
+def is_blacklisted(url: str, blacklist: Iterable[str]) -> bool:
     """
     Return True if the URL's domain matches a blacklisted domain.
 
     Matching rules:
     - exact domain match
     - subdomain match
+
+    The matcher of a blacklist is compiled once and reused.
     """
-    try:
-        netloc = urlparse(url).netloc.lower()
-    except ValueError:
-        return False
+    return _blacklist_matcher(tuple(blacklist)).match(url)
 
-    for domain in blacklist:
-        domain = domain.lower()
-        if netloc == domain or netloc.endswith("." + domain):
-            return True
 
-    return False
+@lru_cache(maxsize=16)
+def _blacklist_matcher(blacklist: tuple[str, ...]) -> DomainMatcher:
+    return DomainMatcher(blacklist)
 
 
 def youtube_id_to_url(youtube_id: str) -> str:
@@ -1,6 +1,15 @@
+import json
 from unittest.mock import patch
 
-from adoc_link_checker.cli.commands import check_links_command
+from adoc_link_checker.cli.commands import (
+    check_links_command,
+    cache_prune_command,
+    cache_stats_command,
+    report_merge_command,
+)
+from adoc_link_checker.core.cache import ResultCache
+from adoc_link_checker.http.checker import CheckResult
+from adoc_link_checker.reporting.ndjson import NdjsonReportWriter
 
 
 @patch("adoc_link_checker.cli.commands.run_check")
@@ -49,3 +58,58 @@ def test_check_links_command_fail_on_broken(mock_run):
 
     kwargs = mock_run.call_args.kwargs
     assert kwargs["fail_on_broken"] is True
+
+
+@patch("adoc_link_checker.cli.commands.run_check")
+def test_check_links_command_resume_keeps_checkpointing(mock_run):
+    check_links_command(
+        path="docs",
+        timeout=5,
+        max_workers=1,
+        delay=0,
+        output="out.json",
+        blacklist=(),
+        exclude_from=None,
+        fail_on_broken=False,
+        verbose=0,
+        quiet=True,
+        resume="state.sqlite",
+    )
+
+    run = mock_run.call_args.kwargs["run"]
+    assert run.checkpoint == "state.sqlite"
+    assert run.resume is True
+
+
+def test_cache_commands(tmp_path, capsys):
+    path = str(tmp_path / "cache.sqlite")
+
+    cache = ResultCache(path, ttl_ok=100, ttl_broken=100)
+    cache.put("https://example.com", CheckResult(ok=True, status=200), now=0)
+    cache.close()
+
+    cache_stats_command(cache_file=path, cache_ttl_ok=100, cache_ttl_broken=100)
+    out = capsys.readouterr().out
+    assert "total: 1" in out
+    assert "expired: 1" in out
+
+    cache_prune_command(cache_file=path, cache_ttl_ok=100, cache_ttl_broken=100)
+    assert "Removed 1 expired entry." in capsys.readouterr().out
+
+
+def test_report_merge_command(tmp_path, capsys):
+    partial = str(tmp_path / "partial.ndjson")
+    with NdjsonReportWriter(partial) as writer:
+        writer.write_result("https://a.test", False, "HTTP 404", 1, ["a.adoc"])
+        writer.write_result("https://b.test", False, "Timeout", 4, ["a.adoc"])
+    rerun = str(tmp_path / "rerun.ndjson")
+    with NdjsonReportWriter(rerun) as writer:
+        writer.write_result("https://b.test", True, None, 1, ["a.adoc"])
+    output = tmp_path / "report.json"
+
+    report_merge_command(inputs=(partial, rerun), output=str(output))
+
+    assert json.loads(output.read_text()) == {
+        "a.adoc": [["https://a.test", "HTTP 404", 1]],
+    }
+    assert "Merged 2 URL(s), 1 broken." in capsys.readouterr().out
@@ -1,5 +1,10 @@
+import click
+import pytest
+
 from adoc_link_checker.cli.config import build_check_config
+from adoc_link_checker.cli.types import HostLimitType
 from adoc_link_checker.config import BLACKLIST
+from adoc_link_checker.http.ratelimit import HostLimit
 
 
 def test_build_check_config_merges_blacklist():
@@ -44,3 +49,30 @@ def test_build_check_config_preserves_order():
     expected.extend(["b.com", "a.com"])
 
     assert config.blacklist == expected
+
+
+def test_build_check_config_host_limits_inherit_max_connections():
+    config = build_check_config(
+        timeout=10,
+        max_workers=5,
+        delay=0.1,
+        blacklist=(),
+        max_host_connections=3,
+        host_limits=(
+            HostLimitType().convert("github.com=1", None, None),
+            ("example.com", HostLimit(rate=5, max_connections=1)),
+        ),
+    )
+
+    assert config.host_limits == {
+        "github.com": HostLimit(rate=1, max_connections=3),
+        "example.com": HostLimit(rate=5, max_connections=1),
+    }
+
+
+def test_host_limit_type_rejects_invalid_values():
+    with pytest.raises(click.BadParameter):
+        HostLimitType().convert("github.com", None, None)
+
+    with pytest.raises(click.BadParameter):
+        HostLimitType().convert("github.com=fast", None, None)
@@ -0,0 +1,85 @@
+import pytest
+
+from adoc_link_checker.core.antora import (
+    find_components,
+    iter_antora_files,
+    summarize_by_component,
+)
+
+
+def _write(path, content="= Page"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _project(tmp_path):
+    _write(tmp_path / "antora-playbook.yml", (
+        "content:\n"
+        "  sources:\n"
+        "  - url: .\n"
+        "    start_paths: docs, guide\n"
+        "  - url: https://example.com/remote.git\n"
+    ))
+    _write(tmp_path / "docs" / "antora.yml", "name: docs\nversion: '2.0'\n")
+    _write(tmp_path / "docs" / "modules" / "ROOT" / "pages" / "index.adoc")
+    _write(tmp_path / "docs" / "modules" / "ROOT" / "partials" / "p.adoc")
+    _write(tmp_path / "docs" / "modules" / "api" / "examples" / "e.adoc")
+    _write(tmp_path / "docs" / "modules" / "ROOT" / "assets" / "skip.adoc")
+    _write(tmp_path / "docs" / "archive" / "old.adoc")
+    _write(tmp_path / "guide" / "antora.yml", "name: guide\nversion: ~\n")
+    _write(tmp_path / "guide" / "modules" / "ROOT" / "pages" / "g.adoc")
+    _write(tmp_path / "build" / "site" / "out.adoc")
+
+
+def test_find_components_from_playbook(tmp_path):
+    _project(tmp_path)
+
+    components = find_components(str(tmp_path / "antora-playbook.yml"))
+
+    assert [c.key for c in components] == ["docs@2.0", "guide"]
+    assert components[0].root == str(tmp_path / "docs")
+
+
+def test_find_components_from_descriptors(tmp_path):
+    _project(tmp_path)
+    (tmp_path / "antora-playbook.yml").unlink()
+
+    components = find_components(str(tmp_path))
+
+    assert sorted(c.name for c in components) == ["docs", "guide"]
+
+
+def test_only_module_families_are_visited(tmp_path):
+    _project(tmp_path)
+
+    files = list(iter_antora_files(str(tmp_path)))
+
+    assert {f.path for f in files} == {
+        str(tmp_path / "docs/modules/ROOT/pages/index.adoc"),
+        str(tmp_path / "docs/modules/ROOT/partials/p.adoc"),
+        str(tmp_path / "docs/modules/api/examples/e.adoc"),
+        str(tmp_path / "guide/modules/ROOT/pages/g.adoc"),
+    }
+    example = next(f for f in files if f.path.endswith("e.adoc"))
+    assert example.component.key == "docs@2.0"
+    assert (example.module, example.family) == ("api", "examples")
+
+
+def test_component_selection(tmp_path):
+    _project(tmp_path)
+
+    files = list(iter_antora_files(str(tmp_path), ["guide"]))
+    assert [f.component.name for f in files] == ["guide"]
+
+    with pytest.raises(ValueError):
+        list(iter_antora_files(str(tmp_path), ["docs@1.0"]))
+
+
+def test_summarize_by_component():
+    file_components = {"a.adoc": "docs@2.0", "b.adoc": "guide"}
+    broken = {
+        "a.adoc": [("https://x", "URL not accessible")] * 2,
+        "b.adoc": [("https://y", "URL not accessible")],
+    }
+
+    assert summarize_by_component(broken, file_components) == {"docs@2.0": 2, "guide": 1}
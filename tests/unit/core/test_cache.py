@@ -0,0 +1,119 @@
+import sqlite3
+
+from adoc_link_checker.core.cache import ResultCache
+from adoc_link_checker.core.context import LinkCheckContext
+from adoc_link_checker.http.checker import CheckResult
+
+
+def test_cache_persists_results_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+
+    cache = ResultCache(path)
+    cache.put("https://example.com", CheckResult(ok=True, status=200))
+    cache.close()
+
+    cache = ResultCache(path)
+    entry = cache.get("https://example.com")
+    cache.close()
+
+    assert entry.ok is True
+    assert entry.status == 200
+
+
+def test_cache_uses_separate_ttls_for_ok_and_broken(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), ttl_ok=100, ttl_broken=10)
+
+    cache.put("https://ok.com", CheckResult(ok=True, status=200), now=0)
+    cache.put("https://broken.com", CheckResult(ok=False, status=404), now=0)
+
+    assert cache.get("https://ok.com", now=50) is not None
+    assert cache.get("https://broken.com", now=50) is None
+    assert cache.get("https://ok.com", now=150) is None
+
+    assert cache.stats(now=50) == {
+        "total": 2,
+        "ok": 1,
+        "broken": 1,
+        "expired": 1,
+    }
+
+    cache.close()
+
+
+def test_cache_prune_removes_expired_entries(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), ttl_ok=100, ttl_broken=10)
+
+    cache.put("https://ok.com", CheckResult(ok=True, status=200), now=0)
+    cache.put("https://broken.com", CheckResult(ok=False, status=404), now=0)
+
+    assert cache.prune(now=50) == 1
+    assert cache.stats(now=50)["total"] == 1
+
+    cache.close()
+
+
+def test_context_reads_and_writes_persistent_cache(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    cache.put("https://example.com", CheckResult(ok=False, status=404))
+
+    context = LinkCheckContext(timeout=5, blacklist=[], result_cache=cache)
+
+    assert context.get_cached("https://example.com") is False
+
+    context.persist("https://example.org", CheckResult(ok=True, status=200))
+    assert cache.get("https://example.org").ok is True
+
+    cache.close()
+
+
+def test_cache_returns_expired_entries_with_validators(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), ttl_ok=10, ttl_broken=10)
+
+    cache.put(
+        "https://example.com",
+        CheckResult(ok=True, status=200, etag='"v1"', final_url="https://example.com/"),
+        now=0,
+    )
+    cache.put("https://plain.com", CheckResult(ok=True, status=200), now=0)
+
+    assert cache.get_revalidatable("https://example.com", now=5) is None
+
+    entry = cache.get_revalidatable("https://example.com", now=50)
+    assert entry.result.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert entry.final_url == "https://example.com/"
+
+    assert cache.get_revalidatable("https://plain.com", now=50) is None
+
+    cache.close()
+
+
+def test_cache_migrates_schema_v1(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE results (url TEXT PRIMARY KEY, ok INTEGER NOT NULL, "
+        "status INTEGER, checked_at REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO results VALUES ('https://example.com', 1, 200, 0)")
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    cache = ResultCache(path, ttl_ok=100)
+    entry = cache.get("https://example.com", now=1)
+    cache.close()
+
+    assert entry.ok is True
+    assert entry.etag is None
+
+
+def test_cache_persists_learned_host_limits(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResultCache(path)
+    cache.save_host_limits({"github.com": 1.5, "example.com": 6.0})
+    cache.close()
+
+    cache = ResultCache(path)
+    assert cache.load_host_limits() == {"github.com": 1.5, "example.com": 6.0}
+    cache.close()
@@ -0,0 +1,128 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from adoc_link_checker.core.checking import check_urls
+from adoc_link_checker.core.context import LinkCheckContext
+from adoc_link_checker.http.checker import CheckResult
+from adoc_link_checker.http.pool import SessionPool
+from adoc_link_checker.http.retry import RetryPolicy
+
+
+def test_check_urls_returns_result_per_url():
+    context = LinkCheckContext(timeout=5, blacklist=[])
+    urls = ["https://example.com/fine", "https://example.com/broken"]
+
+    with patch(
+        "adoc_link_checker.http.service.probe_url",
+        lambda url, **kwargs: CheckResult(ok="broken" not in url, status=200),
+    ):
+        results = check_urls(urls, context, max_workers=2, sessions=SessionPool())
+
+    assert results == {
+        "https://example.com/fine": True,
+        "https://example.com/broken": False,
+    }
+
+
+def test_check_urls_schedules_retries():
+    context = LinkCheckContext(
+        timeout=5,
+        blacklist=[],
+        retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0.01),
+    )
+    flaky = "https://flaky.test/page"
+    urls = [flaky, "https://example.com/fine"]
+    statuses = {flaky: [503, 200]}
+
+    def fake_probe(url, **kwargs):
+        status = statuses[url].pop(0) if url in statuses else 200
+        return CheckResult(ok=status < 400, status=status)
+
+    with patch("adoc_link_checker.http.service.probe_url", fake_probe):
+        results = check_urls(urls, context, max_workers=1, sessions=SessionPool())
+
+    assert results == {flaky: True, "https://example.com/fine": True}
+    assert context.attempts == {flaky: 2, "https://example.com/fine": 1}
+    assert context.counters["retries"] == 1
+
+
+
+def test_check_urls_stops_when_budget_is_spent():
+    context = LinkCheckContext(timeout=5, blacklist=[])
+    urls = [f"https://example.com/{i}" for i in range(5)]
+    checked = []
+
+    def fake_probe(url, **kwargs):
+        checked.append(url)
+        return CheckResult(ok=True, status=200)
+
+    with patch("adoc_link_checker.http.service.probe_url", fake_probe), patch(
+        "adoc_link_checker.core.checking.budget_spent",
+        lambda stop_at: len(checked) >= 2,
+    ):
+        results = check_urls(
+            urls,
+            context,
+            max_workers=1,
+            sessions=SessionPool(),
+            stop_at=0,
+        )
+
+    # The batch stops mid-way: the URLs left are not in the result
+    assert results == {urls[0]: True, urls[1]: True}
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_port():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.withoutresponses
+@pytest.mark.parametrize("batch_size, connections", [(1, 20), (10, 2)])
+def test_host_batches_reuse_keep_alive_connections(
+    local_port,
+    batch_size,
+    connections,
+):
+    # Two host names for the same server, cited alternately
+    urls = [
+        f"http://{host}:{local_port}/page{i}"
+        for i in range(10)
+        for host in ("127.0.0.1", "localhost")
+    ]
+    # A single host pool per session: switching hosts drops the connection
+    sessions = SessionPool(pool_connections=1)
+
+    results = check_urls(
+        urls,
+        LinkCheckContext(timeout=5, blacklist=[]),
+        max_workers=1,
+        sessions=sessions,
+        batch_size=batch_size,
+    )
+
+    assert all(results.values())
+    stats = sessions.stats()
+    assert stats["requests"] == 20
+    assert stats["connections"] == connections
+    sessions.close()
@@ -0,0 +1,51 @@
+import sqlite3
+
+import pytest
+
+from adoc_link_checker.core.checkpoint import CheckpointEntry, RunCheckpoint
+
+
+def test_checkpoint_saves_at_intervals(tmp_path):
+    path = str(tmp_path / "state.sqlite")
+    state = RunCheckpoint(path, "docs", interval=3600)
+    state.store_file("docs/a.adoc", {"https://a.test"})
+    state.store_result("https://a.test", False, "HTTP 404", 2)
+
+    def saved():
+        with sqlite3.connect(path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    assert saved() == 0
+    state.save()
+    assert saved() == 1
+
+    resumed = RunCheckpoint(path, "docs", resume=True)
+    assert resumed.resumed
+    assert resumed.lookup("docs/a.adoc") == {"https://a.test"}
+    assert resumed.result("https://a.test") == CheckpointEntry(
+        "https://a.test", False, "HTTP 404", 2
+    )
+    assert resumed.result("https://b.test") is None
+    resumed.close()
+    state.close()
+
+
+def test_finished_run_starts_over(tmp_path):
+    path = str(tmp_path / "state.sqlite")
+    state = RunCheckpoint(path, "docs")
+    state.store_result("https://a.test", True, None, 1)
+    state.finish()
+    state.close()
+
+    state = RunCheckpoint(path, "docs", resume=True)
+    assert not state.resumed
+    assert state.urls == 0
+    state.close()
+
+
+def test_resume_rejects_another_root(tmp_path):
+    path = str(tmp_path / "state.sqlite")
+    RunCheckpoint(path, "docs").close()
+
+    with pytest.raises(ValueError, match="was recorded for"):
+        RunCheckpoint(path, "other", resume=True)
@@ -0,0 +1,43 @@
+import pytest
+
+from adoc_link_checker.core.context import LinkCheckContext
+
+
+def test_begin_check_elects_a_single_owner():
+    context = LinkCheckContext(timeout=5, blacklist=[])
+
+    future, owner = context.begin_check("https://example.com")
+    waiter, waiter_owner = context.begin_check("https://example.com")
+
+    assert owner is True
+    assert waiter_owner is False
+    assert waiter is future
+
+    context.finish_check("https://example.com", True)
+
+    assert waiter.result() is True
+    assert context.get_cached("https://example.com") is True
+
+
+def test_begin_check_on_cached_url_returns_result():
+    context = LinkCheckContext(timeout=5, blacklist=[])
+    context.set_cached("https://example.com", False)
+
+    future, owner = context.begin_check("https://example.com")
+
+    assert owner is False
+    assert future.result() is False
+
+
+def test_finish_check_with_error_is_not_cached():
+    context = LinkCheckContext(timeout=5, blacklist=[])
+
+    future, _ = context.begin_check("https://example.com")
+    context.finish_check("https://example.com", error=RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError):
+        future.result()
+
+    assert context.get_cached("https://example.com") is None
+    _, owner = context.begin_check("https://example.com")
+    assert owner is True
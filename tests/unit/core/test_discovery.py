@@ -1,4 +1,4 @@
-from adoc_link_checker.core.discovery import find_adoc_files
+from adoc_link_checker.core.discovery import find_adoc_files, iter_adoc_files
 
 
 def test_find_single_adoc_file(tmp_path):
@@ -18,3 +18,50 @@ def test_find_adoc_files_in_directory(tmp_path):
 
     assert len(files) == 2
     assert all(f.endswith(".adoc") for f in files)
+
+
+def test_iter_adoc_files_is_a_generator(tmp_path):
+    (tmp_path / "a.adoc").write_text("= A")
+
+    files = iter_adoc_files(str(tmp_path))
+
+    assert next(files) == str(tmp_path / "a.adoc")
+    assert next(files, None) is None
+
+
+def test_default_excluded_dirs_are_pruned(tmp_path):
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "readme.adoc").write_text("= X")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "notes.adoc").write_text("= X")
+    (tmp_path / "index.adoc").write_text("= Index")
+
+    assert find_adoc_files(str(tmp_path)) == [str(tmp_path / "index.adoc")]
+
+
+def test_exclude_dirs_globs(tmp_path):
+    for rel in ("build/site/a.adoc", "docs/archive/b.adoc", "docs/c.adoc"):
+        target = tmp_path / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("= X")
+
+    files = find_adoc_files(str(tmp_path), exclude_dirs=["build", "docs/arch*"])
+
+    assert files == [str(tmp_path / "docs" / "c.adoc")]
+
+
+def test_gitignore_rules_are_honoured(tmp_path):
+    (tmp_path / ".gitignore").write_text("build/\n*.draft.adoc\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.adoc").write_text("= X")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / ".gitignore").write_text("!keep.draft.adoc\n")
+    (tmp_path / "docs" / "wip.draft.adoc").write_text("= X")
+    (tmp_path / "docs" / "keep.draft.adoc").write_text("= X")
+    (tmp_path / "docs" / "page.adoc").write_text("= X")
+
+    assert find_adoc_files(str(tmp_path)) == [
+        str(tmp_path / "docs" / "keep.draft.adoc"),
+        str(tmp_path / "docs" / "page.adoc"),
+    ]
+    assert len(find_adoc_files(str(tmp_path), use_ignore_files=False)) == 4
@@ -0,0 +1,58 @@
+import hashlib
+
+from adoc_link_checker.config import EXTRACT_CHUNKS_PER_WORKER
+from adoc_link_checker.core.extraction import extract_file, iter_extractions
+
+
+def test_extract_file_fingerprints_content(tmp_path):
+    adoc_file = tmp_path / "doc.adoc"
+    adoc_file.write_text("https://example.com\n")
+
+    extracted = extract_file(str(adoc_file))
+
+    assert extracted.urls == {"https://example.com"}
+    assert extracted.size == adoc_file.stat().st_size
+    assert extracted.sha256 == hashlib.sha256(adoc_file.read_bytes()).hexdigest()
+
+
+def test_extract_file_unreadable(tmp_path):
+    extracted = extract_file(str(tmp_path / "missing.adoc"))
+
+    assert extracted.urls == frozenset()
+    assert extracted.sha256 is None
+
+
+def test_iter_extractions_on_process_pool(tmp_path):
+    files = []
+    for i in range(5):
+        adoc_file = tmp_path / f"doc{i}.adoc"
+        adoc_file.write_text(f"https://example.com/page{i}\n")
+        files.append(str(adoc_file))
+
+    results = {
+        extracted.path: extracted.urls
+        for extracted in iter_extractions(files, workers=2, chunk_size=2)
+    }
+
+    assert results == {
+        path: {f"https://example.com/page{i}"}
+        for i, path in enumerate(files)
+    }
+
+
+def test_iter_extractions_bounds_chunks_in_flight(tmp_path):
+    adoc_file = tmp_path / "doc.adoc"
+    adoc_file.write_text("https://example.com\n")
+    pulled = []
+
+    def files():
+        for i in range(100):
+            pulled.append(i)
+            yield str(adoc_file)
+
+    extractions = iter_extractions(files(), workers=2, chunk_size=2)
+    next(extractions)
+
+    # 2 workers x EXTRACT_CHUNKS_PER_WORKER chunks x 2 files
+    assert len(pulled) <= 2 * EXTRACT_CHUNKS_PER_WORKER * 2
+    assert len(list(extractions)) == 99
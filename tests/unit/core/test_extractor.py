@@ -1,4 +1,4 @@
-from adoc_link_checker.core.extractor import extract_links
+from adoc_link_checker.core.extractor import extract_links, extract_links_from_text
 
 
 def test_extract_http_links(tmp_path):
@@ -22,3 +22,16 @@ def test_extract_youtube_id(tmp_path):
     links = extract_links(str(file))
 
     assert "https://www.youtube.com/watch?v=dQw4w9WgXcQ" in links
+
+
+def test_extract_links_from_text_deduplicates_matches():
+    content = (
+        "link:https://example.com/page[] and https://example.com/page.\n"
+        "video::dQw4w9WgXcQ[] video::dQw4w9WgXcQ[]\n"
+        "http://" + "a" * 300 + " no top-level domain\n"
+    )
+
+    assert extract_links_from_text(content) == {
+        "https://example.com/page",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    }
@@ -0,0 +1,53 @@
+import os
+
+from adoc_link_checker.core.extraction import extract_file
+from adoc_link_checker.core.incremental import IncrementalExtractor
+
+
+def test_unknown_file_must_be_extracted(tmp_path):
+    extractor = IncrementalExtractor(str(tmp_path / "cache.sqlite"))
+    adoc_file = tmp_path / "doc.adoc"
+    adoc_file.write_text("https://example.com\n")
+
+    assert extractor.lookup(str(adoc_file)) is None
+    extractor.close()
+
+
+def test_unchanged_file_reuses_previous_extraction(tmp_path):
+    index_file = str(tmp_path / "cache.sqlite")
+    adoc_file = tmp_path / "doc.adoc"
+    adoc_file.write_text("https://example.com\n")
+
+    extractor = IncrementalExtractor(index_file)
+    extractor.store(extract_file(str(adoc_file)))
+    extractor.close()
+
+    extractor = IncrementalExtractor(index_file)
+    assert extractor.lookup(str(adoc_file)) == {"https://example.com"}
+    assert extractor.reused == 1
+    extractor.close()
+
+
+def test_touched_file_with_same_content_is_reused(tmp_path):
+    extractor = IncrementalExtractor(str(tmp_path / "cache.sqlite"))
+    adoc_file = tmp_path / "doc.adoc"
+    adoc_file.write_text("https://example.com\n")
+    extractor.store(extract_file(str(adoc_file)))
+
+    stat = os.stat(adoc_file)
+    os.utime(adoc_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert extractor.lookup(str(adoc_file)) == {"https://example.com"}
+    extractor.close()
+
+
+def test_changed_file_must_be_extracted_again(tmp_path):
+    extractor = IncrementalExtractor(str(tmp_path / "cache.sqlite"))
+    adoc_file = tmp_path / "doc.adoc"
+    adoc_file.write_text("https://example.com\n")
+    extractor.store(extract_file(str(adoc_file)))
+
+    adoc_file.write_text("https://example.org/changed\n")
+
+    assert extractor.lookup(str(adoc_file)) is None
+    extractor.close()
@@ -0,0 +1,47 @@
+from adoc_link_checker.core.index import UrlIndex
+
+
+def test_index_deduplicates_urls_across_files():
+    index = UrlIndex()
+    index.add("a.adoc", {"https://example.com", "https://example.org"})
+    index.add("b.adoc", {"https://example.com"})
+
+    assert len(index) == 2
+    assert index.occurrences == 3
+    assert index.files_for("https://example.com") == ["a.adoc", "b.adoc"]
+
+
+def test_index_build_report_fans_results_back_to_files():
+    index = UrlIndex()
+    index.add("a.adoc", {"https://example.com", "https://example.org"})
+    index.add("b.adoc", {"https://example.org"})
+
+    report = index.build_report(
+        {
+            "https://example.com": True,
+            "https://example.org": False,
+        }
+    )
+
+    assert report == {
+        "a.adoc": [("https://example.org", "URL not accessible")],
+        "b.adoc": [("https://example.org", "URL not accessible")],
+    }
+
+
+def test_index_build_report_with_attempts_and_reasons():
+    index = UrlIndex()
+    index.add("a.adoc", {"https://dead.test", "https://example.org"})
+
+    report = index.build_report(
+        {"https://dead.test": False, "https://example.org": False},
+        attempts={"https://example.org": 4},
+        reasons={"https://dead.test": "Host unreachable (circuit open)"},
+    )
+
+    assert report == {
+        "a.adoc": [
+            ("https://dead.test", "Host unreachable (circuit open)", 0),
+            ("https://example.org", "URL not accessible", 4),
+        ],
+    }
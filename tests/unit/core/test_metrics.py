@@ -0,0 +1,60 @@
+from adoc_link_checker.core.metrics import RunMetrics
+from adoc_link_checker.http.checker import CONNECTION_ERROR, CheckResult
+
+
+def test_snapshot_computes_latency_quantiles_and_buckets():
+    metrics = RunMetrics(buckets=[0.1, 1])
+    for i in range(1, 101):
+        metrics.observe_request(
+            "https://example.com/page",
+            CheckResult(ok=True, status=200),
+            latency=i / 100,
+        )
+
+    latency = metrics.snapshot()["latency"]
+
+    assert latency["count"] == 100
+    assert latency["p50"] == 0.5
+    assert latency["p95"] == 0.95
+    assert latency["p99"] == 0.99
+    assert latency["max"] == 1.0
+    assert latency["buckets"] == {"0.1": 10, "1": 100}
+
+
+def test_snapshot_counts_requests_by_host_and_status():
+    metrics = RunMetrics()
+    metrics.observe_request(
+        "https://a.test/1",
+        CheckResult(ok=True, status=200, received=1),
+        latency=0.1,
+        waited=0.5,
+    )
+    metrics.observe_request(
+        "https://b.test/1",
+        CheckResult(ok=False, error=CONNECTION_ERROR),
+        latency=0.2,
+    )
+    metrics.cache_hits, metrics.cache_misses = 3, 1
+
+    snapshot = metrics.snapshot(counters={"retries": 2})
+
+    assert snapshot["requests"] == {
+        "total": 2,
+        "by_host": {"a.test": 1, "b.test": 1},
+        "by_status": {"200": 1, "connection": 1},
+        "bytes_received": 1,
+        "throttle_wait": 0.5,
+    }
+    assert snapshot["cache"] == {"hits": 3, "misses": 1, "hit_ratio": 0.75}
+    assert snapshot["counters"] == {"retries": 2}
+
+
+def test_timed_iteration_accumulates_phase_time():
+    metrics = RunMetrics()
+
+    assert list(metrics.timed("discovery", ["a", "b"])) == ["a", "b"]
+    with metrics.phase("check"):
+        pass
+
+    assert set(metrics.phases) == {"discovery", "check"}
+    assert all(seconds >= 0 for seconds in metrics.phases.values())
@@ -0,0 +1,42 @@
+import threading
+import time
+
+from adoc_link_checker.core.profiling import StageProfiler
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_stage_profiles_calling_and_worker_threads(tmp_path):
+    profiler = StageProfiler(str(tmp_path), interval=0.001)
+
+    with profiler.stage("checking"):
+        worker = threading.Thread(target=_busy, args=(0.1,))
+        worker.start()
+        _busy(0.05)
+        worker.join()
+
+    summary = open(profiler.write_summary(), encoding="utf-8").read()
+
+    assert (tmp_path / "checking.prof").exists()
+    stacks = (tmp_path / "checking.stacks.txt").read_text()
+    assert "test_profiling.py:_busy" in stacks
+    assert "== checking" in summary
+    assert "_busy" in summary
+
+
+def test_stage_snapshots_memory_at_boundaries(tmp_path):
+    profiler = StageProfiler(str(tmp_path), trace_memory=True)
+
+    with profiler.stage("extraction"):
+        data = [bytearray(1024) for _ in range(1000)]
+
+    summary = open(profiler.write_summary(), encoding="utf-8").read()
+
+    assert data
+    assert (tmp_path / "extraction.tracemalloc").exists()
+    assert "Memory grown by the stage" in summary
+    assert "test_profiling.py" in summary
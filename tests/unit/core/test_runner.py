@@ -1,34 +1,407 @@
-from unittest.mock import patch
+import os
+import json
+import socket
+import time
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import call, patch
 
+import pytest
+
+from adoc_link_checker.core.extraction import ExtractedFile
+from adoc_link_checker.core.options import (
+    DiscoveryOptions,
+    ReportOptions,
+    RunOptions,
+)
 from adoc_link_checker.core.runner import run_check
 
 
-@patch("adoc_link_checker.core.runner.write_report")
-@patch("adoc_link_checker.core.runner.find_adoc_files")
-@patch("adoc_link_checker.core.runner.process_file")
-def test_run_check_happy_path(
-    mock_process,
-    mock_find,
-    mock_report,
+def _extracted(urls):
+    return lambda path: ExtractedFile(path=path, urls=frozenset(urls))
+
+
+@pytest.fixture
+def pipeline():
+    """
+    Patch the stages around run_check: file discovery, extraction,
+    URL checking and the JSON report.
+    """
+    with ExitStack() as stack:
+
+        def stub(target):
+            return stack.enter_context(patch(target))
+
+        yield SimpleNamespace(
+            find=stub("adoc_link_checker.core.runner.iter_adoc_files"),
+            extract=stub("adoc_link_checker.core.extraction.extract_file"),
+            check=stub("adoc_link_checker.core.runner.check_urls"),
+            report=stub("adoc_link_checker.core.runner.write_report"),
+        )
+
+
+@pytest.fixture(autouse=True)
+def fake_dns():
+    """
+    Resolve every host to a documentation address, without network.
+    """
+    address = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 0))]
+    with patch(
+        "adoc_link_checker.http.dns.socket.getaddrinfo",
+        return_value=address,
+    ) as mock_getaddrinfo:
+        yield mock_getaddrinfo
+
+
+def test_run_check_happy_path(pipeline, tmp_path):
+    """
+    run_check orchestrates extraction, checking and writes a report.
+    """
+    pipeline.find.return_value = ["file.adoc"]
+    pipeline.extract.side_effect = _extracted({"https://example.com"})
+    pipeline.check.return_value = {"https://example.com": True}
+
+    output = tmp_path / "out.json"
+
+    run_check(
+        root_path="file.adoc",
+        max_workers=1,
+        delay=0,
+        timeout=5,
+        output_file=str(output),
+        blacklist=[],
+        exclude_from=None,
+    )
+
+    pipeline.check.assert_called_once()
+    pipeline.report.assert_called_once_with(str(output), {})
+
+
+def test_run_check_checks_each_url_once(pipeline, tmp_path):
+    """
+    A URL cited by several files is checked once and reported
+    for every file citing it.
+    """
+    url = "https://example.com/broken"
+
+    pipeline.find.return_value = ["a.adoc", "b.adoc"]
+    pipeline.extract.side_effect = _extracted({url})
+    pipeline.check.return_value = {url: False}
+
+    run_check(
+        root_path="docs",
+        max_workers=1,
+        delay=0,
+        timeout=5,
+        output_file=str(tmp_path / "out.json"),
+        blacklist=[],
+        exclude_from=None,
+    )
+
+    assert pipeline.check.call_args.args[0] == [url]
+
+    report = pipeline.report.call_args.args[1]
+    assert report == {
+        "a.adoc": [(url, "URL not accessible", 0)],
+        "b.adoc": [(url, "URL not accessible", 0)],
+    }
+
+
+@patch("adoc_link_checker.core.runner.changed_files")
+def test_run_check_changed_since_limits_files(
+    mock_changed,
+    pipeline,
     tmp_path,
 ):
+    changed = tmp_path / "changed.adoc"
+
+    pipeline.find.return_value = [str(changed), str(tmp_path / "same.adoc")]
+    mock_changed.return_value = {os.path.realpath(changed)}
+    pipeline.extract.side_effect = _extracted(set())
+    pipeline.check.return_value = {}
+
+    run_check(
+        root_path=str(tmp_path),
+        max_workers=1,
+        delay=0,
+        timeout=5,
+        output_file=str(tmp_path / "out.json"),
+        blacklist=[],
+        exclude_from=None,
+        discovery=DiscoveryOptions(changed_since="origin/main"),
+    )
+
+    mock_changed.assert_called_once_with(str(tmp_path), "origin/main")
+    pipeline.extract.assert_called_once_with(str(changed))
+
+
+def test_run_check_filters_excluded_urls_at_extraction(pipeline, tmp_path):
     """
-    run_check orchestrates processing and writes a report.
+    Blacklisted and excluded URLs are never scheduled for checking.
     """
-    mock_find.return_value = ["file.adoc"]
-    mock_process.return_value = []
+    exclude_file = tmp_path / "exclude.txt"
+    exclude_file.write_text("https://example.org/private/*\n")
 
-    output = tmp_path / "out.json"
+    pipeline.find.return_value = ["file.adoc"]
+    pipeline.extract.side_effect = _extracted({
+        "https://example.com",
+        "https://www.blocked.test/a",
+        "https://example.org/private/b",
+    })
+    pipeline.check.return_value = {}
 
     run_check(
         root_path="file.adoc",
         max_workers=1,
         delay=0,
         timeout=5,
+        output_file=str(tmp_path / "out.json"),
+        blacklist=["blocked.test"],
+        exclude_from=str(exclude_file),
+    )
+
+    assert pipeline.check.call_args.args[0] == ["https://example.com"]
+
+
+def test_run_check_fails_unresolvable_hosts_without_checking(
+    pipeline,
+    fake_dns,
+    tmp_path,
+):
+    missing = "https://no-such-host.invalid/page"
+
+    def getaddrinfo(host, *args):
+        if host == "no-such-host.invalid":
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 0))]
+
+    fake_dns.side_effect = getaddrinfo
+    pipeline.find.return_value = ["file.adoc"]
+    pipeline.extract.side_effect = _extracted({missing, "https://example.com"})
+    pipeline.check.return_value = {"https://example.com": True}
+
+    run_check(
+        root_path="file.adoc",
+        max_workers=1,
+        delay=0,
+        timeout=5,
+        output_file=str(tmp_path / "out.json"),
+        blacklist=[],
+        exclude_from=None,
+    )
+
+    assert pipeline.check.call_args.args[0] == ["https://example.com"]
+    assert pipeline.report.call_args.args[1] == {
+        "file.adoc": [(missing, "Host not found (DNS)", 0)],
+    }
+
+
+def test_run_check_writes_run_metrics(pipeline, tmp_path):
+    pipeline.find.return_value = ["file.adoc"]
+    pipeline.extract.side_effect = _extracted({"https://example.com/broken"})
+    pipeline.check.return_value = {"https://example.com/broken": False}
+    stats = tmp_path / "stats.json"
+    prom = tmp_path / "adocx.prom"
+
+    run_check(
+        root_path="file.adoc",
+        max_workers=1,
+        delay=0,
+        timeout=5,
+        output_file=str(tmp_path / "out.json"),
+        blacklist=[],
+        exclude_from=None,
+        report=ReportOptions(
+            stats_json=str(stats),
+            prometheus_textfile=str(prom),
+        ),
+    )
+
+    data = json.loads(stats.read_text())
+    assert set(data["phases"]) == {
+        "discovery",
+        "extraction",
+        "cache",
+        "dns",
+        "check",
+        "report",
+        "total",
+    }
+    assert data["urls"]["broken"] == 1
+    assert data["cache"] == {"hits": 0, "misses": 1, "hit_ratio": 0.0}
+    assert data["dns"]["hosts"] == 1
+    assert 'adocx_urls{kind="unique"} 1' in prom.read_text()
+
+
+def test_run_check_streams_ndjson_report(pipeline, tmp_path):
+    """
+    With the ndjson format, results are written as the engine settles
+    them, then a summary closes the report.
+    """
+    output = tmp_path / "out.ndjson"
+
+    def check(urls, context, max_workers, sessions, batch_size, on_result, stop_at):
+        for url in urls:
+            on_result(url, url.endswith("ok"))
+        return {url: url.endswith("ok") for url in urls}
+
+    pipeline.find.return_value = ["a.adoc", "b.adoc"]
+    pipeline.extract.side_effect = _extracted(
+        {"https://example.com/ok", "https://example.com/broken"}
+    )
+    pipeline.check.side_effect = check
+
+    run_check(
+        root_path="docs",
+        max_workers=1,
+        delay=0,
+        timeout=5,
         output_file=str(output),
         blacklist=[],
         exclude_from=None,
+        report=ReportOptions(report_format="ndjson"),
+    )
+
+    pipeline.report.assert_not_called()
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert records[-1] == {
+        "type": "summary",
+        "files": 2,
+        "urls": 2,
+        "checked": 2,
+        "broken": 1,
+        "unchecked": 0,
+    }
+    broken = next(r for r in records if r["url"] == "https://example.com/broken")
+    assert broken["ok"] is False
+    assert broken["reason"] == "URL not accessible"
+    assert broken["files"] == ["a.adoc", "b.adoc"]
+
+
+def test_run_check_resumes_interrupted_run(pipeline, tmp_path):
+    """
+    A resumed run skips the files and URLs done before the interruption.
+    """
+    state = str(tmp_path / "state.sqlite")
+    urls = {"https://example.com/a", "https://example.com/b"}
+    pipeline.find.return_value = ["file.adoc"]
+    pipeline.extract.side_effect = _extracted(urls)
+
+    def interrupted(
+        urls, context, max_workers, sessions, batch_size, on_result, stop_at
+    ):
+        context.record_attempt("https://example.com/a", 3)
+        context.record_reason("https://example.com/a", "HTTP 404")
+        on_result("https://example.com/a", False)
+        raise KeyboardInterrupt
+
+    pipeline.check.side_effect = interrupted
+    kwargs = dict(
+        root_path=str(tmp_path),
+        max_workers=1,
+        delay=0,
+        timeout=5,
+        output_file=str(tmp_path / "out.json"),
+        blacklist=[],
+        exclude_from=None,
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        run_check(**kwargs, run=RunOptions(checkpoint=state))
+
+    pipeline.extract.reset_mock()
+    pipeline.check.side_effect = None
+    pipeline.check.return_value = {"https://example.com/b": True}
+
+    run_check(**kwargs, run=RunOptions(checkpoint=state, resume=True))
+
+    pipeline.extract.assert_not_called()
+    assert pipeline.check.call_args.args[0] == ["https://example.com/b"]
+    pipeline.report.assert_called_once_with(
+        str(tmp_path / "out.json"),
+        {"file.adoc": [("https://example.com/a", "HTTP 404", 3)]},
+    )
+
+
+def test_run_check_lists_urls_left_by_time_budget(pipeline, tmp_path):
+    """
+    URLs the engine could not check within the budget are listed apart
+    from broken ones.
+    """
+    pipeline.find.return_value = ["file.adoc"]
+    pipeline.extract.side_effect = _extracted(
+        {"https://example.com/a", "https://example.com/b"}
+    )
+    pipeline.check.return_value = {"https://example.com/a": False}
+    unchecked = tmp_path / "unchecked.json"
+
+    run_check(
+        root_path="file.adoc",
+        max_workers=1,
+        delay=0,
+        timeout=5,
+        output_file=str(tmp_path / "out.json"),
+        blacklist=[],
+        exclude_from=None,
+        report=ReportOptions(unchecked_output=str(unchecked)),
+        run=RunOptions(max_duration=60),
+    )
+
+    assert pipeline.check.call_args.args[6] is not None
+    assert pipeline.report.call_args_list == [
+        call(
+            str(tmp_path / "out.json"),
+            {"file.adoc": [("https://example.com/a", "URL not accessible", 0)]},
+        ),
+        call(
+            str(unchecked),
+            {"file.adoc": ["https://example.com/b"]},
+            title="Unchecked URLs",
+        ),
+    ]
+
+
+def test_run_check_rejects_budget_not_above_timeout(tmp_path):
+    with pytest.raises(ValueError, match="greater than timeout"):
+        run_check(
+            root_path=str(tmp_path),
+            max_workers=1,
+            delay=0,
+            timeout=10,
+            output_file=str(tmp_path / "out.json"),
+            blacklist=[],
+            exclude_from=None,
+            run=RunOptions(max_duration=10),
+        )
+
+
+def test_run_check_budget_includes_extraction(pipeline, tmp_path):
+    """
+    The time spent extracting files is taken out of the checks' budget.
+    """
+    def slow_extract(path):
+        time.sleep(0.2)
+        return ExtractedFile(path=path, urls=frozenset({"https://example.com"}))
+
+    left = []
+
+    def check(urls, context, max_workers, sessions, batch_size, on_result, stop_at):
+        left.append(stop_at - time.monotonic())
+        return {"https://example.com": True}
+
+    pipeline.find.return_value = ["file.adoc"]
+    pipeline.extract.side_effect = slow_extract
+    pipeline.check.side_effect = check
+
+    run_check(
+        root_path="file.adoc",
+        max_workers=1,
+        delay=0,
+        timeout=5,
+        output_file=str(tmp_path / "out.json"),
+        blacklist=[],
+        exclude_from=None,
+        run=RunOptions(max_duration=60),
     )
 
-    mock_process.assert_called_once()
-    mock_report.assert_called_once()
+    assert 0 < left[0] <= 60 - 5 - 0.2
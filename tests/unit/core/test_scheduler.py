@@ -0,0 +1,126 @@
+from adoc_link_checker.core.cache import ResultCache
+from adoc_link_checker.core.scheduler import RetryScheduler, prioritize
+from adoc_link_checker.http.checker import CheckResult
+from adoc_link_checker.http.service import Attempt
+
+
+def test_new_urls_are_served_in_order():
+    scheduler = RetryScheduler(["https://a.test/1", "https://b.test/2"])
+
+    assert scheduler.next_batch(now=0) == [("https://a.test/1", 1)]
+    assert scheduler.next_batch(now=0) == [("https://b.test/2", 1)]
+    assert scheduler.next_batch(now=0) == []
+    assert not scheduler
+
+
+def test_failed_attempt_comes_back_when_due():
+    scheduler = RetryScheduler(["https://a.test/1"])
+    [(url, number)] = scheduler.next_batch(now=0)
+
+    complete = scheduler.record(url, Attempt(ok=False, number=number, retry_in=5), now=0)
+
+    assert complete is False
+    assert scheduler.next_batch(now=1) == []
+    assert scheduler.wait_time(now=1) == 4
+    assert scheduler.next_batch(now=5) == [(url, 2)]
+
+
+def test_paused_host_is_deferred_while_others_run():
+    scheduler = RetryScheduler([
+        "https://slow.test/1",
+        "https://slow.test/2",
+        "https://fast.test/3",
+    ])
+    [(url, number)] = scheduler.next_batch(now=0)
+    scheduler.record(
+        url,
+        Attempt(ok=False, number=number, retry_in=10, host_pause=10),
+        now=0,
+    )
+
+    assert scheduler.next_batch(now=1) == [("https://fast.test/3", 1)]
+    assert scheduler.next_batch(now=1) == []
+    assert scheduler.next_batch(now=10) == [("https://slow.test/1", 2)]
+    assert scheduler.next_batch(now=10) == [("https://slow.test/2", 1)]
+
+
+def test_urls_are_batched_by_host_round_robin():
+    scheduler = RetryScheduler(
+        [
+            "https://a.test/1",
+            "https://b.test/1",
+            "https://a.test/2",
+            "https://a.test/3",
+        ],
+        batch_size=2,
+    )
+
+    assert scheduler.next_batch(now=0) == [
+        ("https://a.test/1", 1),
+        ("https://a.test/2", 1),
+    ]
+    assert scheduler.next_batch(now=0) == [("https://b.test/1", 1)]
+    assert scheduler.next_batch(now=0) == [("https://a.test/3", 1)]
+    assert scheduler.next_batch(now=0) == []
+
+
+def test_host_parallelism_caps_batches_in_flight():
+    scheduler = RetryScheduler(
+        ["https://a.test/1", "https://a.test/2", "https://b.test/1"],
+        batch_size=1,
+        host_parallelism=lambda host: 1,
+    )
+
+    first = scheduler.next_batch(now=0)
+    assert first == [("https://a.test/1", 1)]
+    assert scheduler.next_batch(now=0) == [("https://b.test/1", 1)]
+    assert scheduler.next_batch(now=0) == []
+
+    completed = scheduler.record_batch(first, [Attempt(ok=True, number=1)], now=0)
+
+    assert completed == [("https://a.test/1", Attempt(ok=True, number=1))]
+    assert scheduler.next_batch(now=0) == [("https://a.test/2", 1)]
+
+
+def test_batch_stopped_early_requeues_remaining_steps():
+    scheduler = RetryScheduler(
+        ["https://a.test/1", "https://a.test/2", "https://a.test/3"],
+        batch_size=3,
+    )
+    batch = scheduler.next_batch(now=0)
+    throttled = Attempt(ok=False, number=1, retry_in=5, host_pause=5)
+
+    assert scheduler.record_batch(batch, [throttled], now=0) == []
+    assert scheduler.next_batch(now=1) == []
+    assert scheduler.wait_time(now=1) == 4
+    assert scheduler.next_batch(now=5) == [
+        ("https://a.test/1", 2),
+        ("https://a.test/2", 1),
+        ("https://a.test/3", 1),
+    ]
+
+
+def test_prioritize_checks_new_and_broken_urls_first(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    ok = CheckResult(ok=True, status=200)
+    cache.put("https://a.test/stable", ok, now=0)
+    cache.put("https://a.test/stable", ok, now=100)
+    cache.put("https://a.test/recent", CheckResult(ok=False, status=404), now=0)
+    cache.put("https://a.test/recent", ok, now=90)
+    cache.put("https://a.test/broken", CheckResult(ok=False, status=404), now=100)
+
+    urls = [
+        "https://a.test/stable",
+        "https://a.test/recent",
+        "https://a.test/broken",
+        "https://a.test/new",
+    ]
+
+    assert prioritize(urls, cache) == [
+        "https://a.test/new",
+        "https://a.test/broken",
+        "https://a.test/recent",
+        "https://a.test/stable",
+    ]
+    assert prioritize(urls, None) == urls
+    cache.close()
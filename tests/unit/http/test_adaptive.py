@@ -0,0 +1,76 @@
+import time
+
+from adoc_link_checker.http.adaptive import AdaptiveConcurrency
+from adoc_link_checker.http.checker import TIMEOUT_ERROR, CheckResult
+from adoc_link_checker.http.ratelimit import HostLimit, HostRateLimiter
+
+URL = "https://github.com/org/repo"
+OK = CheckResult(ok=True, status=200)
+THROTTLED = CheckResult(ok=False, status=429)
+
+
+def test_window_grows_additively_on_healthy_responses():
+    controller = AdaptiveConcurrency(initial=2, latency_target=1)
+
+    # About +1 per window's worth of responses
+    for _ in range(3):
+        controller.record(URL, OK, started=0, ceiling=8, now=0.1)
+    assert controller.limit("github.com", ceiling=8) == 3
+
+    for _ in range(3):
+        controller.record(URL, OK, started=0, ceiling=8, now=0.1)
+    assert controller.limit("github.com", ceiling=8) == 4
+
+
+def test_slow_responses_hold_the_window():
+    controller = AdaptiveConcurrency(initial=2, latency_target=1)
+
+    for _ in range(10):
+        controller.record(URL, OK, started=0, ceiling=8, now=5)
+
+    assert controller.limits() == {"github.com": 2}
+
+
+def test_window_backs_off_once_per_burst():
+    controller = AdaptiveConcurrency(initial=8, decrease=0.5)
+
+    controller.record(URL, THROTTLED, started=0, ceiling=8, now=1)
+    # Sent before the first decrease: same burst
+    controller.record(URL, THROTTLED, started=0.5, ceiling=8, now=1.2)
+    assert controller.limit("github.com", ceiling=8) == 4
+
+    controller.record(
+        URL,
+        CheckResult(ok=False, error=TIMEOUT_ERROR),
+        started=2,
+        ceiling=8,
+        now=3,
+    )
+    assert controller.limit("github.com", ceiling=8) == 2
+    assert controller.backoffs == 2
+
+
+def test_window_stays_within_one_and_the_ceiling():
+    controller = AdaptiveConcurrency(initial=1, learned={"github.com": 10})
+
+    assert controller.limit("github.com", ceiling=4) == 4
+
+    for now in range(10):
+        controller.record(URL, THROTTLED, started=now, ceiling=4, now=now)
+    assert controller.limit("github.com", ceiling=4) == 1
+
+
+def test_rate_limiter_applies_adaptive_connection_limit():
+    controller = AdaptiveConcurrency(initial=2)
+    limiter = HostRateLimiter(
+        HostLimit(rate=0, max_connections=4),
+        overrides={"slow.test": HostLimit(rate=0, max_connections=1)},
+        adaptive=controller,
+    )
+
+    assert limiter.connection_limit("github.com") == 2
+    assert limiter.connection_limit("slow.test") == 1
+
+    for _ in range(20):
+        limiter.observe(URL, OK, started=time.monotonic())
+    assert limiter.connection_limit("github.com") == 4
@@ -0,0 +1,53 @@
+from adoc_link_checker.http.breaker import CircuitBreaker
+
+URL = "https://wiki.internal.test/page"
+
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(threshold=3, reset_timeout=60)
+
+    for _ in range(2):
+        breaker.record(URL, reachable=False)
+    assert breaker.allow(URL)
+
+    breaker.record(URL, reachable=False)
+
+    assert breaker.is_open(URL)
+    assert not breaker.allow("https://wiki.internal.test/other")
+    assert breaker.allow("https://example.com")
+    assert breaker.tripped_hosts() == ["wiki.internal.test"]
+
+
+def test_any_response_resets_the_failure_count():
+    breaker = CircuitBreaker(threshold=2, reset_timeout=60)
+
+    breaker.record(URL, reachable=False)
+    breaker.record(URL, reachable=True)
+    breaker.record(URL, reachable=False)
+
+    assert not breaker.is_open(URL)
+
+
+def test_half_open_probe():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+    breaker.record(URL, reachable=False)
+
+    assert breaker.allow(URL)
+    assert not breaker.allow(URL)
+
+    breaker.record(URL, reachable=False)
+    assert breaker.allow(URL)
+
+    breaker.record(URL, reachable=True)
+    assert breaker.allow(URL)
+    assert breaker.allow(URL)
+
+
+def test_released_probe_can_be_retried():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+    breaker.record(URL, reachable=False)
+
+    assert breaker.allow(URL)
+    breaker.release(URL)
+
+    assert breaker.allow(URL)
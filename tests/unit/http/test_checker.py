@@ -1,6 +1,21 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
 import responses
+from responses import matchers
+from urllib3.exceptions import LocationParseError
 
-from adoc_link_checker.http.checker import check_url, create_session
+from adoc_link_checker.http.checker import (
+    INVALID_URL,
+    CheckResult,
+    check_url,
+    create_session,
+    probe_url,
+)
+from adoc_link_checker.http.methods import HostMethodCache
+from adoc_link_checker.http.pool import SessionPool
 
 
 @responses.activate
@@ -13,6 +28,42 @@ def test_check_url_head_ok():
     assert check_url(session, url, timeout=5, blacklist=()) is True
 
 
+@pytest.mark.parametrize(
+    "error, unreachable",
+    [
+        (requests.ConnectionError("refused"), True),
+        (requests.ConnectTimeout("connect timed out"), True),
+        (requests.ReadTimeout("read timed out"), False),
+    ],
+)
+@responses.activate
+def test_only_connect_failures_make_a_host_unreachable(error, unreachable):
+    url = "https://example.com"
+
+    responses.add(responses.HEAD, url, body=error)
+    responses.add(responses.GET, url, body=error)
+
+    result = probe_url(create_session(), url, timeout=5)
+
+    assert result.ok is False
+    assert result.unreachable is unreachable
+
+
+@responses.activate
+def test_unparsable_host_is_reported_invalid():
+    url = "https://docs..example.com/page"
+    error = LocationParseError("docs..example.com")
+
+    responses.add(responses.HEAD, url, body=error)
+    responses.add(responses.GET, url, body=error)
+
+    result = probe_url(create_session(), url, timeout=5)
+
+    assert result.ok is False
+    assert result.error == INVALID_URL
+    assert result.unreachable is False
+
+
 @responses.activate
 def test_check_url_head_fails_get_ok():
     url = "https://example.com"
@@ -33,3 +84,191 @@ def test_check_url_get_fails():
 
     session = create_session()
     assert check_url(session, url, timeout=5, blacklist=()) is False
+
+
+@responses.activate
+def test_probe_url_records_validators():
+    url = "https://example.com"
+
+    responses.add(
+        responses.HEAD,
+        url,
+        status=200,
+        headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+    )
+
+    result = probe_url(create_session(), url, timeout=5)
+
+    assert result.ok is True
+    assert result.etag == '"v1"'
+    assert result.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert result.revalidated is False
+
+
+@responses.activate
+def test_probe_url_revalidates_with_conditional_request():
+    url = "https://example.com"
+    target = "https://www.example.com/"
+
+    responses.add(
+        responses.HEAD,
+        target,
+        status=304,
+        match=[matchers.header_matcher({"If-None-Match": '"v1"'})],
+    )
+
+    previous = CheckResult(ok=True, status=200, etag='"v1"', final_url=target)
+    result = probe_url(create_session(), url, timeout=5, previous=previous)
+
+    assert result.ok is True
+    assert result.status == 304
+    assert result.revalidated is True
+    assert result.etag == '"v1"'
+    assert result.final_url == target
+
+
+@responses.activate
+def test_get_fallback_requests_a_single_byte():
+    url = "https://example.com/file.zip"
+
+    responses.add(responses.HEAD, url, status=405)
+    responses.add(
+        responses.GET,
+        url,
+        status=206,
+        body=b"x",
+        match=[matchers.header_matcher({"Range": "bytes=0-0"})],
+    )
+
+    result = probe_url(create_session(), url, timeout=5)
+
+    assert result.ok is True
+    assert result.status == 206
+
+
+@responses.activate
+def test_empty_resource_range_not_satisfiable_is_ok():
+    url = "https://example.com/empty"
+
+    responses.add(responses.HEAD, url, status=405)
+    responses.add(responses.GET, url, status=416)
+
+    assert probe_url(create_session(), url, timeout=5).ok is True
+
+
+@responses.activate
+def test_hosts_rejecting_head_are_learned():
+    first = "https://cdn.example.com/a"
+    second = "https://cdn.example.com/b"
+
+    responses.add(responses.HEAD, first, status=405)
+    responses.add(responses.GET, first, status=200)
+    responses.add(responses.GET, second, status=200)
+
+    methods = HostMethodCache()
+    session = create_session()
+
+    assert probe_url(session, first, timeout=5, methods=methods).ok is True
+    assert methods.skip_head(second) is True
+    assert probe_url(session, second, timeout=5, methods=methods).ok is True
+
+    assert [call.request.method for call in responses.calls] == [
+        "HEAD",
+        "GET",
+        "GET",
+    ]
+
+
+@responses.activate
+def test_head_failure_with_broken_get_is_not_learned():
+    url = "https://example.com/missing"
+
+    responses.add(responses.HEAD, url, status=405)
+    responses.add(responses.GET, url, status=404)
+
+    methods = HostMethodCache()
+    assert probe_url(create_session(), url, timeout=5, methods=methods).ok is False
+    assert methods.skip_head(url) is False
+
+
+@responses.activate
+def test_forbidden_head_falls_back_per_url_only():
+    first = "https://wiki.example.com/private"
+    second = "https://wiki.example.com/public"
+
+    responses.add(responses.HEAD, first, status=403)
+    responses.add(responses.GET, first, status=200)
+    responses.add(responses.HEAD, second, status=200)
+
+    methods = HostMethodCache()
+    session = create_session()
+
+    assert probe_url(session, first, timeout=5, methods=methods).ok is True
+    assert methods.skip_head(second) is False
+    assert probe_url(session, second, timeout=5, methods=methods).ok is True
+
+    assert [call.request.method for call in responses.calls] == [
+        "HEAD",
+        "GET",
+        "HEAD",
+    ]
+
+
+class _NoHeadHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.send_response(405)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        body = b"x" if self.headers.get("Range") == "bytes=0-0" else b"x" * 4096
+        self.send_response(206 if len(body) == 1 else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.withoutresponses
+def test_get_fallback_releases_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _NoHeadHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    pool = SessionPool()
+    methods = HostMethodCache()
+    try:
+        for path in ("/a", "/b", "/c"):
+            result = probe_url(pool.get(), base + path, timeout=5, methods=methods)
+            assert result.ok is True
+
+        stats = pool.stats()
+        assert stats["requests"] == 4
+        assert stats["connections"] == 1
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+
+@responses.activate
+def test_rate_limited_head_is_not_retried_with_get():
+    url = "https://example.com/limited"
+
+    responses.add(
+        responses.HEAD,
+        url,
+        status=429,
+        headers={"Retry-After": "12"},
+    )
+
+    result = probe_url(create_session(), url, timeout=5)
+
+    assert result.ok is False
+    assert result.status == 429
+    assert result.retry_after == 12
+    assert len(responses.calls) == 1
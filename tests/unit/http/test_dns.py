@@ -0,0 +1,159 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from adoc_link_checker.http.dns import DnsCache
+from adoc_link_checker.http.pool import SessionPool
+
+GETADDRINFO = "adoc_link_checker.http.dns.socket.getaddrinfo"
+
+
+def _addresses(*ips):
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, 0)) for ip in ips]
+
+
+def test_dns_cache_resolves_each_host_once():
+    cache = DnsCache()
+
+    with patch(GETADDRINFO, return_value=_addresses("192.0.2.1", "192.0.2.1")) as lookup:
+        assert cache.resolve("Example.COM") == ["192.0.2.1"]
+        assert cache.resolve("example.com.") == ["192.0.2.1"]
+
+    assert lookup.call_count == 1
+    assert cache.stats()["lookups"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_dns_cache_remembers_missing_hosts():
+    cache = DnsCache()
+    error = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    with patch(GETADDRINFO, side_effect=error) as lookup:
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                cache.resolve("missing.invalid")
+
+    assert lookup.call_count == 1
+    assert cache.not_found("missing.invalid")
+    assert cache.stats()["not_found"] == 1
+
+
+def test_dns_cache_treats_malformed_hosts_as_missing():
+    cache = DnsCache()
+    error = UnicodeError("label empty or too long")
+
+    with patch(GETADDRINFO, side_effect=error) as lookup:
+        cache.prefetch(["docs..example.com"])
+        with pytest.raises(socket.gaierror):
+            cache.resolve("docs..example.com")
+
+    assert lookup.call_count == 1
+    assert cache.not_found("docs..example.com")
+
+
+def test_dns_cache_does_not_remember_transient_failures():
+    cache = DnsCache()
+    error = socket.gaierror(socket.EAI_AGAIN, "Temporary failure")
+
+    with patch(GETADDRINFO, side_effect=[error, _addresses("192.0.2.7")]):
+        with pytest.raises(socket.gaierror):
+            cache.resolve("flaky.test")
+        assert cache.resolve("flaky.test") == ["192.0.2.7"]
+
+    assert not cache.not_found("flaky.test")
+
+
+def test_dns_cache_prefetch_resolves_hosts_concurrently():
+    cache = DnsCache()
+
+    def getaddrinfo(host, *args):
+        if host == "missing.invalid":
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return _addresses("192.0.2.1")
+
+    with patch(GETADDRINFO, side_effect=getaddrinfo):
+        cache.prefetch(["a.test", "b.test", "a.test", "missing.invalid"], workers=4)
+
+    stats = cache.stats()
+    assert stats["hosts"] == 3
+    assert stats["not_found"] == 1
+    assert stats["lookups"] == 3
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_port():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.withoutresponses
+def test_sessions_connect_through_the_dns_cache(local_port):
+    cache = DnsCache()
+    pool = SessionPool(dns_cache=cache)
+    url = f"http://docs.dns.test:{local_port}/page"
+
+    lookups = []
+    getaddrinfo = socket.getaddrinfo
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        lookups.append(host)
+        if host == "docs.dns.test":
+            host = "127.0.0.1"
+        return getaddrinfo(host, port, *args, **kwargs)
+
+    with patch(GETADDRINFO, side_effect=fake_getaddrinfo):
+        assert pool.get().head(url, timeout=5).status_code == 200
+
+    assert "docs.dns.test" in lookups
+    assert cache.stats()["hosts"] == 1
+
+    pool.close()
+
+
+@pytest.mark.withoutresponses
+def test_sessions_fail_fast_on_missing_hosts():
+    cache = DnsCache()
+    error = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+    pool = SessionPool(dns_cache=cache)
+
+    with patch(GETADDRINFO, side_effect=error):
+        cache.prefetch(["missing.invalid"])
+
+    with patch(GETADDRINFO) as lookup:
+        with pytest.raises(requests.ConnectionError):
+            pool.get().head("http://missing.invalid/page", timeout=5)
+
+    lookup.assert_not_called()
+    pool.close()
+
+
+@pytest.mark.withoutresponses
+def test_sessions_fail_on_hosts_without_address():
+    cache = DnsCache()
+    pool = SessionPool(dns_cache=cache)
+
+    with patch(GETADDRINFO, return_value=[]):
+        with pytest.raises(requests.ConnectionError, match="resolve"):
+            pool.get().head("http://empty.dns.test/page", timeout=5)
+
+    pool.close()
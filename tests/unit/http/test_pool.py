@@ -0,0 +1,61 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from adoc_link_checker.http.pool import SessionPool
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_pool_reuses_one_session_per_thread():
+    pool = SessionPool()
+
+    main_session = pool.get()
+    assert pool.get() is main_session
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.get()))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not main_session
+    assert pool.stats()["sessions"] == 2
+
+    pool.close()
+
+
+@pytest.mark.withoutresponses
+def test_session_pool_counts_keep_alive_reuse(local_server):
+    pool = SessionPool()
+    session = pool.get()
+
+    for path in ("/a", "/b", "/c"):
+        assert session.head(local_server + path, timeout=5).status_code == 200
+
+    stats = pool.stats()
+    assert stats["requests"] == 3
+    assert stats["connections"] == 1
+    assert stats["reused"] == 2
+
+    pool.close()
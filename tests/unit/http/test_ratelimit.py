@@ -0,0 +1,87 @@
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
+from adoc_link_checker.core.context import LinkCheckContext
+from adoc_link_checker.http.checker import CheckResult
+from adoc_link_checker.http.ratelimit import HostLimit, HostRateLimiter
+from adoc_link_checker.http.service import LinkChecker
+
+
+def test_limit_for_matches_domain_and_subdomains():
+    default = HostLimit(rate=2, max_connections=4)
+    github = HostLimit(rate=1, max_connections=1)
+    limiter = HostRateLimiter(default, {"github.com": github})
+
+    assert limiter.limit_for("github.com") == github
+    assert limiter.limit_for("api.github.com") == github
+    assert limiter.limit_for("notgithub.com") == default
+
+
+def test_acquire_spaces_requests_to_the_same_host_only():
+    limiter = HostRateLimiter(HostLimit(rate=2, max_connections=0))
+
+    with patch("adoc_link_checker.http.ratelimit.time.sleep") as sleep:
+        for url in (
+            "https://a.com/1",
+            "https://a.com/2",
+            "https://b.com/1",
+        ):
+            with limiter.acquire(url):
+                pass
+
+    # Only the second request to a.com has to wait (~0.5s)
+    assert sleep.call_count == 1
+    assert 0.4 < sleep.call_args.args[0] <= 0.5
+
+
+def test_acquire_caps_concurrent_connections_per_host():
+    limiter = HostRateLimiter(HostLimit(rate=0, max_connections=1))
+
+    inside = threading.Event()
+    release = threading.Event()
+    entered = []
+
+    def hold():
+        with limiter.acquire("https://a.com/1"):
+            inside.set()
+            release.wait(timeout=5)
+
+    def try_enter():
+        with limiter.acquire("https://a.com/2"):
+            entered.append(True)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    inside.wait(timeout=5)
+
+    waiter = threading.Thread(target=try_enter)
+    waiter.start()
+    waiter.join(timeout=0.1)
+    assert entered == []
+
+    release.set()
+    holder.join(timeout=5)
+    waiter.join(timeout=5)
+    assert entered == [True]
+
+
+def test_linkchecker_does_not_throttle_cache_hits_or_blacklist():
+    limiter = MagicMock()
+    context = LinkCheckContext(
+        timeout=5,
+        blacklist=["ignored.com"],
+        rate_limiter=limiter,
+    )
+    context.set_cached("https://example.com", True)
+
+    checker = LinkChecker(session=Mock(), context=context)
+
+    with patch(
+        "adoc_link_checker.http.service.probe_url",
+        return_value=CheckResult(ok=True, status=200),
+    ):
+        assert checker.check("https://example.com") is True
+        assert checker.check("https://ignored.com/page") is True
+        assert checker.check("https://other.com") is True
+
+    limiter.acquire.assert_called_once_with("https://other.com")
@@ -0,0 +1,36 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from adoc_link_checker.http.retry import RetryPolicy, parse_retry_after
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(max_attempts=3, backoff_factor=1, statuses=frozenset([503]))
+
+    assert policy.delay(False, 503, attempt=1) == 1
+    assert policy.delay(False, 503, attempt=2) == 2
+    assert policy.delay(False, 503, attempt=3) is None
+
+
+def test_retry_policy_only_retries_transient_failures():
+    policy = RetryPolicy(max_attempts=3, statuses=frozenset([503]))
+
+    assert policy.delay(True, 200, attempt=1) is None
+    assert policy.delay(False, 404, attempt=1) is None
+    assert policy.delay(False, None, attempt=1) is not None
+
+
+def test_retry_after_wins_and_is_capped():
+    policy = RetryPolicy(max_attempts=2, statuses=frozenset([429]), max_delay=30)
+
+    assert policy.delay(False, 429, attempt=1, retry_after=5) == 5
+    assert policy.delay(False, 429, attempt=1, retry_after=3600) == 30
+
+
+def test_parse_retry_after():
+    later = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+    assert parse_retry_after("7") == 7
+    assert 100 < parse_retry_after(format_datetime(later, usegmt=True)) <= 120
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -1,6 +1,20 @@
+import threading
 from unittest.mock import Mock, patch
 
-from adoc_link_checker.http.service import LinkChecker
+import pytest
+
+from adoc_link_checker.http.breaker import CircuitBreaker
+from adoc_link_checker.http.checker import (
+    CONNECTION_ERROR,
+    INVALID_URL,
+    CheckResult,
+)
+from adoc_link_checker.http.retry import RetryPolicy
+from adoc_link_checker.http.service import (
+    HOST_UNREACHABLE,
+    MALFORMED_URL,
+    LinkChecker,
+)
 from adoc_link_checker.core.context import LinkCheckContext
 
 
@@ -18,9 +32,9 @@ def test_linkchecker_uses_cache():
 
     # --- Patch the low-level HTTP check ---
     with patch(
-        "adoc_link_checker.http.service.check_url",
-        return_value=True,
-    ) as mock_check_url:
+        "adoc_link_checker.http.service.probe_url",
+        return_value=CheckResult(ok=True, status=200),
+    ) as mock_probe_url:
 
         # --- First call: real check ---
         result1 = checker.check(url)
@@ -32,10 +46,142 @@ def test_linkchecker_uses_cache():
     assert result1 is True
     assert result2 is True
 
-    # check_url must be called only once
-    mock_check_url.assert_called_once_with(
+    # probe_url must be called only once
+    mock_probe_url.assert_called_once_with(
         session=session,
         url=url,
         timeout=context.timeout,
-        blacklist=tuple(context.blacklist),
+        previous=None,
+        methods=context.methods,
     )
+
+
+def test_linkchecker_coalesces_concurrent_checks():
+    """
+    Concurrent checks of the same uncached URL must trigger
+    a single HTTP check; other callers wait for its result.
+    """
+    context = LinkCheckContext(timeout=5, blacklist=[])
+    url = "https://example.com"
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_probe_url(**kwargs):
+        started.set()
+        release.wait(timeout=5)
+        return CheckResult(ok=False)
+
+    results = []
+
+    def worker():
+        checker = LinkChecker(session=Mock(), context=context)
+        results.append(checker.check(url))
+
+    with patch(
+        "adoc_link_checker.http.service.probe_url",
+        side_effect=slow_probe_url,
+    ) as mock_probe_url:
+        first = threading.Thread(target=worker)
+        first.start()
+        started.wait(timeout=5)
+
+        others = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in others:
+            thread.start()
+
+        release.set()
+        for thread in [first, *others]:
+            thread.join(timeout=5)
+
+    assert results == [False] * 4
+    mock_probe_url.assert_called_once()
+
+
+def test_linkchecker_counts_revalidations():
+    context = LinkCheckContext(timeout=5, blacklist=[])
+    checker = LinkChecker(session=Mock(), context=context)
+
+    with patch(
+        "adoc_link_checker.http.service.probe_url",
+        return_value=CheckResult(ok=True, status=304, revalidated=True),
+    ):
+        assert checker.check("https://example.com") is True
+
+    assert context.counters == {"revalidated": 1}
+
+
+def test_linkchecker_check_retries_transient_failures():
+    context = LinkCheckContext(
+        timeout=5,
+        blacklist=[],
+        retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0),
+    )
+    checker = LinkChecker(session=Mock(), context=context)
+
+    with patch(
+        "adoc_link_checker.http.service.probe_url",
+        side_effect=[
+            CheckResult(ok=False, status=503),
+            CheckResult(ok=True, status=200),
+        ],
+    ):
+        assert checker.check("https://example.com") is True
+
+    assert context.attempts == {"https://example.com": 2}
+
+
+def test_linkchecker_fails_fast_on_open_circuit():
+    context = LinkCheckContext(
+        timeout=5,
+        blacklist=[],
+        breaker=CircuitBreaker(threshold=1, reset_timeout=60),
+    )
+    checker = LinkChecker(session=Mock(), context=context)
+
+    with patch(
+        "adoc_link_checker.http.service.probe_url",
+        return_value=CheckResult(ok=False, error=CONNECTION_ERROR),
+    ) as mock_probe_url:
+        assert checker.check("https://dead.test/a") is False
+        assert checker.check("https://dead.test/b") is False
+
+    mock_probe_url.assert_called_once()
+    assert context.reasons == {"https://dead.test/b": HOST_UNREACHABLE}
+    assert context.counters == {"circuit_open": 1}
+
+
+def test_linkchecker_releases_the_probe_when_it_raises():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+    breaker.record("https://dead.test/a", reachable=False)
+    context = LinkCheckContext(timeout=5, blacklist=[], breaker=breaker)
+    checker = LinkChecker(session=Mock(), context=context)
+
+    with patch(
+        "adoc_link_checker.http.service.probe_url",
+        side_effect=RuntimeError("boom"),
+    ):
+        with pytest.raises(RuntimeError):
+            checker.check("https://dead.test/a")
+
+    assert not breaker.is_open("https://dead.test/b")
+    assert breaker.allow("https://dead.test/b")
+
+
+def test_linkchecker_does_not_retry_invalid_urls():
+    context = LinkCheckContext(
+        timeout=5,
+        blacklist=[],
+        retry_policy=RetryPolicy(max_attempts=4),
+    )
+    checker = LinkChecker(session=Mock(), context=context)
+    url = "https://docs..example.com/page"
+
+    with patch(
+        "adoc_link_checker.http.service.probe_url",
+        return_value=CheckResult(ok=False, error=INVALID_URL),
+    ) as mock_probe_url:
+        assert checker.check(url) is False
+
+    mock_probe_url.assert_called_once()
+    assert context.reasons == {url: MALFORMED_URL}
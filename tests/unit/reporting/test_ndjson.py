@@ -0,0 +1,66 @@
+import json
+
+from adoc_link_checker.reporting.ndjson import (
+    NdjsonReportWriter,
+    merge_results,
+    read_records,
+    to_json_report,
+)
+
+
+def _write(path, records):
+    with NdjsonReportWriter(str(path)) as writer:
+        for record in records:
+            writer.write_result(**record)
+
+
+def test_writer_flushes_every_n_records(tmp_path):
+    output = tmp_path / "report.ndjson"
+    writer = NdjsonReportWriter(str(output), flush_every=2, flush_interval=60)
+
+    writer.write_result("https://a.test", True, None, 1, ["a.adoc"])
+    assert output.read_text() == ""
+
+    writer.write_result("https://b.test", False, "HTTP 404", 1, ["a.adoc"])
+    lines = output.read_text().splitlines()
+    assert [json.loads(line)["url"] for line in lines] == [
+        "https://a.test",
+        "https://b.test",
+    ]
+
+    writer.write_summary(urls=2, broken=1)
+    writer.close()
+    assert json.loads(output.read_text().splitlines()[-1]) == {
+        "type": "summary",
+        "urls": 2,
+        "broken": 1,
+    }
+
+
+def test_read_records_skips_truncated_line(tmp_path):
+    report = tmp_path / "report.ndjson"
+    report.write_text('{"type": "url", "url": "https://a.test"}\n{"type": "u')
+
+    assert [r["url"] for r in read_records(str(report))] == ["https://a.test"]
+
+
+def test_merge_last_result_wins_and_converts_to_json(tmp_path):
+    first = tmp_path / "first.ndjson"
+    second = tmp_path / "second.ndjson"
+    _write(first, [
+        dict(url="https://a.test", ok=False, reason="Timeout", attempts=4,
+             files=["b.adoc", "a.adoc"]),
+        dict(url="https://b.test", ok=False, reason="HTTP 404", attempts=1,
+             files=["a.adoc"]),
+    ])
+    _write(second, [
+        dict(url="https://a.test", ok=True, reason=None, attempts=1,
+             files=["b.adoc", "a.adoc"]),
+    ])
+
+    merged = merge_results([str(first), str(second)])
+
+    assert merged["https://a.test"]["ok"] is True
+    assert to_json_report(merged.values()) == {
+        "a.adoc": [("https://b.test", "HTTP 404", 1)],
+    }
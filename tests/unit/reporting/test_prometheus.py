@@ -0,0 +1,52 @@
+import json
+
+from adoc_link_checker.core.metrics import RunMetrics
+from adoc_link_checker.http.checker import CheckResult
+from adoc_link_checker.reporting.metrics import (
+    format_prometheus,
+    write_prometheus_textfile,
+    write_stats_json,
+)
+
+
+def _snapshot():
+    metrics = RunMetrics(buckets=[0.5])
+    metrics.add_phase("check", 1.5)
+    metrics.observe_request(
+        "https://example.com/page",
+        CheckResult(ok=False, status=404),
+        latency=0.25,
+    )
+    return metrics.snapshot(urls={"unique": 1, "broken": 1})
+
+
+def test_write_stats_json(tmp_path):
+    output = tmp_path / "stats.json"
+
+    write_stats_json(str(output), _snapshot())
+
+    data = json.loads(output.read_text())
+    assert data["phases"] == {"check": 1.5}
+    assert data["urls"]["broken"] == 1
+
+
+def test_format_prometheus_exposes_histogram_and_labels():
+    text = format_prometheus(_snapshot())
+
+    assert "# TYPE adocx_request_duration_seconds histogram" in text
+    assert 'adocx_request_duration_seconds_bucket{le="0.5"} 1' in text
+    assert 'adocx_request_duration_seconds_bucket{le="+Inf"} 1' in text
+    assert 'adocx_phase_duration_seconds{phase="check"} 1.5' in text
+    assert 'adocx_requests_total{host="example.com"} 1' in text
+    assert 'adocx_responses_total{status="404"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_write_prometheus_textfile_replaces_file(tmp_path):
+    output = tmp_path / "adocx.prom"
+    output.write_text("stale")
+
+    write_prometheus_textfile(str(output), _snapshot())
+
+    assert output.read_text().startswith("# HELP adocx_phase_duration_seconds")
+    assert [p.name for p in tmp_path.iterdir()] == ["adocx.prom"]
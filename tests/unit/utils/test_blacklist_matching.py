@@ -1,3 +1,6 @@
+from unittest.mock import patch
+
+from adoc_link_checker.utils.domains import DomainMatcher
 from adoc_link_checker.utils.url import is_blacklisted
 
 
@@ -13,3 +16,16 @@ def test_blacklist_false_positive_substring():
     url = "https://notexample.com/path"
 
     assert is_blacklisted(url, blacklist) is False
+
+
+def test_blacklist_matcher_is_compiled_once():
+    blacklist = ["once.example.org"]
+
+    with patch(
+        "adoc_link_checker.utils.url.DomainMatcher",
+        wraps=DomainMatcher,
+    ) as matcher:
+        assert is_blacklisted("https://a.once.example.org/x", blacklist)
+        assert not is_blacklisted("https://other.test/y", blacklist)
+
+    matcher.assert_called_once_with(("once.example.org",))
@@ -1,4 +1,4 @@
-from adoc_link_checker.utils.exclusions import load_excluded_urls
+from adoc_link_checker.utils.exclusions import load_excluded_urls, load_url_matcher
 from adoc_link_checker.core.extractor import extract_links
 from adoc_link_checker.core.processing import process_file
 from adoc_link_checker.core.context import LinkCheckContext
@@ -40,3 +40,21 @@ def test_excluded_url_with_trailing_slash_not_normalized(tmp_path):
     # ❌ Fails today: link is NOT excluded
     # ✅ Should be empty after normalization fix
     assert broken_links == []
+
+
+def test_load_url_matcher_with_rules_and_blacklist(tmp_path):
+    exclude_file = tmp_path / "exclude.txt"
+    exclude_file.write_text(
+        "# comment\n"
+        "https://example.com/\n"
+        "https://example.org/private/*\n"
+        "re:\\.internal/\n"
+    )
+
+    matcher = load_url_matcher(str(exclude_file), blacklist=["blocked.test"])
+
+    assert matcher.match("https://example.com")
+    assert matcher.match("https://example.org/private/a")
+    assert matcher.match("https://wiki.internal/page")
+    assert matcher.match("https://www.blocked.test/x")
+    assert not matcher.match("https://example.org/public")
@@ -0,0 +1,56 @@
+import subprocess
+
+import pytest
+
+from adoc_link_checker.utils.git import changed_files
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_changed_files_since_ref(tmp_path):
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "old.adoc").write_text("= Old")
+    (tmp_path / "edited.adoc").write_text("= Edited")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "init")
+
+    (tmp_path / "edited.adoc").write_text("= Edited again")
+    (tmp_path / "new.adoc").write_text("= New")
+
+    changed = changed_files(str(tmp_path), "HEAD")
+
+    assert changed == {
+        str((tmp_path / "edited.adoc").resolve()),
+        str((tmp_path / "new.adoc").resolve()),
+    }
+
+
+def test_changed_files_unknown_ref(tmp_path):
+    _git(tmp_path, "init", "-q")
+
+    with pytest.raises(ValueError):
+        changed_files(str(tmp_path), "does-not-exist")
+
+
+def test_changed_files_with_unusual_names(tmp_path):
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "café.adoc").write_text("= Café")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "init")
+
+    (tmp_path / "café.adoc").write_text("= Café again")
+    (tmp_path / "new\tpage.adoc").write_text("= New")
+
+    changed = changed_files(str(tmp_path), "HEAD")
+
+    assert changed == {
+        str((tmp_path / "café.adoc").resolve()),
+        str((tmp_path / "new\tpage.adoc").resolve()),
+    }
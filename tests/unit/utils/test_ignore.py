@@ -0,0 +1,39 @@
+from adoc_link_checker.utils.ignore import IgnoreRules
+
+
+def test_unanchored_pattern_matches_at_any_depth():
+    rules = IgnoreRules(["*.tmp.adoc"])
+
+    assert rules.match("a.tmp.adoc", False) is True
+    assert rules.match("docs/b.tmp.adoc", False) is True
+    assert rules.match("docs/b.adoc", False) is None
+
+
+def test_anchored_pattern_matches_from_base():
+    rules = IgnoreRules(["/build", "docs/*/archive"])
+
+    assert rules.match("build", True) is True
+    assert rules.match("docs/build", True) is None
+    assert rules.match("docs/v1/archive", True) is True
+    assert rules.match("docs/v1/x/archive", True) is None
+
+
+def test_double_star_and_directory_only():
+    rules = IgnoreRules(["**/generated/", "out/**"])
+
+    assert rules.match("a/b/generated", True) is True
+    assert rules.match("a/b/generated", False) is None
+    assert rules.match("out/x/y.adoc", False) is True
+
+
+def test_negation_last_rule_wins():
+    rules = IgnoreRules(["# comment", "", "*.adoc", "!keep.adoc"])
+
+    assert rules.match("drop.adoc", False) is True
+    assert rules.match("keep.adoc", False) is False
+
+
+def test_from_missing_file_is_empty(tmp_path):
+    rules = IgnoreRules.from_file(str(tmp_path / "missing"))
+
+    assert not rules
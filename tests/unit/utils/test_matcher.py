@@ -0,0 +1,53 @@
+from adoc_link_checker.utils.matcher import DomainMatcher, UrlMatcher
+
+
+def test_domain_matcher_matches_subdomains_only():
+    matcher = DomainMatcher(["Example.com", "docs.other.org"])
+
+    assert matcher.match("https://example.com/a")
+    assert matcher.match("https://api.EXAMPLE.com:8443/a")
+    assert matcher.match("https://docs.other.org")
+    assert not matcher.match("https://other.org")
+    assert not matcher.match("https://notexample.com")
+
+
+def test_exact_rules_are_normalized():
+    matcher = UrlMatcher(["https://example.com/page/"])
+
+    assert "https://example.com/page" in matcher
+    assert "https://example.com/page/other" not in matcher
+
+
+def test_prefix_rules():
+    matcher = UrlMatcher(["https://example.com/docs/*", "http://old.test*"])
+
+    assert matcher.match("https://example.com/docs/a/b")
+    assert matcher.match("http://old.test.example")
+    assert not matcher.match("https://example.com/doc")
+
+
+def test_glob_and_regex_rules():
+    matcher = UrlMatcher([
+        "https://*.example.com/*.pdf",
+        r"re:/v\d+/archive/",
+    ])
+
+    assert matcher.match("https://cdn.example.com/files/a.pdf")
+    assert not matcher.match("https://cdn.example.com/files/a.html")
+    assert matcher.match("https://site.test/v12/archive/page")
+    assert not matcher.match("https://site.test/vX/archive/page")
+
+
+def test_domain_rules_and_blacklist():
+    matcher = UrlMatcher(["domain:internal.test"], domains=["blocked.test"])
+
+    assert matcher.match("https://wiki.internal.test/x")
+    assert matcher.match("https://blocked.test")
+    assert not matcher.match("https://example.com")
+
+
+def test_comments_and_invalid_regex_are_ignored():
+    matcher = UrlMatcher(["# comment", "", "re:(unclosed"])
+
+    assert not matcher
+    assert not matcher.match("https://example.com")